@@ -0,0 +1,44 @@
+"""add_form_tombstones
+
+Revision ID: 2c5e8b7f4a19
+Revises: 8a41c6e0d3f2
+Create Date: 2026-10-18 00:21:45.913027
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2c5e8b7f4a19'
+down_revision: str | None = '8a41c6e0d3f2'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+XID = "pg_current_xact_id()::text::bigint"
+
+
+def upgrade() -> None:
+    # Hard-deleted forms, e.g. by a cascade; soft-deleted ones are pulled with is_active false.
+    # Forms going with their organization need none, and couldn't reference it anyway
+    op.execute(f"""
+        CREATE FUNCTION sync_tombstone_forms() RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO sync_tombstones
+                (id, entity_type, entity_id, organization_id, user_id, change_xid, deleted_at)
+            SELECT gen_random_uuid(), 'form', o.id, o.organization_id, NULL, {XID}, now()
+            FROM gone o
+            WHERE EXISTS (SELECT 1 FROM organizations org WHERE org.id = o.organization_id);
+            RETURN NULL;
+        END $$
+    """)
+    op.execute("""
+        CREATE TRIGGER forms_sync_tombstone AFTER DELETE ON forms
+        REFERENCING OLD TABLE AS gone
+        FOR EACH STATEMENT EXECUTE FUNCTION sync_tombstone_forms()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER forms_sync_tombstone ON forms")
+    op.execute("DROP FUNCTION sync_tombstone_forms()")
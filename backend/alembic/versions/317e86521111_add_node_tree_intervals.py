@@ -0,0 +1,61 @@
+"""add_node_tree_intervals
+
+Revision ID: 317e86521111
+Revises: 9d1e6b3f7a20
+Create Date: 2026-10-17 15:02:37.118420
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '317e86521111'
+down_revision: str | None = '9d1e6b3f7a20'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same encoding as organizations.hierarchy.renumber, for every org at once
+BACKFILL = """
+    WITH ordered AS (
+        SELECT id, depth,
+               row_number() OVER (
+                   PARTITION BY organization_id ORDER BY materialized_path COLLATE "C"
+               ) - 1 AS rn
+        FROM nodes
+    ),
+    sizes AS (
+        SELECT a.ancestor::uuid AS id, count(*) AS size
+        FROM nodes n,
+             unnest(string_to_array(trim(both '/' from n.materialized_path), '/')) AS a(ancestor)
+        GROUP BY a.ancestor
+    )
+    UPDATE nodes
+    SET tree_left = (2 * o.rn - o.depth) * 4294967296,
+        tree_right = (2 * o.rn - o.depth + 2 * s.size - 1) * 4294967296
+    FROM ordered o
+    JOIN sizes s ON s.id = o.id
+    WHERE nodes.id = o.id
+"""
+
+
+def upgrade() -> None:
+    op.add_column('nodes', sa.Column('tree_left', sa.BigInteger(), nullable=True))
+    op.add_column('nodes', sa.Column('tree_right', sa.BigInteger(), nullable=True))
+    op.execute(BACKFILL)
+    op.alter_column('nodes', 'tree_left', nullable=False)
+    op.alter_column('nodes', 'tree_right', nullable=False)
+    op.create_index(
+        'ix_nodes_org_tree_left',
+        'nodes',
+        ['organization_id', 'tree_left', 'tree_right'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_nodes_org_tree_left', table_name='nodes')
+    op.drop_column('nodes', 'tree_right')
+    op.drop_column('nodes', 'tree_left')
@@ -0,0 +1,74 @@
+"""add_hot_query_indexes
+
+Indexes are built CONCURRENTLY so they can be applied to a live database
+without blocking writes. Postgres forbids that inside a transaction, so every
+statement runs in an autocommit block. A concurrent build that fails leaves an
+INVALID index behind; each one is dropped first so re-running the upgrade
+rebuilds it instead of skipping it.
+
+Revision ID: 445a934d766f
+Revises: 650af0ef126d
+Create Date: 2026-10-17 11:03:27.184906
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '445a934d766f'
+down_revision: str | None = '650af0ef126d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+INDEXES: list[tuple[str, str, list[str], dict]] = [
+    # list_responses: org join + optional filter, keyset on (created_at, id)
+    ('ix_responses_created_at_id', 'responses', ['created_at', 'id'], {}),
+    ('ix_responses_form_created', 'responses', ['form_id', 'created_at', 'id'], {}),
+    ('ix_responses_node_created', 'responses', ['node_id', 'created_at', 'id'], {}),
+    ('ix_responses_respondent_created', 'responses', ['respondent_id', 'created_at', 'id'], {}),
+    ('ix_responses_status_created', 'responses', ['status', 'created_at', 'id'], {}),
+    # conformity re-evaluation walks a question's answers in id order
+    ('ix_answers_question_id', 'answers', ['question_id', 'id'], {}),
+    ('ix_conformity_reevaluations_question_created', 'conformity_reevaluations',
+     ['question_id', 'created_at'], {}),
+    # list_action_plans: keyset on (deadline, id)
+    ('ix_action_plans_org_deadline', 'action_plans', ['organization_id', 'deadline', 'id'], {}),
+    ('ix_action_plans_org_status_deadline', 'action_plans',
+     ['organization_id', 'status', 'deadline', 'id'], {}),
+    ('ix_action_plans_responsible_deadline', 'action_plans',
+     ['responsible_user_id', 'deadline', 'id'], {}),
+    ('ix_action_plans_answer_id', 'action_plans', ['answer_id'], {}),
+    ('ix_action_plan_comments_plan_created', 'action_plan_comments',
+     ['action_plan_id', 'created_at'], {}),
+    # list_forms: active forms only, keyset on (updated_at, id)
+    ('ix_forms_org_active_updated', 'forms', ['organization_id', 'updated_at', 'id'],
+     {'postgresql_where': sa.text('is_active')}),
+    ('ix_sections_form_sort', 'sections', ['form_id', 'sort_order'], {}),
+    ('ix_questions_section_sort', 'questions', ['section_id', 'sort_order'], {}),
+    # membership lookups (the user-side lookup is served by the unique constraint)
+    ('ix_user_organization_roles_organization_id', 'user_organization_roles',
+     ['organization_id'], {}),
+    ('ix_user_node_assignments_node_id', 'user_node_assignments', ['node_id'], {}),
+    # hierarchy tree and subtree (LIKE 'prefix%') queries
+    ('ix_nodes_org_active_tree', 'nodes', ['organization_id', 'depth', 'sort_order', 'name'],
+     {'postgresql_where': sa.text('is_active')}),
+    ('ix_nodes_materialized_path_pattern', 'nodes', ['materialized_path'],
+     {'postgresql_ops': {'materialized_path': 'text_pattern_ops'}}),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, kw in INDEXES:
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, **kw)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""add_trigram_search_indexes
+
+Revision ID: d5a9e3b70c18
+Revises: c81f0a6d2e47
+Create Date: 2026-10-17 19:11:46.207953
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9e3b70c18'
+down_revision: str | None = 'c81f0a6d2e47'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+INDEXES: list[tuple[str, str, str]] = [
+    ('ix_forms_title_trgm', 'forms', 'title'),
+    ('ix_forms_code_trgm', 'forms', 'code'),
+    ('ix_nodes_name_trgm', 'nodes', 'name'),
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+            op.create_index(
+                name, table, [column], unique=False, postgresql_concurrently=True,
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
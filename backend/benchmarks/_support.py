@@ -0,0 +1,165 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against the database configured in ``.env`` (the same one the
+app uses). Every benchmark works inside a single transaction that is rolled
+back at the end, so seeded rows never persist.
+"""
+
+import statistics
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config import settings
+from src.core.enums import QuestionType, UserRole
+from src.forms.models import Form, Question, Section
+from src.organizations import hierarchy
+from src.organizations.models import Node, Organization, User, UserOrganizationRole
+
+
+@asynccontextmanager
+async def rollback_session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine(settings.database_url, echo=False)
+    try:
+        async with engine.connect() as conn:
+            trans = await conn.begin()
+            session = AsyncSession(bind=conn, expire_on_commit=False)
+            try:
+                yield session
+            finally:
+                await session.close()
+                await trans.rollback()
+    finally:
+        await engine.dispose()
+
+
+async def bulk_insert(db: AsyncSession, model, rows: list[dict], chunk: int = 5000) -> None:
+    for start in range(0, len(rows), chunk):
+        await db.execute(insert(model), rows[start:start + chunk])
+
+
+async def seed_tree(
+    db: AsyncSession, org_id: uuid.UUID, fanout: Sequence[int]
+) -> list[dict]:
+    """Insert a complete tree under one root; ``fanout[d]`` children per node at depth d.
+
+    Intervals and descendant counts are filled in from the paths. Returns the inserted rows (root
+    first, then level by level) without them.
+    """
+    root_id = uuid.uuid4()
+    rows = [{
+        "id": root_id, "organization_id": org_id, "parent_id": None, "name": "root",
+        "node_type": "level0", "materialized_path": f"/{root_id}/", "depth": 0,
+        "tree_left": 0, "tree_right": 0,
+    }]
+    level = rows
+    for depth, width in enumerate(fanout, start=1):
+        next_level = []
+        for parent in level:
+            for i in range(width):
+                node_id = uuid.uuid4()
+                next_level.append({
+                    "id": node_id, "organization_id": org_id, "parent_id": parent["id"],
+                    "name": f"n{i}", "node_type": f"level{depth}", "sort_order": i,
+                    "materialized_path": f"{parent['materialized_path']}{node_id}/",
+                    "depth": depth, "tree_left": 0, "tree_right": 0,
+                })
+        rows.extend(next_level)
+        level = next_level
+    await bulk_insert(db, Node, rows)
+    await hierarchy.renumber(db, org_id)
+    await hierarchy.recount(db, org_id)
+    return rows
+
+
+async def seed_org(db: AsyncSession) -> tuple[Organization, User, Node]:
+    """Create an organization with an admin user and a single root node."""
+    suffix = uuid.uuid4().hex[:12]
+    now = datetime.now(UTC)
+    org = Organization(name=f"bench-{suffix}", slug=f"bench-{suffix}")
+    user = User(email=f"bench-{suffix}@example.com", full_name="Benchmark User")
+    db.add_all([org, user])
+    await db.flush()
+    db.add(UserOrganizationRole(
+        user_id=user.id, organization_id=org.id, role=UserRole.ADMIN, created_at=now
+    ))
+    root = Node(
+        organization_id=org.id, name="root", node_type="plant", materialized_path="",
+        tree_left=0, tree_right=hierarchy.TREE_GAP,
+    )
+    db.add(root)
+    await db.flush()
+    root.materialized_path = f"/{root.id}/"
+    await db.flush()
+    return org, user, root
+
+
+async def seed_form(
+    db: AsyncSession,
+    org_id: uuid.UUID,
+    user_id: uuid.UUID,
+    n_questions: int,
+    questions_per_section: int = 50,
+) -> tuple[Form, list[Question]]:
+    """Create a published form with ``n_questions`` numeric questions."""
+    form = Form(
+        organization_id=org_id,
+        title=f"Benchmark form ({n_questions} questions)",
+        created_by=user_id,
+        is_published=True,
+        published_at=datetime.now(UTC),
+    )
+    db.add(form)
+    await db.flush()
+
+    questions: list[Question] = []
+    for section_index in range(0, n_questions, questions_per_section):
+        section = Section(
+            form_id=form.id, title=f"Section {section_index}", sort_order=section_index
+        )
+        db.add(section)
+        await db.flush()
+        for i in range(section_index, min(n_questions, section_index + questions_per_section)):
+            questions.append(Question(
+                section_id=section.id,
+                question_type=QuestionType.NUMERIC,
+                text=f"Reading {i}",
+                sort_order=i,
+                config={},
+                reference_value={"operator": "between", "min": 10, "max": 20},
+            ))
+    db.add_all(questions)
+    await db.flush()
+    return form, questions
+
+
+async def measure(
+    fn: Callable[[], Awaitable[object]], repeat: int = 20, warmup: int = 2
+) -> dict[str, float]:
+    """Run ``fn`` repeatedly and return latency statistics in milliseconds."""
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def print_table(title: str, header: list[str], rows: list[list[object]]) -> None:
+    cells = [[f"{c:.2f}" if isinstance(c, float) else str(c) for c in row] for row in rows]
+    widths = [max(len(c) for c in col) for col in zip(header, *cells, strict=True)]
+    print(f"\n{title}")
+    for row in [header, *cells]:
+        print("  ".join(c.rjust(w) for c, w in zip(row, widths, strict=True)))
@@ -0,0 +1,195 @@
+"""Microbenchmark: the old dict-walking engine vs. compiled rules.
+
+``baseline`` is the engine as it was before rules were compiled, kept here
+verbatim so the comparison can be rerun. ``check_conformity`` memoizes rules per
+reference value; ``rule_for`` compiles once per (question id, updated_at). The
+last row evaluates rules fetched once per question, which is how the bulk
+upsert and re-evaluation paths use them.
+No database needed.
+
+    cd backend && python -m benchmarks.conformity_engine [evaluations]
+"""
+
+import random
+import re
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+
+from benchmarks._support import print_table
+from src.core.enums import ConformityStatus, QuestionType
+from src.responses.conformity import check_conformity, rule_for
+
+# ─── Baseline ─────────────────────────────────────────────────────
+
+def baseline(
+    question_type: QuestionType, value: dict | None, reference_value: dict | None
+) -> ConformityStatus:
+    if reference_value is None or value is None:
+        return ConformityStatus.NOT_APPLICABLE
+    try:
+        checker = _BASELINE_CHECKERS.get(question_type)
+        if checker is None:
+            return ConformityStatus.NOT_APPLICABLE
+        return checker(value, reference_value)
+    except (KeyError, TypeError, ValueError):
+        return ConformityStatus.NOT_APPLICABLE
+
+
+def _baseline_status(ok: bool) -> ConformityStatus:
+    return ConformityStatus.CONFORMING if ok else ConformityStatus.NON_CONFORMING
+
+
+def _baseline_numeric(value: dict, ref: dict) -> ConformityStatus:
+    number = value.get("number")
+    if number is None:
+        return ConformityStatus.NOT_APPLICABLE
+    number = float(number)
+    operator = ref.get("operator", "between")
+    if operator == "between":
+        min_val = float(ref.get("min", float("-inf")))
+        max_val = float(ref.get("max", float("inf")))
+        return _baseline_status(min_val <= number <= max_val)
+    if operator == "eq":
+        return _baseline_status(number == float(ref["value"]))
+    if operator == "gte":
+        return _baseline_status(number >= float(ref["value"]))
+    if operator == "lte":
+        return _baseline_status(number <= float(ref["value"]))
+    if operator == "gt":
+        return _baseline_status(number > float(ref["value"]))
+    if operator == "lt":
+        return _baseline_status(number < float(ref["value"]))
+    return ConformityStatus.NOT_APPLICABLE
+
+
+def _baseline_boolean(value: dict, ref: dict) -> ConformityStatus:
+    answer = value.get("boolean")
+    expected = ref.get("expected")
+    if answer is None or expected is None:
+        return ConformityStatus.NOT_APPLICABLE
+    return _baseline_status(answer == expected)
+
+
+def _baseline_single_choice(value: dict, ref: dict) -> ConformityStatus:
+    selected = value.get("selected")
+    expected_values = ref.get("expected_values", [])
+    if selected is None or not expected_values:
+        return ConformityStatus.NOT_APPLICABLE
+    return _baseline_status(selected in expected_values)
+
+
+def _baseline_multi_choice(value: dict, ref: dict) -> ConformityStatus:
+    selected = set(value.get("selected", []))
+    expected_values = set(ref.get("expected_values", []))
+    if not selected or not expected_values:
+        return ConformityStatus.NOT_APPLICABLE
+    return _baseline_status(selected <= expected_values)
+
+
+def _baseline_text(value: dict, ref: dict) -> ConformityStatus:
+    text = value.get("text", "")
+    pattern = ref.get("pattern")
+    if not pattern:
+        return ConformityStatus.NOT_APPLICABLE
+    return _baseline_status(bool(re.match(pattern, text)))
+
+
+_BASELINE_CHECKERS = {
+    QuestionType.NUMERIC: _baseline_numeric,
+    QuestionType.BOOLEAN: _baseline_boolean,
+    QuestionType.SINGLE_CHOICE: _baseline_single_choice,
+    QuestionType.MULTI_CHOICE: _baseline_multi_choice,
+    QuestionType.TEXT: _baseline_text,
+}
+
+
+# ─── Benchmark ────────────────────────────────────────────────────
+
+CASES = [
+    (
+        QuestionType.NUMERIC,
+        {"operator": "between", "min": 10, "max": 20},
+        lambda r: {"number": r.uniform(0, 30)},
+    ),
+    (
+        QuestionType.NUMERIC,
+        {"operator": "gte", "value": "15.5"},
+        lambda r: {"number": r.uniform(0, 30)},
+    ),
+    (
+        QuestionType.BOOLEAN,
+        {"expected": True},
+        lambda r: {"boolean": r.random() < 0.8},
+    ),
+    (
+        QuestionType.SINGLE_CHOICE,
+        {"expected_values": ["ok", "good"]},
+        lambda r: {"selected": r.choice(["ok", "good", "bad"])},
+    ),
+    (
+        QuestionType.MULTI_CHOICE,
+        {"expected_values": ["a", "b", "c"]},
+        lambda r: {"selected": r.sample(["a", "b", "c", "d"], 2)},
+    ),
+    (
+        QuestionType.TEXT,
+        {"pattern": r"^[A-Z]{3}-\d{4}$"},
+        lambda r: {"text": r.choice(["ABC-1234", "abc-1234"])},
+    ),
+]
+
+
+def main(evaluations: int) -> None:
+    rng = random.Random(42)
+    updated_at = datetime.now(UTC)
+    questions = [(uuid.uuid4(), qtype, ref) for qtype, ref, _ in CASES]
+    workload = [
+        (questions[i], CASES[i][2](rng))
+        for i in (rng.randrange(len(CASES)) for _ in range(evaluations))
+    ]
+
+    started = time.perf_counter()
+    for (_, qtype, ref), value in workload:
+        baseline(qtype, value, ref)
+    old = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for (_, qtype, ref), value in workload:
+        check_conformity(qtype, value, ref)
+    per_call = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for (question_id, qtype, ref), value in workload:
+        rule_for(question_id, updated_at, qtype, ref)(value)
+    cached = time.perf_counter() - started
+
+    rules = {q[0]: rule_for(q[0], updated_at, q[1], q[2]) for q in questions}
+    mismatches = sum(
+        rules[question_id](value) != baseline(qtype, value, ref)
+        for (question_id, qtype, ref), value in workload
+    )
+    started = time.perf_counter()
+    for (question_id, _, _), value in workload:
+        rules[question_id](value)
+    compiled = time.perf_counter() - started
+
+    print_table(
+        f"conformity engine, {evaluations:,} evaluations",
+        ["engine", "total s", "ns / eval", "evals / s"],
+        [
+            [name, elapsed, elapsed / evaluations * 1e9, f"{evaluations / elapsed:,.0f}"]
+            for name, elapsed in (
+                ("baseline (old engine)", old),
+                ("check_conformity", per_call),
+                ("rule_for per eval", cached),
+                ("compiled rule", compiled),
+            )
+        ],
+    )
+    print(f"compiled rules disagreeing with the baseline: {mismatches}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,112 @@
+"""Duplicating a 40-section, 800-question form, and a composite of three of them.
+
+Compares ``forms.service.duplicate_form`` (one INSERT ... SELECT statement) with
+the previous implementation, which flushed once per section and added every
+question as an ORM object. The old version never copied a composite's
+children, so the composite row only times the new one.
+
+    cd backend && python -m benchmarks.duplicate_form
+"""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks._support import measure, print_table, rollback_session, seed_form, seed_org
+from src.forms import service
+from src.forms.models import CompositeFormChild, Form, Question, Section
+
+N_QUESTIONS = 800
+QUESTIONS_PER_SECTION = 20
+N_CHILDREN = 3
+
+
+async def _legacy_duplicate(db: AsyncSession, form_id, user_id) -> Form:
+    """The pre-bulk implementation, kept here as the baseline."""
+    original = await service.get_form(db, form_id)
+    new_form = Form(
+        organization_id=original.organization_id,
+        title=f"{original.title} (Copy)",
+        description=original.description,
+        is_composite=original.is_composite,
+        expected_frequency=original.expected_frequency,
+        created_by=user_id,
+    )
+    db.add(new_form)
+    await db.flush()
+    for section in original.sections:
+        if not section.is_active:
+            continue
+        new_section = Section(
+            form_id=new_form.id,
+            title=section.title,
+            description=section.description,
+            sort_order=section.sort_order,
+        )
+        db.add(new_section)
+        await db.flush()
+        for question in section.questions:
+            if not question.is_active:
+                continue
+            db.add(Question(
+                section_id=new_section.id,
+                question_type=question.question_type,
+                text=question.text,
+                description=question.description,
+                is_required=question.is_required,
+                requires_photo=question.requires_photo,
+                requires_comment=question.requires_comment,
+                sort_order=question.sort_order,
+                config=question.config,
+                reference_value=question.reference_value,
+            ))
+    await db.flush()
+    return new_form
+
+
+async def main() -> None:
+    async with rollback_session() as db:
+        org, user, _ = await seed_org(db)
+        form, _ = await seed_form(db, org.id, user.id, N_QUESTIONS, QUESTIONS_PER_SECTION)
+        composite = Form(
+            organization_id=org.id, title="Benchmark composite", is_composite=True,
+            created_by=user.id,
+        )
+        db.add(composite)
+        await db.flush()
+        for i in range(N_CHILDREN):
+            child, _ = await seed_form(db, org.id, user.id, N_QUESTIONS, QUESTIONS_PER_SECTION)
+            db.add(CompositeFormChild(
+                parent_form_id=composite.id, child_form_id=child.id, sort_order=i
+            ))
+        await db.flush()
+
+        async def legacy() -> None:
+            await _legacy_duplicate(db, form.id, user.id)
+            db.expunge_all()
+
+        async def bulk() -> None:
+            await service.duplicate_form(db, form.id, user.id)
+            db.expunge_all()
+
+        async def bulk_composite() -> None:
+            await service.duplicate_form(db, composite.id, user.id)
+            db.expunge_all()
+
+        results = []
+        for target, implementation, fn in [
+            ("form", "row-by-row", legacy),
+            ("form", "INSERT ... SELECT", bulk),
+            (f"composite of {N_CHILDREN}", "INSERT ... SELECT", bulk_composite),
+        ]:
+            timings = await measure(fn, repeat=5, warmup=1)
+            results.append([target, implementation, *timings.values()])
+    print_table(
+        f"duplicate_form ({N_QUESTIONS} questions per form), ms",
+        ["copied", "implementation", "p50", "p95", "mean"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,340 @@
+"""EXPLAIN the hot list and lookup queries against a seeded database.
+
+Seeds a few orgs' worth of users, nodes, forms, responses, answers and action
+plans, ANALYZEs them, then prints the access path of each query next to the
+index the 445a934d766f migration added for it. Exits non-zero if any query
+does not use its index. The queries mirror the ones built in the services
+(including the keyset predicate from ``core.pagination``).
+
+The database must be migrated to head:
+
+    cd backend && alembic upgrade head && python -m benchmarks.explain_hot_queries
+"""
+
+import asyncio
+import json
+import random
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks._support import bulk_insert, print_table, rollback_session
+from src.action_plans.models import ActionPlan
+from src.core.enums import (
+    ActionPlanPriority,
+    ActionPlanStatus,
+    QuestionType,
+    ResponseStatus,
+    UserRole,
+)
+from src.core.pagination import CursorParams, apply_keyset, encode_cursor
+from src.forms.models import Form, Question, Section
+from src.organizations import hierarchy
+from src.organizations.models import (
+    Node,
+    Organization,
+    User,
+    UserNodeAssignment,
+    UserOrganizationRole,
+)
+from src.responses.models import Answer, Response
+
+N_ORGS = 20
+USERS_PER_ORG = 100
+NODES_PER_ORG = 250
+FORMS_PER_ORG = 50
+SECTIONS_PER_FORM = 4
+QUESTIONS_PER_SECTION = 5
+N_RESPONSES = 50_000
+ANSWERED_RESPONSES = 2_000
+N_ACTION_PLANS = 20_000
+
+
+@dataclass
+class Seeded:
+    org_id: uuid.UUID
+    user_id: uuid.UUID
+    node_id: uuid.UUID
+    node_path: str
+    form_id: uuid.UUID
+    section_id: uuid.UUID
+    question_id: uuid.UUID
+
+
+async def seed(db: AsyncSession, rng: random.Random) -> Seeded:
+    now = datetime.now(UTC)
+    suffix = uuid.uuid4().hex[:8]
+
+    def stamp(days: int = 365) -> datetime:
+        return now - timedelta(seconds=rng.randrange(days * 86400))
+
+    orgs, users, roles, nodes, assignments = [], [], [], [], []
+    forms, sections, questions = [], [], []
+    users_by_org: dict[uuid.UUID, list[uuid.UUID]] = {}
+    nodes_by_org: dict[uuid.UUID, list[uuid.UUID]] = {}
+    forms_by_org: dict[uuid.UUID, list[uuid.UUID]] = {}
+    questions_by_form: dict[uuid.UUID, list[uuid.UUID]] = {}
+    org_of_form: dict[uuid.UUID, uuid.UUID] = {}
+
+    for o in range(N_ORGS):
+        org_id = uuid.uuid4()
+        slug = f"explain-{suffix}-{o}"
+        orgs.append({"id": org_id, "name": slug, "slug": slug})
+
+        org_users = [uuid.uuid4() for _ in range(USERS_PER_ORG)]
+        users_by_org[org_id] = org_users
+        for i, user_id in enumerate(org_users):
+            users.append({
+                "id": user_id, "email": f"explain-{suffix}-{o}-{i}@example.com",
+                "full_name": f"User {o}-{i}",
+            })
+            roles.append({
+                "user_id": user_id, "organization_id": org_id,
+                "role": UserRole.END_USER if i else UserRole.ADMIN, "created_at": now,
+            })
+
+        root_id = uuid.uuid4()
+        root_path = f"/{root_id}/"
+        org_nodes = [root_id]
+        nodes.append({
+            "id": root_id, "organization_id": org_id, "name": "root", "node_type": "plant",
+            "materialized_path": root_path, "depth": 0, "tree_left": 0, "tree_right": 0,
+        })
+        for i in range(NODES_PER_ORG - 1):
+            node_id = uuid.uuid4()
+            org_nodes.append(node_id)
+            nodes.append({
+                "id": node_id, "organization_id": org_id, "parent_id": root_id,
+                "name": f"area {i}", "node_type": "area",
+                "materialized_path": f"{root_path}{node_id}/", "depth": 1, "sort_order": i,
+                "is_active": rng.random() > 0.05, "tree_left": 0, "tree_right": 0,
+            })
+        nodes_by_org[org_id] = org_nodes
+        for user_id in org_users:
+            assignments.append(
+                {"user_id": user_id, "node_id": rng.choice(org_nodes), "created_at": now}
+            )
+
+        forms_by_org[org_id] = []
+        for f in range(FORMS_PER_ORG):
+            form_id = uuid.uuid4()
+            forms_by_org[org_id].append(form_id)
+            org_of_form[form_id] = org_id
+            updated = stamp()
+            forms.append({
+                "id": form_id, "organization_id": org_id, "title": f"Checklist {f}",
+                "is_published": True, "is_active": rng.random() > 0.1,
+                "created_at": updated, "updated_at": updated,
+            })
+            questions_by_form[form_id] = []
+            for s in range(SECTIONS_PER_FORM):
+                section_id = uuid.uuid4()
+                sections.append(
+                    {"id": section_id, "form_id": form_id, "title": f"Section {s}", "sort_order": s}
+                )
+                for q in range(QUESTIONS_PER_SECTION):
+                    question_id = uuid.uuid4()
+                    questions_by_form[form_id].append(question_id)
+                    questions.append({
+                        "id": question_id, "section_id": section_id,
+                        "question_type": QuestionType.BOOLEAN, "text": f"Check {q}",
+                        "sort_order": q, "config": {}, "reference_value": {"expected": True},
+                    })
+
+    all_forms = list(org_of_form)
+    responses = []
+    for _ in range(N_RESPONSES):
+        form_id = rng.choice(all_forms)
+        org_id = org_of_form[form_id]
+        created = stamp()
+        responses.append({
+            "id": uuid.uuid4(), "form_id": form_id,
+            "node_id": rng.choice(nodes_by_org[org_id]),
+            "respondent_id": rng.choice(users_by_org[org_id]),
+            "status": rng.choice(list(ResponseStatus)),
+            "started_at": created, "client_created_at": created,
+            "created_at": created, "updated_at": created,
+        })
+
+    answers = []
+    for response in rng.sample(responses, ANSWERED_RESPONSES):
+        for question_id in questions_by_form[response["form_id"]]:
+            answers.append({
+                "id": uuid.uuid4(), "response_id": response["id"], "question_id": question_id,
+                "value": {"value": rng.random() > 0.2}, "client_created_at": response["created_at"],
+            })
+
+    form_of_response = {r["id"]: r["form_id"] for r in responses}
+    plans = []
+    for answer in rng.sample(answers, N_ACTION_PLANS):
+        org_id = org_of_form[form_of_response[answer["response_id"]]]
+        plans.append({
+            "answer_id": answer["id"], "response_id": answer["response_id"],
+            "organization_id": org_id, "title": "Fix it", "description": "Non-conforming answer",
+            "priority": rng.choice(list(ActionPlanPriority)),
+            "status": rng.choice(list(ActionPlanStatus)),
+            "responsible_user_id": rng.choice(users_by_org[org_id]),
+            "deadline": date.today() + timedelta(days=rng.randrange(-180, 180)),
+        })
+
+    for model, rows in [
+        (Organization, orgs), (User, users), (UserOrganizationRole, roles), (Node, nodes),
+        (UserNodeAssignment, assignments), (Form, forms), (Section, sections),
+        (Question, questions), (Response, responses), (Answer, answers), (ActionPlan, plans),
+    ]:
+        await bulk_insert(db, model, rows)
+        if model is Node:
+            for org in orgs:
+                await hierarchy.renumber(db, org["id"])
+        await db.execute(text(f"ANALYZE {model.__tablename__}"))
+
+    org_id = orgs[0]["id"]
+    form_id = forms_by_org[org_id][0]
+    return Seeded(
+        org_id=org_id,
+        user_id=users_by_org[org_id][1],
+        node_id=nodes_by_org[org_id][1],
+        node_path=nodes[0]["materialized_path"],
+        form_id=form_id,
+        section_id=next(s["id"] for s in sections if s["form_id"] == form_id),
+        question_id=answers[0]["question_id"],
+    )
+
+
+def hot_queries(s: Seeded) -> list[tuple[str, str, Select]]:
+    """(label, expected index, statement) for each query the migration targets."""
+    page_two = CursorParams(
+        cursor=encode_cursor((datetime.now(UTC) - timedelta(days=30), uuid.uuid4()))
+    )
+
+    def responses(*criteria) -> Select:
+        query = (
+            select(Response, Form.title, Node.name, User.full_name)
+            .join(Form, Response.form_id == Form.id)
+            .join(Node, Response.node_id == Node.id)
+            .join(User, Response.respondent_id == User.id)
+            .where(Form.organization_id == s.org_id, *criteria)
+        )
+        return apply_keyset(query, [Response.created_at, Response.id], page_two, descending=True)
+
+    def action_plans(*criteria) -> Select:
+        query = select(ActionPlan).where(ActionPlan.organization_id == s.org_id, *criteria)
+        return apply_keyset(query, [ActionPlan.deadline, ActionPlan.id], CursorParams())
+
+    forms = select(Form).where(Form.organization_id == s.org_id, Form.is_active == True)  # noqa: E712
+
+    return [
+        ("list_responses", "ix_responses_created_at_id", responses()),
+        (
+            "list_responses ?form_id", "ix_responses_form_created",
+            responses(Response.form_id == s.form_id),
+        ),
+        (
+            "list_responses ?node_id", "ix_responses_node_created",
+            responses(Response.node_id == s.node_id),
+        ),
+        (
+            "list_responses ?respondent_id", "ix_responses_respondent_created",
+            responses(Response.respondent_id == s.user_id),
+        ),
+        (
+            "list_responses ?status", "ix_responses_status_created",
+            responses(Response.status == ResponseStatus.SUBMITTED),
+        ),
+        ("list_forms", "ix_forms_org_active_updated", apply_keyset(
+            forms, [Form.updated_at, Form.id], CursorParams(), descending=True
+        )),
+        (
+            "get_form sections", "ix_sections_form_sort",
+            select(Section).where(Section.form_id == s.form_id).order_by(Section.sort_order),
+        ),
+        (
+            "section questions", "ix_questions_section_sort",
+            select(Question).where(Question.section_id == s.section_id)
+            .order_by(Question.sort_order),
+        ),
+        ("list_action_plans", "ix_action_plans_org_deadline", action_plans()),
+        (
+            "list_action_plans ?status", "ix_action_plans_org_status_deadline",
+            action_plans(ActionPlan.status == ActionPlanStatus.OPEN),
+        ),
+        (
+            "list_action_plans ?responsible", "ix_action_plans_responsible_deadline",
+            action_plans(ActionPlan.responsible_user_id == s.user_id),
+        ),
+        (
+            "reevaluation chunk", "ix_answers_question_id",
+            select(Answer.id, Answer.value).where(Answer.question_id == s.question_id)
+            .order_by(Answer.id).limit(5000),
+        ),
+        (
+            "get_current_org_member", "user_organization_roles_user_id_organization_id_key",
+            select(UserOrganizationRole).where(
+                UserOrganizationRole.user_id == s.user_id,
+                UserOrganizationRole.organization_id == s.org_id,
+            ),
+        ),
+        (
+            "list_members", "ix_user_organization_roles_organization_id",
+            select(UserOrganizationRole).where(UserOrganizationRole.organization_id == s.org_id),
+        ),
+        (
+            "node assignments", "ix_user_node_assignments_node_id",
+            select(UserNodeAssignment).where(UserNodeAssignment.node_id == s.node_id),
+        ),
+        (
+            "stream_hierarchy", "ix_nodes_org_active_tree",
+            select(Node).where(Node.organization_id == s.org_id, Node.is_active == True)  # noqa: E712
+            .order_by(Node.depth, Node.sort_order, Node.name),
+        ),
+        (
+            "subtree (materialized_path LIKE)", "ix_nodes_materialized_path_pattern",
+            select(Node).where(Node.materialized_path.like(f"{s.node_path}%")),
+        ),
+    ]
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def explain(db: AsyncSession, stmt: Select) -> dict:
+    conn = await db.connection()
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    raw = result.scalar_one()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+async def main() -> int:
+    rng = random.Random(42)
+    failures = 0
+    rows = []
+    async with rollback_session() as db:
+        seeded = await seed(db, rng)
+        for label, expected, stmt in hot_queries(seeded):
+            nodes = list(_plan_nodes(await explain(db, stmt)))
+            used = sorted({n["Index Name"] for n in nodes if "Index Name" in n})
+            seq = sorted({n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"})
+            ok = expected in used
+            failures += not ok
+            rows.append([
+                label, expected, "yes" if ok else "NO",
+                ", ".join(used) or "-", ", ".join(seq) or "-",
+            ])
+    print_table(
+        f"Access paths ({N_RESPONSES} responses, {len(rows)} queries)",
+        ["query", "expected index", "used", "indexes in plan", "seq scans"],
+        rows,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,111 @@
+"""Node permission checks: path ``LIKE`` joins vs nested-set interval ranges.
+
+Seeds trees of ~10k, ~100k and ~1M nodes, assigns a supervisor to two
+mid-level nodes and times ``core.permissions.user_can_access_node`` (for a
+node inside and one outside the assignments) and ``get_accessible_node_ids``
+against the ``materialized_path LIKE assigned.materialized_path || '%'``
+queries they replaced.
+
+    cd backend && alembic upgrade head && python -m benchmarks.hierarchy_intervals
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+
+from benchmarks._support import measure, print_table, rollback_session, seed_org, seed_tree
+from src.core import permissions
+from src.core.enums import UserRole
+from src.organizations.models import UserNodeAssignment
+
+SIZES = [(10, 30, 33), (10, 100, 100), (10, 100, 1000)]
+
+LEGACY_CAN_ACCESS = text("""
+    SELECT EXISTS (
+        SELECT 1
+        FROM user_node_assignments una
+        JOIN nodes assigned ON una.node_id = assigned.id
+        JOIN nodes target ON target.id = :target_node_id
+        WHERE una.user_id = :user_id
+          AND assigned.organization_id = :org_id
+          AND target.materialized_path LIKE assigned.materialized_path || '%'
+    )
+""")
+
+LEGACY_ACCESSIBLE = text("""
+    SELECT DISTINCT n.id
+    FROM nodes n
+    JOIN user_node_assignments una ON una.user_id = :user_id
+    JOIN nodes assigned ON una.node_id = assigned.id
+    WHERE n.organization_id = :org_id
+      AND n.materialized_path LIKE assigned.materialized_path || '%'
+      AND n.is_active = true
+""")
+
+
+async def run(fanout: tuple[int, ...]) -> list[list[object]]:
+    async with rollback_session() as db:
+        org, user, _ = await seed_org(db)
+        rows = await seed_tree(db, org.id, fanout)
+        areas = [r for r in rows if r["depth"] == 2]
+        assigned = [areas[0], areas[len(areas) // 2]]
+        now = datetime.now(UTC)
+        db.add_all([
+            UserNodeAssignment(user_id=user.id, node_id=a["id"], created_at=now) for a in assigned
+        ])
+        await db.flush()
+        await db.execute(text("ANALYZE nodes"))
+        await db.execute(text("ANALYZE user_node_assignments"))
+
+        leaves = [r for r in rows if r["depth"] == len(fanout)]
+        prefix = assigned[0]["materialized_path"]
+        inside = next(r for r in leaves if r["materialized_path"].startswith(prefix))
+        outside = leaves[-1]
+        params = {"user_id": user.id, "org_id": org.id}
+
+        def legacy_check(target):
+            async def fn() -> None:
+                await db.execute(LEGACY_CAN_ACCESS, {**params, "target_node_id": target["id"]})
+            return fn
+
+        def interval_check(target):
+            async def fn() -> None:
+                await permissions.user_can_access_node(
+                    db, user.id, target["id"], org.id, UserRole.SUPERVISOR
+                )
+            return fn
+
+        async def legacy_accessible() -> None:
+            (await db.execute(LEGACY_ACCESSIBLE, params)).fetchall()
+
+        async def interval_accessible() -> None:
+            await permissions.get_accessible_node_ids(db, user.id, org.id, UserRole.SUPERVISOR)
+
+        results = []
+        for query, implementation, fn in [
+            ("can access (inside)", "LIKE", legacy_check(inside)),
+            ("can access (inside)", "interval", interval_check(inside)),
+            ("can access (outside)", "LIKE", legacy_check(outside)),
+            ("can access (outside)", "interval", interval_check(outside)),
+            ("accessible node ids", "LIKE", legacy_accessible),
+            ("accessible node ids", "interval", interval_accessible),
+        ]:
+            timings = await measure(fn, repeat=10, warmup=2)
+            results.append([len(rows), query, implementation, *timings.values()])
+    return results
+
+
+async def main() -> None:
+    results = []
+    for fanout in SIZES:
+        results.extend(await run(fanout))
+    print_table(
+        "Node permission checks, ms",
+        ["nodes", "query", "implementation", "p50", "p95", "mean"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""Moving and deactivating large subtrees of a ~100k-node hierarchy.
+
+Compares ``organizations.service.move_node`` / ``delete_node`` (one UPDATE over
+the path prefix) with the previous implementations that loaded every
+descendant into the session and rewrote it in Python.
+
+The tree is root → 4 plants → 50 areas → 500 lines, so each plant carries
+~25k descendants.
+
+    cd backend && python -m benchmarks.subtree_operations
+"""
+
+import asyncio
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks._support import measure, print_table, rollback_session, seed_org, seed_tree
+from src.organizations import service
+from src.organizations.models import Node
+from src.organizations.schemas import NodeMove
+
+FANOUT = (4, 50, 500)
+
+
+async def _legacy_move(db: AsyncSession, node_id, new_parent_id) -> None:
+    """The pre-set-based move, kept here as the baseline."""
+    node = (await db.execute(select(Node).where(Node.id == node_id))).scalar_one()
+    old_path = node.materialized_path
+    new_parent = (await db.execute(select(Node).where(Node.id == new_parent_id))).scalar_one()
+    new_path = f"{new_parent.materialized_path}{node.id}/"
+    node.depth = new_parent.depth + 1
+    node.parent_id = new_parent_id
+    node.materialized_path = new_path
+    result = await db.execute(
+        select(Node).where(Node.materialized_path.like(f"{old_path}%"), Node.id != node_id)
+    )
+    for desc in result.scalars().all():
+        desc.materialized_path = desc.materialized_path.replace(old_path, new_path, 1)
+        desc.depth = desc.materialized_path.strip("/").count("/")
+    await db.flush()
+
+
+async def _legacy_delete(db: AsyncSession, node_id) -> None:
+    node = (await db.execute(select(Node).where(Node.id == node_id))).scalar_one()
+    node.is_active = False
+    result = await db.execute(
+        select(Node).where(
+            Node.materialized_path.like(f"{node.materialized_path}%"), Node.id != node_id
+        )
+    )
+    for desc in result.scalars().all():
+        desc.is_active = False
+    await db.flush()
+
+
+async def main() -> None:
+    async with rollback_session() as db:
+        org, _, _ = await seed_org(db)
+        rows = await seed_tree(db, org.id, FANOUT)
+        root_id = rows[0]["id"]
+        plants = [r["id"] for r in rows if r["depth"] == 1]
+        plant_path = rows[1]["materialized_path"]
+        subtree = sum(1 for r in rows if r["materialized_path"].startswith(plant_path))
+
+        async def reactivate() -> None:
+            await db.execute(
+                update(Node).where(Node.organization_id == org.id).values(is_active=True)
+            )
+            db.expunge_all()
+
+        async def legacy_move_round_trip() -> None:
+            await _legacy_move(db, plants[0], plants[1])
+            await _legacy_move(db, plants[0], root_id)
+            db.expunge_all()
+
+        async def set_based_move_round_trip() -> None:
+            await service.move_node(db, plants[0], NodeMove(new_parent_id=plants[1]))
+            await service.move_node(db, plants[0], NodeMove(new_parent_id=root_id))
+            db.expunge_all()
+
+        async def legacy_delete() -> None:
+            await _legacy_delete(db, plants[2])
+            await reactivate()
+
+        async def set_based_delete() -> None:
+            await service.delete_node(db, plants[2])
+            await reactivate()
+
+        results = []
+        for operation, implementation, fn in [
+            ("move there and back", "row-by-row", legacy_move_round_trip),
+            ("move there and back", "set-based", set_based_move_round_trip),
+            ("deactivate (+reset)", "row-by-row", legacy_delete),
+            ("deactivate (+reset)", "set-based", set_based_delete),
+        ]:
+            timings = await measure(fn, repeat=3, warmup=1)
+            results.append([operation, implementation, *timings.values()])
+    print_table(
+        f"Subtree operations ({len(rows)} nodes, {subtree} in the moved subtree), ms",
+        ["operation", "implementation", "p50", "p95", "mean"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,112 @@
+"""Latency of PUT /responses/{response_id}/answers at 10, 100 and 1000 answers per call.
+
+Compares the bulk upsert in ``responses.service.upsert_answers`` with the previous
+row-by-row implementation (two SELECTs per answer plus a flush per insert).
+
+    cd backend && python -m benchmarks.upsert_answers
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from benchmarks._support import measure, print_table, rollback_session, seed_form, seed_org
+from src.core.enums import ResponseStatus
+from src.forms.models import Question
+from src.responses import service
+from src.responses.conformity import check_conformity
+from src.responses.models import Answer, Response
+from src.responses.schemas import AnswerUpsert
+
+BATCH_SIZES = (10, 100, 1000)
+
+
+async def _row_by_row_upsert(db: AsyncSession, response_id, answers_data: list[AnswerUpsert]):
+    """The pre-bulk implementation, kept here as the baseline."""
+    now = datetime.now(UTC)
+    for answer_data in answers_data:
+        q_result = await db.execute(select(Question).where(Question.id == answer_data.question_id))
+        question = q_result.scalar_one_or_none()
+        if not question:
+            continue
+        conformity = check_conformity(
+            question.question_type, answer_data.value, question.reference_value
+        )
+        existing = await db.execute(
+            select(Answer).where(
+                Answer.response_id == response_id,
+                Answer.question_id == answer_data.question_id,
+            )
+        )
+        answer = existing.scalar_one_or_none()
+        if answer:
+            answer.value = answer_data.value
+            answer.comment = answer_data.comment
+            answer.conformity_status = conformity
+            answer.answered_at = now
+        else:
+            db.add(Answer(
+                response_id=response_id,
+                question_id=answer_data.question_id,
+                value=answer_data.value,
+                comment=answer_data.comment,
+                conformity_status=conformity,
+                answered_at=now,
+                client_created_at=answer_data.client_created_at,
+            ))
+            await db.flush()
+    await db.flush()
+
+
+async def main() -> None:
+    rows = []
+    async with rollback_session() as db:
+        org, user, root = await seed_org(db)
+        for size in BATCH_SIZES:
+            form, questions = await seed_form(db, org.id, user.id, size)
+            now = datetime.now(UTC)
+            response = Response(
+                form_id=form.id,
+                node_id=root.id,
+                respondent_id=user.id,
+                status=ResponseStatus.DRAFT,
+                started_at=now,
+                client_created_at=now,
+            )
+            db.add(response)
+            await db.flush()
+            payload = [
+                AnswerUpsert(question_id=q.id, value={"number": i % 30}, client_created_at=now)
+                for i, q in enumerate(questions)
+            ]
+
+            async def bulk(response_id=response.id, payload=payload):
+                await service.upsert_answers(db, response_id, user.id, payload)
+                db.expunge_all()
+
+            async def row_by_row(response_id=response.id, payload=payload):
+                await _row_by_row_upsert(db, response_id, payload)
+                db.expunge_all()
+
+            repeat = 20 if size < 1000 else 5
+            baseline = await measure(row_by_row, repeat=repeat)
+            bulk_stats = await measure(bulk, repeat=repeat)
+            rows.append([
+                size,
+                baseline["p50"],
+                bulk_stats["p50"],
+                bulk_stats["p95"],
+                baseline["p50"] / bulk_stats["p50"],
+            ])
+
+    print_table(
+        "upsert_answers latency (ms)",
+        ["answers", "row-by-row p50", "bulk p50", "bulk p95", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
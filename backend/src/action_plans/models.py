@@ -1,7 +1,7 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, Date, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,12 @@ from src.core.enums import ActionPlanPriority, ActionPlanStatus
 
 class ActionPlan(UUIDMixin, TimestampMixin, Base):
     __tablename__ = "action_plans"
+    __table_args__ = (
+        Index("ix_action_plans_org_deadline", "organization_id", "deadline", "id"),
+        Index("ix_action_plans_org_status_deadline", "organization_id", "status", "deadline", "id"),
+        Index("ix_action_plans_responsible_deadline", "responsible_user_id", "deadline", "id"),
+        Index("ix_action_plans_answer_id", "answer_id"),
+    )
 
     answer_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("answers.id", ondelete="CASCADE"), nullable=False
@@ -45,6 +51,9 @@ class ActionPlan(UUIDMixin, TimestampMixin, Base):
 
 class ActionPlanComment(UUIDMixin, Base):
     __tablename__ = "action_plan_comments"
+    __table_args__ = (
+        Index("ix_action_plan_comments_plan_created", "action_plan_id", "created_at"),
+    )
 
     action_plan_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("action_plans.id", ondelete="CASCADE"), nullable=False
@@ -16,23 +16,34 @@ from src.action_plans.schemas import (
 from src.core.database import get_db
 from src.core.dependencies import get_current_org_member, get_current_user
 from src.core.enums import ActionPlanStatus
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    page_params,
+)
 from src.organizations.models import User, UserOrganizationRole
 
 router = APIRouter(tags=["action-plans"])
 
 
 @router.get(
-    "/organizations/{org_id}/action-plans", response_model=list[ActionPlanResponse]
+    "/organizations/{org_id}/action-plans",
+    response_model=CursorPage[ActionPlanResponse] | PagedResponse[ActionPlanResponse],
 )
 async def list_action_plans(
     org_id: uuid.UUID,
     _: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    page: Annotated[CursorParams | PaginationParams, Depends(page_params)],
     status: ActionPlanStatus | None = None,
     responsible_user_id: uuid.UUID | None = None,
     priority: str | None = None,
 ):
-    return await service.list_action_plans(db, org_id, status, responsible_user_id, priority)
+    return await service.list_action_plans(
+        db, org_id, status, responsible_user_id, priority, page
+    )
 
 
 @router.post("/answers/{answer_id}/action-plans", response_model=ActionPlanResponse)
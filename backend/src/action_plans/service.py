@@ -7,12 +7,23 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.action_plans.models import ActionPlan, ActionPlanComment
 from src.action_plans.schemas import (
     ActionPlanCreate,
+    ActionPlanResponse,
     ActionPlanStatusUpdate,
     ActionPlanUpdate,
     CommentCreate,
 )
 from src.core.enums import ActionPlanStatus, ConformityStatus
 from src.core.exceptions import BadRequestError, NotFoundError
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    apply_keyset,
+    approximate_total,
+    cursor_page,
+    exact_total,
+)
 from src.forms.models import Form
 from src.responses.models import Answer, Response
 
@@ -69,7 +80,10 @@ async def list_action_plans(
     status: ActionPlanStatus | None = None,
     responsible_user_id: uuid.UUID | None = None,
     priority: str | None = None,
-) -> list[ActionPlan]:
+    page: CursorParams | PaginationParams | None = None,
+) -> CursorPage[ActionPlanResponse] | PagedResponse[ActionPlanResponse]:
+    """List action plans by nearest deadline, keyset-paginated on (deadline, id)."""
+    page = page or CursorParams()
     query = select(ActionPlan).where(ActionPlan.organization_id == org_id)
     if status:
         query = query.where(ActionPlan.status == status)
@@ -77,9 +91,28 @@ async def list_action_plans(
         query = query.where(ActionPlan.responsible_user_id == responsible_user_id)
     if priority:
         query = query.where(ActionPlan.priority == priority)
-    query = query.order_by(ActionPlan.deadline.asc())
-    result = await db.execute(query)
-    return list(result.scalars().all())
+
+    if isinstance(page, PaginationParams):
+        total = await exact_total(db, query)
+        paged = (
+            query.order_by(ActionPlan.deadline.asc(), ActionPlan.id.asc())
+            .offset(page.offset)
+            .limit(page.page_size)
+        )
+        plans = (await db.execute(paged)).scalars().all()
+        return PagedResponse.create(
+            [ActionPlanResponse.model_validate(p) for p in plans], total, page
+        )
+
+    total = await approximate_total(db, query) if page.include_total else None
+    paged = apply_keyset(query, [ActionPlan.deadline, ActionPlan.id], page)
+    plans = (await db.execute(paged)).scalars().all()
+    return cursor_page(
+        [ActionPlanResponse.model_validate(p) for p in plans],
+        page,
+        key=lambda p: (p.deadline, p.id),
+        total=total,
+    )
 
 
 async def update_action_plan(
@@ -6,6 +6,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.auth.schemas import (
     DevLoginRequest,
     GoogleAuthRequest,
+    OrgTokenRequest,
+    OrgTokenResponse,
     RefreshTokenRequest,
     TokenResponse,
     UserProfile,
@@ -14,9 +16,11 @@ from src.auth.service import (
     authenticate_dev,
     authenticate_google,
     get_user_with_orgs,
+    issue_org_token,
     refresh_access_token,
     revoke_refresh_token,
 )
+from src.config import settings
 from src.core.database import get_db
 from src.core.dependencies import get_current_user
 from src.organizations.models import User
@@ -65,6 +69,27 @@ async def logout(
     return {"detail": "Logged out"}
 
 
+@router.post("/switch-org", response_model=OrgTokenResponse)
+async def switch_org(
+    body: OrgTokenRequest,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """Exchange the current access token for one scoped to an organization.
+
+    Org routes accept the scoped token's role claim without a membership query
+    while it matches the worker's cached membership, and re-read the membership
+    when the two disagree. Keep using the refresh token to renew either kind.
+    """
+    access_token, membership = await issue_org_token(db, user, body.organization_id)
+    return OrgTokenResponse(
+        access_token=access_token,
+        expires_in=settings.jwt_org_token_expire_minutes * 60,
+        organization_id=membership.organization_id,
+        role=membership.role.value,
+    )
+
+
 @router.get("/me", response_model=UserProfile)
 async def get_me(
     user: Annotated[User, Depends(get_current_user)],
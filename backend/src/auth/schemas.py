@@ -20,6 +20,18 @@ class TokenResponse(BaseModel):
     token_type: str = "bearer"
 
 
+class OrgTokenRequest(BaseModel):
+    organization_id: uuid.UUID
+
+
+class OrgTokenResponse(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_in: int
+    organization_id: uuid.UUID
+    role: str
+
+
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
     device_id: str | None = None
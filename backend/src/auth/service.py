@@ -10,8 +10,9 @@ from sqlalchemy.orm import selectinload
 
 from src.auth.models import RefreshToken
 from src.config import settings
+from src.core import auth_cache
 from src.core.enums import UserRole
-from src.core.exceptions import BadRequestError, UnauthorizedError
+from src.core.exceptions import BadRequestError, ForbiddenError, UnauthorizedError
 from src.core.security import (
     create_access_token,
     create_refresh_token,
@@ -45,6 +46,8 @@ async def _issue_tokens(
     """Create access + refresh tokens for a user."""
     user.last_login_at = datetime.now(timezone.utc)
     await db.flush()
+    # Logins are where profile fields (avatar, google_sub) change
+    auth_cache.invalidate_user(db, user.id)
 
     access_token = create_access_token(user_id=user.id, email=user.email)
     raw_refresh, token_hash = create_refresh_token()
@@ -181,6 +184,37 @@ async def get_user_with_orgs(db: AsyncSession, user: User) -> dict:
     }
 
 
+async def issue_org_token(
+    db: AsyncSession, user: User, org_id: uuid.UUID
+) -> tuple[str, UserOrganizationRole]:
+    """Mint a short-lived access token carrying the user's role in ``org_id``.
+
+    The membership is always read from the database here, never from a claim.
+    """
+    result = await db.execute(
+        select(UserOrganizationRole)
+        .join(Organization)
+        .where(
+            UserOrganizationRole.user_id == user.id,
+            UserOrganizationRole.organization_id == org_id,
+            Organization.is_active == True,  # noqa: E712
+        )
+    )
+    membership = result.scalar_one_or_none()
+    if not membership:
+        raise ForbiddenError("Not a member of this organization")
+
+    access_token = create_access_token(
+        user_id=user.id,
+        email=user.email,
+        org_id=org_id,
+        role=membership.role.value,
+        membership_version=membership.membership_version,
+        expire_minutes=settings.jwt_org_token_expire_minutes,
+    )
+    return access_token, membership
+
+
 async def refresh_access_token(
     db: AsyncSession, raw_refresh_token: str, device_id: str | None = None
 ) -> tuple[str, str]:
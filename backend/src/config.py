@@ -3,6 +3,8 @@ from urllib.parse import quote_plus
 from pydantic import computed_field
 from pydantic_settings import BaseSettings
 
+from src.core.enums import ConflictPolicy
+
 
 class Settings(BaseSettings):
     # Database (individual fields matching .env)
@@ -30,6 +32,21 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_days: int = 30
+    # Org-scoped tokens carry a role claim, checked against the membership's version
+    jwt_org_token_expire_minutes: int = 5
+
+    # Per-worker cache of users and org roles looked up by the auth dependencies
+    auth_cache_ttl_seconds: float = 30.0
+    auth_cache_max_entries: int = 10_000
+    # Accessible-node sets can run to thousands of ids apiece, so keep fewer of them
+    access_cache_max_entries: int = 1_000
+
+    # Per-worker cache of serialized form definitions (keyed on version, so no TTL)
+    form_cache_max_entries: int = 1_000
+
+    # How a field edited concurrently on two devices is settled (see responses.conflicts)
+    answer_value_conflict_policy: ConflictPolicy = ConflictPolicy.LATEST_CLIENT_TIME
+    answer_comment_conflict_policy: ConflictPolicy = ConflictPolicy.LATEST_CLIENT_TIME
 
     # Google OAuth
     google_client_id: str = ""
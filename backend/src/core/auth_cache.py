@@ -0,0 +1,143 @@
+"""Per-worker cache of what the auth dependencies look up on every request.
+
+``get_current_user`` needs the user row and ``get_current_org_member`` the
+membership row; both are cached here as plain snapshots so nothing ties a
+cached value to the session that loaded it. Writes to either row must call the
+matching ``invalidate_*`` helper. Other workers only notice after the TTL, which
+bounds how long a revoked role can still be used.
+
+``core.permissions`` keeps each scoped member's accessible nodes here as well.
+Those depend on the member's assignments and on the shape of the org's tree, so
+tree changes bump a per-org generation instead of hunting down every entry.
+"""
+
+import bisect
+import itertools
+import uuid
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.cache import TTLCache
+from src.core.enums import UserRole
+
+
+@dataclass(frozen=True, slots=True)
+class UserSnapshot:
+    id: uuid.UUID
+    email: str
+    full_name: str
+    avatar_url: str | None
+    is_active: bool
+    is_system_admin: bool
+
+
+@dataclass(frozen=True, slots=True)
+class MembershipSnapshot:
+    id: uuid.UUID
+    user_id: uuid.UUID
+    organization_id: uuid.UUID
+    role: UserRole
+    membership_version: int
+
+
+users: TTLCache[uuid.UUID, UserSnapshot] = TTLCache(
+    settings.auth_cache_max_entries, settings.auth_cache_ttl_seconds
+)
+memberships: TTLCache[tuple[uuid.UUID, uuid.UUID], MembershipSnapshot] = TTLCache(
+    settings.auth_cache_max_entries, settings.auth_cache_ttl_seconds
+)
+@dataclass(frozen=True, slots=True)
+class NodeSet:
+    """Sorted node ids packed 16 bytes apiece, instead of one UUID object per node."""
+
+    packed: bytes
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[uuid.UUID]) -> "NodeSet":
+        return cls(b"".join(sorted({node_id.bytes for node_id in ids})))
+
+    def _key(self, index: int) -> bytes:
+        return self.packed[index * 16:index * 16 + 16]
+
+    def __len__(self) -> int:
+        return len(self.packed) // 16
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        for index in range(len(self)):
+            yield uuid.UUID(bytes=self._key(index))
+
+    def __contains__(self, node_id: object) -> bool:
+        if not isinstance(node_id, uuid.UUID):
+            return False
+        index = bisect.bisect_left(range(len(self)), node_id.bytes, key=self._key)
+        return index < len(self) and self._key(index) == node_id.bytes
+
+
+# Accessible nodes per (user, org), tagged with the org's hierarchy generation when loaded
+accessible_nodes: TTLCache[tuple[uuid.UUID, uuid.UUID], tuple[int, NodeSet]] = TTLCache(
+    settings.access_cache_max_entries, settings.auth_cache_ttl_seconds
+)
+_generations: dict[uuid.UUID, int] = {}
+_generation_counter = itertools.count(1)
+
+
+def _after_commit(db: AsyncSession, drop) -> None:
+    """Drop now, and again once ``db`` commits.
+
+    A request that reads the row between our write and our commit would cache
+    the old value; the second drop clears it.
+    """
+    drop()
+    event.listen(db.sync_session, "after_commit", lambda _session: drop(), once=True)
+
+
+def invalidate_user(db: AsyncSession, user_id: uuid.UUID) -> None:
+    _after_commit(db, lambda: users.pop(user_id))
+
+
+def invalidate_membership(db: AsyncSession, user_id: uuid.UUID, org_id: uuid.UUID) -> None:
+    _after_commit(db, lambda: memberships.pop((user_id, org_id)))
+
+
+def hierarchy_generation(org_id: uuid.UUID) -> int:
+    return _generations.get(org_id, 0)
+
+
+def get_accessible_nodes(user_id: uuid.UUID, org_id: uuid.UUID) -> NodeSet | None:
+    entry = accessible_nodes.get((user_id, org_id))
+    if entry is None or entry[0] != hierarchy_generation(org_id):
+        return None
+    return entry[1]
+
+
+def set_accessible_nodes(
+    user_id: uuid.UUID, org_id: uuid.UUID, generation: int, nodes: NodeSet
+) -> None:
+    """Cache ``nodes``; ``generation`` must be read before they were loaded."""
+    accessible_nodes.set((user_id, org_id), (generation, nodes))
+
+
+def invalidate_node_access(
+    db: AsyncSession, org_id: uuid.UUID, user_id: uuid.UUID | None = None
+) -> None:
+    """Drop one member's accessible nodes, or everyone's in the org when its tree changes."""
+    if user_id is not None:
+        _after_commit(db, lambda: accessible_nodes.pop((user_id, org_id)))
+        return
+
+    def bump() -> None:
+        _generations[org_id] = next(_generation_counter)
+
+    _after_commit(db, bump)
+
+
+def stats() -> dict[str, dict]:
+    return {
+        "users": users.stats(),
+        "memberships": memberships.stats(),
+        "accessible_nodes": accessible_nodes.stats(),
+    }
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import BigInteger, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -30,3 +30,14 @@ class TimestampMixin:
         onupdate=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
+
+
+class ChangeTrackedMixin:
+    """Rows devices pull deltas of (see ``sync.service.pull``).
+
+    ``change_xid`` is the id of the transaction that last wrote the row. The
+    ``sync_stamp`` trigger sets it on every INSERT and UPDATE, so no write path
+    can forget it; any value written by the application is overwritten.
+    """
+
+    change_xid: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
@@ -0,0 +1,60 @@
+"""Gzip bodies assembled from separately compressed pieces.
+
+Each piece is deflated on its own and flushed to a byte boundary without a
+final block, so compressed pieces can be concatenated as they are and closed
+off with an empty final block. Wrapped in a gzip header and trailer, the
+result is one ordinary gzip member. A large body that differs from a cached
+one in a single piece then costs one piece's compression rather than the
+whole body's.
+
+The trailer's CRC-32 runs over the uncompressed bytes in order. Writers
+therefore start from a cached prefix and append; the prefix's CRC carries on.
+"""
+
+import dataclasses
+import struct
+import zlib
+
+# Magic, deflate, no flags, no mtime, no extra flags, unknown OS
+_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# A final fixed-Huffman block holding only end-of-block
+_FINAL_BLOCK = b"\x03\x00"
+
+
+def deflate(raw: bytes, level: int = 6) -> bytes:
+    """``raw`` as raw deflate blocks that other pieces may follow."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(raw) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Deflated:
+    """Concatenated pieces, with the CRC-32 and length of the bytes they hold."""
+
+    data: bytes = b""
+    crc: int = 0
+    size: int = 0
+
+
+EMPTY = Deflated()
+
+
+class GzipWriter:
+    def __init__(self, prefix: Deflated = EMPTY) -> None:
+        self._parts = [prefix.data]
+        self._crc = prefix.crc
+        self._size = prefix.size
+
+    def write(self, raw: bytes, deflated: bytes | None = None) -> None:
+        """Append ``raw``; pass ``deflated`` if it is already compressed (see ``deflate``)."""
+        self._parts.append(deflate(raw) if deflated is None else deflated)
+        self._crc = zlib.crc32(raw, self._crc)
+        self._size += len(raw)
+
+    def deflated(self) -> Deflated:
+        """Everything written so far, for use as a later writer's prefix."""
+        return Deflated(b"".join(self._parts), self._crc, self._size)
+
+    def gzip(self) -> bytes:
+        trailer = struct.pack("<II", self._crc, self._size & 0xFFFFFFFF)
+        return b"".join((_HEADER, *self._parts, _FINAL_BLOCK, trailer))
@@ -6,6 +6,7 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import auth_cache
 from src.core.database import get_db
 from src.core.enums import UserRole
 from src.core.exceptions import ForbiddenError, NotFoundError, UnauthorizedError
@@ -20,31 +21,122 @@ from src.organizations.models import Node, Organization, UserOrganizationRole  #
 from src.organizations.models import User  # noqa: E402
 
 
-async def get_current_user(
+async def get_token_payload(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+) -> dict:
     try:
-        payload = decode_access_token(credentials.credentials)
+        return decode_access_token(credentials.credentials)
     except ValueError:
         raise UnauthorizedError("Invalid or expired token")
 
+
+async def get_current_user(
+    payload: Annotated[dict, Depends(get_token_payload)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
     user_id = payload.get("sub")
     if not user_id:
         raise UnauthorizedError("Invalid token payload")
 
-    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
+    user_uuid = uuid.UUID(user_id)
+    cached = auth_cache.users.get(user_uuid)
+    if cached:
+        return User(
+            id=cached.id,
+            email=cached.email,
+            full_name=cached.full_name,
+            avatar_url=cached.avatar_url,
+            is_active=cached.is_active,
+            is_system_admin=cached.is_system_admin,
+        )
+
+    result = await db.execute(select(User).where(User.id == user_uuid))
     user = result.scalar_one_or_none()
     if not user or not user.is_active:
         raise UnauthorizedError("User not found or inactive")
+    auth_cache.users.set(user.id, auth_cache.UserSnapshot(
+        id=user.id,
+        email=user.email,
+        full_name=user.full_name,
+        avatar_url=user.avatar_url,
+        is_active=user.is_active,
+        is_system_admin=user.is_system_admin,
+    ))
     return user
 
 
+def _membership_claim(
+    payload: dict, user_id: uuid.UUID, org_id: uuid.UUID
+) -> UserOrganizationRole | None:
+    """The membership an org-scoped token vouches for, if the token is for ``org_id``."""
+    if payload.get("org_id") != str(org_id) or "role" not in payload or "mv" not in payload:
+        return None
+    version = payload["mv"]
+    if not isinstance(version, int):
+        return None
+    try:
+        role = UserRole(payload["role"])
+    except ValueError:
+        return None
+    return UserOrganizationRole(
+        user_id=user_id, organization_id=org_id, role=role, membership_version=version
+    )
+
+
 async def get_current_org_member(
     org_id: Annotated[uuid.UUID, Path()],
     user: Annotated[User, Depends(get_current_user)],
+    payload: Annotated[dict, Depends(get_token_payload)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> UserOrganizationRole:
+    return await _org_member(db, user, payload, org_id)
+
+
+async def get_node_org_member(
+    node_id: Annotated[uuid.UUID, Path()],
+    user: Annotated[User, Depends(get_current_user)],
+    payload: Annotated[dict, Depends(get_token_payload)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> UserOrganizationRole:
+    """The caller's membership in the organization owning ``node_id``, for node routes.
+
+    Only checks membership; callers still check access to the node itself.
+    """
+    result = await db.execute(select(Node.organization_id).where(Node.id == node_id))
+    org_id = result.scalar_one_or_none()
+    if org_id is None:
+        raise NotFoundError("Node not found")
+    return await _org_member(db, user, payload, org_id)
+
+
+async def _org_member(
+    db: AsyncSession, user: User, payload: dict, org_id: uuid.UUID
+) -> UserOrganizationRole:
+    """The caller's membership in ``org_id``.
+
+    An org-scoped token's claim is trusted without a query when it agrees with
+    this worker's cached membership (version and role). When the two disagree,
+    one of them is stale and the row is read; the claim never outlives the
+    cache entry that vouched for it, so a role change reaches every worker
+    within ``auth_cache_ttl_seconds``.
+    """
+    claimed = _membership_claim(payload, user.id, org_id)
+    cached = auth_cache.memberships.get((user.id, org_id))
+    if claimed and cached:
+        if (cached.membership_version, cached.role) == (claimed.membership_version, claimed.role):
+            return claimed
+        auth_cache.memberships.pop((user.id, org_id))
+        cached = None
+
+    if cached:
+        return UserOrganizationRole(
+            id=cached.id,
+            user_id=cached.user_id,
+            organization_id=cached.organization_id,
+            role=cached.role,
+            membership_version=cached.membership_version,
+        )
+
     result = await db.execute(
         select(UserOrganizationRole).where(
             UserOrganizationRole.user_id == user.id,
@@ -54,6 +146,13 @@ async def get_current_org_member(
     membership = result.scalar_one_or_none()
     if not membership:
         raise ForbiddenError("Not a member of this organization")
+    auth_cache.memberships.set((user.id, org_id), auth_cache.MembershipSnapshot(
+        id=membership.id,
+        user_id=membership.user_id,
+        organization_id=membership.organization_id,
+        role=membership.role,
+        membership_version=membership.membership_version,
+    ))
     return membership
 
 
@@ -68,3 +167,12 @@ def require_role(*min_roles: UserRole):
         return membership
 
     return checker
+
+
+async def require_system_admin(
+    user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    """Dependency for deployment-wide routes; org roles, even admin, don't qualify."""
+    if not user.is_system_admin:
+        raise ForbiddenError("Requires a system administrator")
+    return user
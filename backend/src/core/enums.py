@@ -29,6 +29,27 @@ class ConformityStatus(str, enum.Enum):
     NOT_APPLICABLE = "not_applicable"
 
 
+class AnswerUpsertStatus(enum.StrEnum):
+    UPSERTED = "upserted"
+    # Written, but a field conflicted with a concurrent edit; see conflict_details
+    RESOLVED = "resolved"
+    UNKNOWN_QUESTION = "unknown_question"
+
+
+class ConflictPolicy(enum.StrEnum):
+    CLIENT_WINS = "client_wins"
+    SERVER_WINS = "server_wins"
+    LATEST_CLIENT_TIME = "latest_client_time"
+
+
+class ReevaluationStatus(enum.StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    SUPERSEDED = "superseded"
+    FAILED = "failed"
+
+
 class ActionPlanStatus(str, enum.Enum):
     OPEN = "open"
     IN_PROGRESS = "in_progress"
@@ -0,0 +1,34 @@
+"""Strong ETags and ``If-None-Match`` handling for cached JSON payloads."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+# Must be revalidated on every use; for payloads that change in place
+REVALIDATE = "private, no-cache"
+# For payloads addressed by an immutable version
+IMMUTABLE = "private, max-age=31536000, immutable"
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` already names ``etag`` (weak comparison, per RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def json_response(
+    request: Request, body: bytes, etag: str, cache_control: str = REVALIDATE
+) -> Response:
+    """``body`` with its ETag, or an empty 304 when the client already has it."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,4 +1,20 @@
+import base64
+import json
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from fastapi import Query
 from pydantic import BaseModel, Field
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.core.exceptions import BadRequestError
+
+# Totals are counted up to this many rows; beyond it the count is reported as a lower bound
+APPROXIMATE_TOTAL_CAP = 10_000
 
 
 class PaginationParams(BaseModel):
@@ -27,3 +43,117 @@ class PagedResponse[T](BaseModel):
             page_size=params.page_size,
             total_pages=total_pages,
         )
+
+
+# ─── Keyset (cursor) pagination ──────────────────────────────────
+
+class CursorParams(BaseModel):
+    limit: int = Field(default=50, ge=1, le=200)
+    cursor: str | None = None
+    include_total: bool = False
+
+
+class CursorPage[T](BaseModel):
+    items: list[T]
+    limit: int
+    next_cursor: str | None = None
+    # Only filled when requested; capped at APPROXIMATE_TOTAL_CAP (see total_is_lower_bound)
+    total: int | None = None
+    total_is_lower_bound: bool = False
+
+
+def page_params(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = None,
+    include_total: bool = False,
+    page: int | None = Query(default=None, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+) -> CursorParams | PaginationParams:
+    """Query-string dependency for list endpoints.
+
+    Cursor pagination is the default; passing ``page`` opts into offset pagination.
+    """
+    if page is not None:
+        return PaginationParams(page=page, page_size=page_size)
+    return CursorParams(limit=limit, cursor=cursor, include_total=include_total)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, date) else str(v) for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[InstrumentedAttribute]) -> list[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("Cursor does not match the sort keys")
+        return [_parse(v, k.type.python_type) for v, k in zip(values, keys, strict=True)]
+    except (ValueError, TypeError) as e:
+        raise BadRequestError("Invalid cursor") from e
+
+
+def _parse(value: str, python_type: type) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    return python_type(value)
+
+
+def apply_keyset(
+    query: Select,
+    keys: Sequence[InstrumentedAttribute],
+    params: CursorParams,
+    descending: bool = False,
+) -> Select:
+    """Order ``query`` by ``keys`` and fetch the page after ``params.cursor``.
+
+    The last key must be unique (the id) so the ordering is total. One extra row
+    is fetched to tell whether another page exists — see ``cursor_page``.
+    """
+    if params.cursor:
+        after = decode_cursor(params.cursor, keys)
+        row, bound = tuple_(*keys), tuple_(*after)
+        query = query.where(row < bound if descending else row > bound)
+    order = [k.desc() if descending else k.asc() for k in keys]
+    return query.order_by(*order).limit(params.limit + 1)
+
+
+def cursor_page[T](
+    items: list[T],
+    params: CursorParams,
+    key: Callable[[T], Sequence[Any]],
+    total: tuple[int, bool] | None = None,
+) -> CursorPage[T]:
+    """Trim the look-ahead row from ``apply_keyset`` results and build the page."""
+    next_cursor = None
+    if len(items) > params.limit:
+        items = items[:params.limit]
+        next_cursor = encode_cursor(key(items[-1]))
+    return CursorPage(
+        items=items,
+        limit=params.limit,
+        next_cursor=next_cursor,
+        total=total[0] if total else None,
+        total_is_lower_bound=total[1] if total else False,
+    )
+
+
+async def approximate_total(db: AsyncSession, query: Select) -> tuple[int, bool]:
+    """Count rows matched by ``query``, stopping at APPROXIMATE_TOTAL_CAP.
+
+    Returns (count, is_lower_bound). ``query`` must be unordered and unpaginated.
+    """
+    capped = query.limit(APPROXIMATE_TOTAL_CAP + 1).subquery()
+    count = (await db.execute(select(func.count()).select_from(capped))).scalar_one()
+    if count > APPROXIMATE_TOTAL_CAP:
+        return APPROXIMATE_TOTAL_CAP, True
+    return count, False
+
+
+async def exact_total(db: AsyncSession, query: Select) -> int:
+    return (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
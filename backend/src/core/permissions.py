@@ -1,8 +1,13 @@
+import hashlib
 import uuid
+from collections.abc import Iterable
 
-from sqlalchemy import select, text
+from sqlalchemy import ColumnElement, any_, bindparam, select, text, true
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core import auth_cache
+from src.core.auth_cache import NodeSet
 from src.core.enums import UserRole
 
 
@@ -17,6 +22,7 @@ async def user_can_access_node(
 
     Admins can access everything. Managers can access everything in their org.
     Supervisors and end_users can only access nodes they are assigned to (and descendants).
+    Descent is tested on the nested-set interval (see organizations.hierarchy).
     """
     if role in (UserRole.ADMIN, UserRole.MANAGER):
         return True
@@ -29,7 +35,8 @@ async def user_can_access_node(
             JOIN nodes target ON target.id = :target_node_id
             WHERE una.user_id = :user_id
               AND assigned.organization_id = :org_id
-              AND target.materialized_path LIKE assigned.materialized_path || '%'
+              AND target.organization_id = :org_id
+              AND target.tree_left BETWEEN assigned.tree_left AND assigned.tree_right
         )
     """)
     result = await db.execute(
@@ -39,24 +46,83 @@ async def user_can_access_node(
     return bool(result.scalar())
 
 
+async def user_can_access_nodes(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    node_ids: Iterable[uuid.UUID],
+    org_id: uuid.UUID,
+    role: UserRole,
+) -> dict[uuid.UUID, bool]:
+    """``user_can_access_node`` for many nodes at once, in a single query."""
+    node_ids = list(dict.fromkeys(node_ids))
+    if role in (UserRole.ADMIN, UserRole.MANAGER):
+        return dict.fromkeys(node_ids, True)
+    if not node_ids:
+        return {}
+
+    query = text("""
+        SELECT DISTINCT target.id
+        FROM nodes target
+        JOIN nodes assigned ON assigned.organization_id = target.organization_id
+                           AND target.tree_left BETWEEN assigned.tree_left AND assigned.tree_right
+        JOIN user_node_assignments una ON una.node_id = assigned.id
+        WHERE target.id = ANY(:node_ids)
+          AND target.organization_id = :org_id
+          AND una.user_id = :user_id
+    """).bindparams(bindparam("node_ids", type_=ARRAY(UUID(as_uuid=True))))
+    result = await db.execute(
+        query,
+        {"user_id": user_id, "node_ids": node_ids, "org_id": org_id},
+    )
+    allowed = {row[0] for row in result.fetchall()}
+    return {node_id: node_id in allowed for node_id in node_ids}
+
+
 async def get_accessible_node_ids(
     db: AsyncSession,
     user_id: uuid.UUID,
     org_id: uuid.UUID,
     role: UserRole,
-) -> list[uuid.UUID] | None:
-    """Get all node IDs accessible to a user. Returns None if user has access to all nodes."""
+) -> NodeSet | None:
+    """Get all node IDs accessible to a user. Returns None if user has access to all nodes.
+
+    Cached per worker (see ``auth_cache``); pass the result to ``node_filter`` to scope a query.
+    """
     if role in (UserRole.ADMIN, UserRole.MANAGER):
         return None  # Access to all
 
+    cached = auth_cache.get_accessible_nodes(user_id, org_id)
+    if cached is not None:
+        return cached
+    generation = auth_cache.hierarchy_generation(org_id)
+
+    # One index range scan on (organization_id, tree_left) per assigned subtree
     query = text("""
         SELECT DISTINCT n.id
-        FROM nodes n
-        JOIN user_node_assignments una ON una.user_id = :user_id
+        FROM user_node_assignments una
         JOIN nodes assigned ON una.node_id = assigned.id
-        WHERE n.organization_id = :org_id
-          AND n.materialized_path LIKE assigned.materialized_path || '%'
+        JOIN nodes n ON n.organization_id = assigned.organization_id
+                    AND n.tree_left BETWEEN assigned.tree_left AND assigned.tree_right
+        WHERE una.user_id = :user_id
+          AND assigned.organization_id = :org_id
           AND n.is_active = true
     """)
     result = await db.execute(query, {"user_id": user_id, "org_id": org_id})
-    return [row[0] for row in result.fetchall()]
+    nodes = NodeSet.from_ids(row[0] for row in result.fetchall())
+    auth_cache.set_accessible_nodes(user_id, org_id, generation, nodes)
+    return nodes
+
+
+def node_filter(column: ColumnElement, nodes: NodeSet | None) -> ColumnElement[bool]:
+    """Restrict ``column`` to ``nodes``, sent as a single uuid[] parameter (None allows all)."""
+    if nodes is None:
+        return true()
+    ids = bindparam("node_ids", list(nodes), type_=ARRAY(UUID(as_uuid=True)), unique=True)
+    return column == any_(ids)
+
+
+def scope_key(nodes: NodeSet | None) -> str:
+    """A short fingerprint of ``nodes``, equal for equal sets ("all" for None)."""
+    if nodes is None:
+        return "all"
+    return hashlib.blake2b(nodes.packed, digest_size=16).hexdigest()
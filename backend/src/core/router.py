@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from src.core import auth_cache
+from src.core.dependencies import require_system_admin
+from src.forms import node_forms_cache, payload_cache
+from src.organizations.models import User
+from src.sync import bundle
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/admin/cache-stats")
+async def cache_stats(_: Annotated[User, Depends(require_system_admin)]):
+    """This worker's cache sizes and hit rates, across every organization."""
+    return {
+        **auth_cache.stats(),
+        "form_payloads": payload_cache.payloads.stats(),
+        "node_forms": node_forms_cache.payloads.stats(),
+        **bundle.stats(),
+    }
@@ -0,0 +1,29 @@
+"""Ranked substring search backed by ``pg_trgm``.
+
+Searched columns carry GIN ``gin_trgm_ops`` indexes, which serve both
+``ILIKE '%term%'`` and the word-similarity operator ``<%``; the two are OR-ed so
+a query matches exact substrings as well as near misses ("compresor" finds
+"Compressor 3"), and either way the planner can use the index instead of
+scanning the org's rows.
+"""
+
+from sqlalchemy import ColumnElement, func, literal, or_
+
+# Terms shorter than a trigram can't use the index for fuzzy matching; substring only
+MIN_FUZZY_LENGTH = 3
+
+
+def trigram_match(term: str, *columns: ColumnElement) -> ColumnElement[bool]:
+    """Rows where any of ``columns`` contains ``term`` or a word similar to it."""
+    term = term.strip()
+    clauses = [column.icontains(term, autoescape=True) for column in columns]
+    if len(term) >= MIN_FUZZY_LENGTH:
+        clauses += [literal(term).op("<%")(column) for column in columns]
+    return or_(*clauses)
+
+
+def trigram_rank(term: str, *columns: ColumnElement) -> ColumnElement[float]:
+    """Best word similarity of ``term`` against ``columns`` (NULLs rank 0), for ORDER BY."""
+    term = term.strip()
+    scores = [func.coalesce(func.word_similarity(term, column), 0.0) for column in columns]
+    return func.greatest(*scores) if len(scores) > 1 else scores[0]
@@ -12,9 +12,11 @@ def create_access_token(
     email: str,
     org_id: uuid.UUID | None = None,
     role: str | None = None,
+    membership_version: int | None = None,
+    expire_minutes: int | None = None,
 ) -> str:
     now = datetime.now(timezone.utc)
-    expire = now + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    expire = now + timedelta(minutes=expire_minutes or settings.jwt_access_token_expire_minutes)
     payload = {
         "sub": str(user_id),
         "email": email,
@@ -26,6 +28,8 @@ def create_access_token(
         payload["org_id"] = str(org_id)
     if role:
         payload["role"] = role
+    if membership_version is not None:
+        payload["mv"] = membership_version
     return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
@@ -1,16 +1,34 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.base_model import Base, TimestampMixin, UUIDMixin
+from src.core.base_model import Base, ChangeTrackedMixin, TimestampMixin, UUIDMixin
 from src.core.enums import FormFrequency, QuestionType
 
 
-class Form(UUIDMixin, TimestampMixin, Base):
+class Form(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "forms"
+    __table_args__ = (
+        Index(
+            "ix_forms_org_active_updated",
+            "organization_id", "updated_at", "id",
+            postgresql_where=text("is_active"),
+        ),
+        # Trigram indexes for core.search (substring and fuzzy matching)
+        Index(
+            "ix_forms_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_forms_code_trgm", "code",
+            postgresql_using="gin", postgresql_ops={"code": "gin_trgm_ops"},
+        ),
+        # Delta pulls; sections, questions and assignments are reached through their form
+        Index("ix_forms_org_change", "organization_id", "change_xid", "id"),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
@@ -42,9 +60,27 @@ class Form(UUIDMixin, TimestampMixin, Base):
     )
 
 
-class FormNodeAssignment(UUIDMixin, Base):
+class FormSnapshot(UUIDMixin, Base):
+    """The full definition of a form as published at ``version``. Written once, never updated."""
+
+    __tablename__ = "form_snapshots"
+    __table_args__ = (UniqueConstraint("form_id", "version"),)
+
+    form_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False
+    )
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    # A serialized FormDetailResponse; large documents are compressed by TOAST
+    definition: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class FormNodeAssignment(UUIDMixin, ChangeTrackedMixin, Base):
     __tablename__ = "form_node_assignments"
-    __table_args__ = (UniqueConstraint("form_id", "node_id"),)
+    __table_args__ = (
+        UniqueConstraint("form_id", "node_id"),
+        Index("ix_form_node_assignments_node_id", "node_id"),
+    )
 
     form_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False
@@ -81,8 +117,9 @@ class CompositeFormChild(UUIDMixin, Base):
     )
 
 
-class Section(UUIDMixin, TimestampMixin, Base):
+class Section(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "sections"
+    __table_args__ = (Index("ix_sections_form_sort", "form_id", "sort_order"),)
 
     form_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False
@@ -98,8 +135,9 @@ class Section(UUIDMixin, TimestampMixin, Base):
     )
 
 
-class Question(UUIDMixin, TimestampMixin, Base):
+class Question(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "questions"
+    __table_args__ = (Index("ix_questions_section_sort", "section_id", "sort_order"),)
 
     section_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("sections.id", ondelete="CASCADE"), nullable=False
@@ -0,0 +1,37 @@
+"""Serialized ``GET /nodes/{node_id}/forms`` payloads, cached per worker.
+
+Which forms apply at a node depends on the node's ancestors and on the org's
+published forms and their assignments. The org row carries a version counter
+for each (``hierarchy_version``, ``forms_version``), bumped in the same
+transaction as the change, so entries are keyed on both and any worker can tell
+from one row whether its copy is current. Stale entries are never read again
+and simply age out of the LRU.
+"""
+
+import uuid
+
+from src.config import settings
+from src.core.cache import TTLCache
+from src.core.etag import make_etag
+
+type Key = tuple[uuid.UUID, int, int, uuid.UUID]
+
+payloads: TTLCache[Key, tuple[bytes, str]] = TTLCache(settings.form_cache_max_entries)
+
+
+def get(
+    org_id: uuid.UUID, hierarchy_version: int, forms_version: int, node_id: uuid.UUID
+) -> tuple[bytes, str] | None:
+    return payloads.get((org_id, hierarchy_version, forms_version, node_id))
+
+
+def put(
+    org_id: uuid.UUID,
+    hierarchy_version: int,
+    forms_version: int,
+    node_id: uuid.UUID,
+    body: bytes,
+) -> tuple[bytes, str]:
+    entry = (body, make_etag(body))
+    payloads.set((org_id, hierarchy_version, forms_version, node_id), entry)
+    return entry
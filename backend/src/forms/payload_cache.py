@@ -0,0 +1,48 @@
+"""Serialized ``GET /forms/{form_id}`` payloads, cached per worker.
+
+Entries are keyed on the form's ``(version, updated_at)``, and every mutation in
+``forms.service`` bumps ``updated_at`` (sections, questions, child links and
+node assignments included). Any worker can therefore tell from the form row
+alone whether its copy is current, and a cached payload costs one primary-key
+lookup. ``invalidate`` only frees the stale entry early.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.core.cache import TTLCache
+from src.core.etag import make_etag
+
+
+@dataclass(frozen=True, slots=True)
+class FormPayload:
+    version: int
+    updated_at: datetime
+    body: bytes
+    etag: str
+
+
+payloads: TTLCache[uuid.UUID, FormPayload] = TTLCache(settings.form_cache_max_entries)
+
+
+def get(form_id: uuid.UUID, version: int, updated_at: datetime) -> FormPayload | None:
+    payload = payloads.get(form_id)
+    if payload is None or (payload.version, payload.updated_at) != (version, updated_at):
+        return None
+    return payload
+
+
+def put(form_id: uuid.UUID, version: int, updated_at: datetime, body: bytes) -> FormPayload:
+    payload = FormPayload(version, updated_at, body, make_etag(body))
+    payloads.set(form_id, payload)
+    return payload
+
+
+def invalidate(db: AsyncSession, form_id: uuid.UUID) -> None:
+    payloads.pop(form_id)
+    event.listen(db.sync_session, "after_commit", lambda _session: payloads.pop(form_id), once=True)
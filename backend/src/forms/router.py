@@ -1,19 +1,38 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
-from src.core.dependencies import get_current_org_member, get_current_user, require_role
+from src.core.dependencies import (
+    get_current_org_member,
+    get_current_user,
+    get_node_org_member,
+    require_role,
+)
 from src.core.enums import UserRole
+from src.core.etag import IMMUTABLE, json_response, make_etag
+from src.core.exceptions import NotFoundError
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    page_params,
+)
+from src.core.permissions import user_can_access_node
 from src.forms import service
 from src.forms.schemas import (
+    BuilderOperations,
+    BuilderOperationsResult,
     CompositeChildAdd,
+    CompositeFormNode,
     FormCreate,
     FormDetailResponse,
     FormNodeAssign,
     FormResponse,
+    FormSearchResult,
     FormUpdate,
     QuestionCreate,
     QuestionResponse,
@@ -24,22 +43,38 @@ from src.forms.schemas import (
     SectionUpdate,
 )
 from src.organizations.models import User, UserOrganizationRole
+from src.responses import reevaluation
 
 router = APIRouter(tags=["forms"])
 
 
 # ─── Forms ────────────────────────────────────────────────────────
 
-@router.get("/organizations/{org_id}/forms", response_model=list[FormResponse])
+@router.get(
+    "/organizations/{org_id}/forms",
+    response_model=CursorPage[FormResponse] | PagedResponse[FormResponse],
+)
 async def list_forms(
     org_id: uuid.UUID,
     _: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    page: Annotated[CursorParams | PaginationParams, Depends(page_params)],
     is_published: bool | None = None,
     is_composite: bool | None = None,
     search: str | None = None,
 ):
-    return await service.list_forms(db, org_id, is_published, is_composite, search)
+    return await service.list_forms(db, org_id, is_published, is_composite, search, page)
+
+
+@router.get("/organizations/{org_id}/forms/search", response_model=list[FormSearchResult])
+async def search_forms(
+    org_id: uuid.UUID,
+    _: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=50),
+):
+    return await service.search_forms(db, org_id, q, limit)
 
 
 @router.post("/organizations/{org_id}/forms", response_model=FormResponse)
@@ -57,16 +92,25 @@ async def create_form(
 @router.get("/forms/{form_id}", response_model=FormDetailResponse)
 async def get_form(
     form_id: uuid.UUID,
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    payload = await service.get_form_payload(db, form_id)
+    return json_response(request, payload.body, payload.etag)
+
+
+@router.get("/forms/{form_id}/versions/{version}", response_model=FormDetailResponse)
+async def get_form_version(
+    form_id: uuid.UUID,
+    version: int,
+    request: Request,
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    form = await service.get_form(db, form_id)
-    return FormDetailResponse(
-        **{c.key: getattr(form, c.key) for c in form.__table__.columns},
-        sections=[s for s in form.sections if s.is_active],
-        child_form_ids=[cl.child_form_id for cl in form.child_links],
-        node_ids=[na.node_id for na in form.node_assignments if na.is_active],
-    )
+    snapshot = await service.get_snapshot(db, form_id, version)
+    body = service.snapshot_json(snapshot)
+    return json_response(request, body, make_etag(body), IMMUTABLE)
 
 
 @router.put("/forms/{form_id}", response_model=FormResponse)
@@ -107,6 +151,22 @@ async def duplicate_form(
     return await service.duplicate_form(db, form_id, user.id)
 
 
+@router.post("/forms/{form_id}/operations", response_model=BuilderOperationsResult)
+async def apply_operations(
+    form_id: uuid.UUID,
+    body: BuilderOperations,
+    background_tasks: BackgroundTasks,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    result = await service.apply_operations(db, form_id, body.operations)
+    # Background tasks run before get_db's teardown commits; the jobs must be visible
+    await db.commit()
+    for question_id in result.reevaluating:
+        background_tasks.add_task(reevaluation.run_pending, question_id)
+    return result
+
+
 # ─── Sections ─────────────────────────────────────────────────────
 
 @router.get("/forms/{form_id}/sections", response_model=list[SectionResponse])
@@ -148,15 +208,15 @@ async def delete_section(
     return {"detail": "Section deactivated"}
 
 
-@router.put("/forms/{form_id}/sections/reorder")
+@router.put("/forms/{form_id}/sections/reorder", response_model=list[ReorderItem])
 async def reorder_sections(
     form_id: uuid.UUID,
     body: list[ReorderItem],
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    dense: bool = False,
 ):
-    await service.reorder_sections(db, form_id, body)
-    return {"detail": "Reordered"}
+    return await service.reorder_sections(db, form_id, body, dense)
 
 
 # ─── Questions ────────────────────────────────────────────────────
@@ -175,10 +235,16 @@ async def create_question(
 async def update_question(
     question_id: uuid.UUID,
     body: QuestionUpdate,
+    background_tasks: BackgroundTasks,
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    return await service.update_question(db, question_id, body)
+    question = await service.update_question(db, question_id, body)
+    # Re-checks stored answers if the edit changed the conformity rule. Background tasks
+    # run before get_db's teardown commits, so commit the job first
+    await db.commit()
+    background_tasks.add_task(reevaluation.run_pending, question_id)
+    return question
 
 
 @router.delete("/questions/{question_id}")
@@ -191,19 +257,31 @@ async def delete_question(
     return {"detail": "Question deactivated"}
 
 
-@router.put("/sections/{section_id}/questions/reorder")
+@router.put("/sections/{section_id}/questions/reorder", response_model=list[ReorderItem])
 async def reorder_questions(
     section_id: uuid.UUID,
     body: list[ReorderItem],
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    dense: bool = False,
 ):
-    await service.reorder_questions(db, section_id, body)
-    return {"detail": "Reordered"}
+    return await service.reorder_questions(db, section_id, body, dense)
 
 
 # ─── Composite ────────────────────────────────────────────────────
 
+@router.get("/forms/{form_id}/tree", response_model=CompositeFormNode)
+async def get_composite_tree(
+    form_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    max_depth: int = Query(
+        default=service.COMPOSITE_MAX_DEPTH, ge=0, le=service.COMPOSITE_MAX_DEPTH
+    ),
+):
+    return await service.get_composite_tree(db, form_id, max_depth)
+
+
 @router.post("/forms/{form_id}/children")
 async def add_child_form(
     form_id: uuid.UUID,
@@ -237,3 +315,30 @@ async def assign_to_nodes(
 ):
     node_ids = await service.assign_form_to_nodes(db, form_id, body)
     return {"detail": "Assigned", "node_ids": node_ids}
+
+
+@router.post("/forms/{form_id}/node-assignments/remove")
+async def unassign_from_nodes(
+    form_id: uuid.UUID,
+    body: FormNodeAssign,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    node_ids = await service.unassign_form_from_nodes(db, form_id, body)
+    return {"detail": "Unassigned", "node_ids": node_ids}
+
+
+@router.get("/nodes/{node_id}/forms", response_model=list[FormResponse])
+async def list_node_forms(
+    node_id: uuid.UUID,
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_node_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    if not await user_can_access_node(
+        db, user.id, node_id, membership.organization_id, membership.role
+    ):
+        raise NotFoundError("Node not found")
+    body, etag = await service.get_node_forms(db, node_id)
+    return json_response(request, body, etag)
@@ -1,13 +1,24 @@
 import uuid
 from datetime import datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 from src.core.enums import FormFrequency, QuestionType
+from src.responses.conformity import check_pattern
 
 
 # ─── Questions ────────────────────────────────────────────────────
 
+def _check_reference_value(value: dict | None) -> dict | None:
+    if value is not None and isinstance(value.get("pattern"), str):
+        check_pattern(value["pattern"])
+    return value
+
+
+ReferenceValue = Annotated[dict | None, AfterValidator(_check_reference_value)]
+
+
 class QuestionCreate(BaseModel):
     question_type: QuestionType
     text: str
@@ -17,7 +28,7 @@ class QuestionCreate(BaseModel):
     requires_comment: bool = False
     sort_order: int = 0
     config: dict = {}
-    reference_value: dict | None = None
+    reference_value: ReferenceValue = None
 
 
 class QuestionUpdate(BaseModel):
@@ -29,7 +40,7 @@ class QuestionUpdate(BaseModel):
     requires_comment: bool | None = None
     sort_order: int | None = None
     config: dict | None = None
-    reference_value: dict | None = None
+    reference_value: ReferenceValue = None
 
 
 class QuestionResponse(BaseModel):
@@ -111,6 +122,10 @@ class FormResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class FormSearchResult(FormResponse):
+    rank: float
+
+
 class FormDetailResponse(FormResponse):
     sections: list[SectionResponse] = []
     child_form_ids: list[uuid.UUID] = []
@@ -124,6 +139,13 @@ class CompositeChildAdd(BaseModel):
     sort_order: int = 0
 
 
+class CompositeFormNode(FormResponse):
+    """A form in a resolved composite tree, with its sections and expanded children."""
+
+    sections: list[SectionResponse] = []
+    children: list["CompositeFormNode"] = []
+
+
 class ReorderItem(BaseModel):
     id: uuid.UUID
     sort_order: int
@@ -131,3 +153,88 @@ class ReorderItem(BaseModel):
 
 class FormNodeAssign(BaseModel):
     node_ids: list[uuid.UUID]
+    # Fan out to every active node in each listed node's subtree (the listed nodes included)
+    include_descendants: bool = False
+    # With include_descendants, only nodes of this type (e.g. every "line" under a plant)
+    node_type: str | None = None
+
+
+# ─── Builder Operations ───────────────────────────────────────────
+# Sections and questions are referenced by id, or by the temp_id of one created earlier
+# in the same batch.
+
+class OperationReorderItem(BaseModel):
+    id: str
+    sort_order: int
+
+
+class CreateSectionOp(BaseModel):
+    op: Literal["create_section"]
+    temp_id: str
+    data: SectionCreate
+
+
+class UpdateSectionOp(BaseModel):
+    op: Literal["update_section"]
+    id: str
+    data: SectionUpdate
+
+
+class DeleteSectionOp(BaseModel):
+    op: Literal["delete_section"]
+    id: str
+
+
+class ReorderSectionsOp(BaseModel):
+    op: Literal["reorder_sections"]
+    items: list[OperationReorderItem]
+    dense: bool = False
+
+
+class CreateQuestionOp(BaseModel):
+    op: Literal["create_question"]
+    temp_id: str
+    section_id: str
+    data: QuestionCreate
+
+
+class UpdateQuestionOp(BaseModel):
+    op: Literal["update_question"]
+    id: str
+    data: QuestionUpdate
+
+
+class DeleteQuestionOp(BaseModel):
+    op: Literal["delete_question"]
+    id: str
+
+
+class ReorderQuestionsOp(BaseModel):
+    op: Literal["reorder_questions"]
+    section_id: str
+    items: list[OperationReorderItem]
+    dense: bool = False
+
+
+BuilderOperation = Annotated[
+    CreateSectionOp
+    | UpdateSectionOp
+    | DeleteSectionOp
+    | ReorderSectionsOp
+    | CreateQuestionOp
+    | UpdateQuestionOp
+    | DeleteQuestionOp
+    | ReorderQuestionsOp,
+    Field(discriminator="op"),
+]
+
+
+class BuilderOperations(BaseModel):
+    operations: list[BuilderOperation] = Field(max_length=5000)
+
+
+class BuilderOperationsResult(BaseModel):
+    id_map: dict[str, uuid.UUID]
+    sections: list[SectionResponse]
+    # Questions whose rule changed; their stored answers are being re-evaluated
+    reevaluating: list[uuid.UUID] = []
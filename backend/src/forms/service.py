@@ -1,27 +1,173 @@
+import dataclasses
+import json
 import uuid
-from datetime import datetime, timezone
+from collections.abc import Container
+from datetime import UTC, datetime
 
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    all_,
+    and_,
+    column,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from src.core.auth_cache import NodeSet
 from src.core.exceptions import BadRequestError, NotFoundError
-from src.forms.models import CompositeFormChild, Form, FormNodeAssignment, Question, Section
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    apply_keyset,
+    approximate_total,
+    cursor_page,
+    exact_total,
+)
+from src.core.permissions import node_filter
+from src.core.search import trigram_match, trigram_rank
+from src.forms import node_forms_cache, payload_cache
+from src.forms.models import (
+    CompositeFormChild,
+    Form,
+    FormNodeAssignment,
+    FormSnapshot,
+    Question,
+    Section,
+)
+from src.forms.payload_cache import FormPayload
+from src.organizations import hierarchy
+from src.organizations.models import Node, Organization
 from src.forms.schemas import (
+    BuilderOperation,
+    BuilderOperationsResult,
     CompositeChildAdd,
+    CompositeFormNode,
+    CreateQuestionOp,
+    CreateSectionOp,
+    DeleteQuestionOp,
+    DeleteSectionOp,
     FormCreate,
+    FormDetailResponse,
     FormNodeAssign,
+    FormResponse,
+    FormSearchResult,
     FormUpdate,
     QuestionCreate,
+    QuestionResponse,
     QuestionUpdate,
     ReorderItem,
+    ReorderQuestionsOp,
+    ReorderSectionsOp,
     SectionCreate,
+    SectionResponse,
     SectionUpdate,
+    UpdateQuestionOp,
+    UpdateSectionOp,
 )
+from src.responses import reevaluation
 
 
 # ─── Forms ────────────────────────────────────────────────────────
 
+async def _forms_changed(db: AsyncSession, org_id: uuid.UUID) -> None:
+    """Bump the org's forms version so every worker's applicable-forms lists go stale."""
+    await db.execute(
+        update(Organization)
+        .where(Organization.id == org_id)
+        .values(forms_version=Organization.forms_version + 1)
+    )
+
+
+async def _form_changed(db: AsyncSession, form_id: uuid.UUID) -> None:
+    """Bump the form's updated_at so every worker's cached payload for it goes stale."""
+    result = await db.execute(
+        update(Form)
+        .where(Form.id == form_id)
+        .values(updated_at=datetime.now(UTC))
+        .returning(Form.organization_id, Form.is_published)
+    )
+    payload_cache.invalidate(db, form_id)
+    # Drafts don't appear in applicable-forms lists, so editing one leaves them alone
+    org_id, is_published = result.one()
+    if is_published:
+        await _forms_changed(db, org_id)
+
+
+async def _reorder(
+    db: AsyncSession,
+    model: type[Section] | type[Question],
+    parent: ColumnElement,
+    parent_id: uuid.UUID,
+    items: list[ReorderItem],
+    dense: bool,
+) -> list[ReorderItem]:
+    """Apply ``items`` to the active children of one parent in a single UPDATE ... FROM.
+
+    With ``dense`` every active child is renumbered 0..n-1 in the resulting order (moved
+    items first on ties). Returns the rows whose sort_order was written; raises if any
+    item is not an active child of the parent, rolling the request back.
+    """
+    orders = {item.id: item.sort_order for item in items}
+    scope = (parent == parent_id, model.is_active == True)  # noqa: E712
+    requested = None
+    if orders:
+        requested = values(
+            column("id", model.id.type), column("sort_order", Integer()), name="requested"
+        ).data(list(orders.items()))
+
+    if dense:
+        order_by = [model.sort_order, model.id]
+        if requested is not None:
+            new_order = func.coalesce(requested.c.sort_order, model.sort_order)
+            order_by = [new_order, requested.c.id.is_(None), *order_by]
+        rank = func.row_number().over(order_by=order_by) - 1
+        ranked = select(model.id, rank.label("sort_order")).where(*scope)
+        if requested is not None:
+            ranked = ranked.outerjoin(requested, requested.c.id == model.id)
+        source = ranked.subquery("ranked")
+    elif requested is not None:
+        source = requested
+    else:
+        return []
+
+    result = await db.execute(
+        update(model)
+        .where(model.id == source.c.id, *scope)
+        .values(sort_order=source.c.sort_order)
+        .returning(model.id, model.sort_order)
+        .execution_options(synchronize_session=False)
+    )
+    written = [ReorderItem(id=row.id, sort_order=row.sort_order) for row in result]
+    missing = orders.keys() - {item.id for item in written}
+    if missing:
+        raise BadRequestError(f"{model.__name__}s not found under this parent: {missing}")
+    return written
+
+
+async def _section_changed(db: AsyncSession, section_id: uuid.UUID) -> None:
+    result = await db.execute(select(Section.form_id).where(Section.id == section_id))
+    form_id = result.scalar_one_or_none()
+    if form_id:
+        await _form_changed(db, form_id)
+
+
 async def create_form(
     db: AsyncSession, org_id: uuid.UUID, data: FormCreate, user_id: uuid.UUID
 ) -> Form:
@@ -55,92 +201,281 @@ async def get_form(db: AsyncSession, form_id: uuid.UUID) -> Form:
     return form
 
 
+def _form_detail(form: Form, sections: list) -> FormDetailResponse:
+    return FormDetailResponse(
+        **{c.key: getattr(form, c.key) for c in form.__table__.columns},
+        sections=sections,
+        child_form_ids=[cl.child_form_id for cl in form.child_links],
+        node_ids=[na.node_id for na in form.node_assignments if na.is_active],
+    )
+
+
+async def _require_form(db: AsyncSession, form_id: uuid.UUID) -> None:
+    """``get_form``'s existence check, without loading the form."""
+    result = await db.execute(
+        select(Form.id).where(Form.id == form_id, Form.is_active == True)  # noqa: E712
+    )
+    if not result.first():
+        raise NotFoundError("Form not found")
+
+
+async def get_form_payload(db: AsyncSession, form_id: uuid.UUID) -> FormPayload:
+    """The serialized ``FormDetailResponse``, rebuilt only when the form has changed."""
+    result = await db.execute(
+        select(Form.version, Form.updated_at)
+        .where(Form.id == form_id, Form.is_active == True)  # noqa: E712
+    )
+    stamp = result.one_or_none()
+    if not stamp:
+        raise NotFoundError("Form not found")
+    cached = payload_cache.get(form_id, stamp.version, stamp.updated_at)
+    if cached:
+        return cached
+
+    form = await get_form(db, form_id)
+    detail = _form_detail(form, [s for s in form.sections if s.is_active])
+    # Keyed on what was actually serialized, which may be newer than ``stamp``
+    return payload_cache.put(
+        form_id, form.version, form.updated_at, detail.model_dump_json().encode()
+    )
+
+
 async def list_forms(
     db: AsyncSession,
     org_id: uuid.UUID,
     is_published: bool | None = None,
     is_composite: bool | None = None,
     search: str | None = None,
-) -> list[Form]:
+    page: CursorParams | PaginationParams | None = None,
+) -> CursorPage[FormResponse] | PagedResponse[FormResponse]:
+    """List active forms, most recently updated first, keyset-paginated on (updated_at, id)."""
+    page = page or CursorParams()
     query = select(Form).where(Form.organization_id == org_id, Form.is_active == True)  # noqa: E712
     if is_published is not None:
         query = query.where(Form.is_published == is_published)
     if is_composite is not None:
         query = query.where(Form.is_composite == is_composite)
     if search:
-        query = query.where(Form.title.ilike(f"%{search}%"))
-    query = query.order_by(Form.updated_at.desc())
-    result = await db.execute(query)
-    return list(result.scalars().all())
+        query = query.where(trigram_match(search, Form.title, Form.code))
+
+    if isinstance(page, PaginationParams):
+        total = await exact_total(db, query)
+        paged = (
+            query.order_by(Form.updated_at.desc(), Form.id.desc())
+            .offset(page.offset)
+            .limit(page.page_size)
+        )
+        forms = (await db.execute(paged)).scalars().all()
+        return PagedResponse.create([FormResponse.model_validate(f) for f in forms], total, page)
+
+    total = await approximate_total(db, query) if page.include_total else None
+    paged = apply_keyset(query, [Form.updated_at, Form.id], page, descending=True)
+    forms = (await db.execute(paged)).scalars().all()
+    return cursor_page(
+        [FormResponse.model_validate(f) for f in forms],
+        page,
+        key=lambda f: (f.updated_at, f.id),
+        total=total,
+    )
+
+
+async def search_forms(
+    db: AsyncSession, org_id: uuid.UUID, term: str, limit: int = 20
+) -> list[FormSearchResult]:
+    """Active forms whose title or code matches ``term``, best match first."""
+    rank = trigram_rank(term, Form.title, Form.code).label("rank")
+    result = await db.execute(
+        select(Form, rank)
+        .where(
+            Form.organization_id == org_id,
+            Form.is_active == True,  # noqa: E712
+            trigram_match(term, Form.title, Form.code),
+        )
+        .order_by(rank.desc(), Form.title, Form.id)
+        .limit(limit)
+    )
+    return [
+        FormSearchResult(**FormResponse.model_validate(form).model_dump(), rank=rank)
+        for form, rank in result
+    ]
 
 
 async def update_form(db: AsyncSession, form_id: uuid.UUID, data: FormUpdate) -> Form:
     form = await get_form(db, form_id)
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(form, field, value)
+    payload_cache.invalidate(db, form_id)
+    if form.is_published:
+        await _forms_changed(db, form.organization_id)
     return form
 
 
 async def publish_form(db: AsyncSession, form_id: uuid.UUID) -> Form:
     form = await get_form(db, form_id)
     form.is_published = True
-    form.published_at = datetime.now(timezone.utc)
+    form.published_at = datetime.now(UTC)
     form.version += 1
+    payload_cache.invalidate(db, form_id)
+    await _forms_changed(db, form.organization_id)
+    await write_snapshot(db, form)
+    await _restamp_definition(db, form_id)
     return form
 
 
-async def duplicate_form(
-    db: AsyncSession, form_id: uuid.UUID, user_id: uuid.UUID
-) -> Form:
-    original = await get_form(db, form_id)
-    new_form = Form(
-        organization_id=original.organization_id,
-        title=f"{original.title} (Copy)",
-        description=original.description,
-        code=None,
-        is_composite=original.is_composite,
-        expected_frequency=original.expected_frequency,
-        created_by=user_id,
-    )
-    db.add(new_form)
-    await db.flush()
+async def _restamp_definition(db: AsyncSession, form_id: uuid.UUID) -> None:
+    """Re-stamp a form's sections, questions and assignments for delta pulls.
+
+    Pulls only send published forms, so a draft's rows were never sent and may be
+    older than a device's watermark. The sync_stamp trigger sets change_xid on any
+    UPDATE, so a no-op one is enough.
+    """
+    sections = select(Section.id).where(Section.form_id == form_id)
+    for model, where in (
+        (Section, Section.form_id == form_id),
+        (Question, Question.section_id.in_(sections)),
+        (FormNodeAssignment, FormNodeAssignment.form_id == form_id),
+    ):
+        await db.execute(
+            update(model)
+            .where(where)
+            .values(change_xid=model.change_xid)
+            .execution_options(synchronize_session=False)
+        )
 
-    # Copy sections and questions
-    for section in original.sections:
+
+# ─── Snapshots ────────────────────────────────────────────────────
+
+async def write_snapshot(db: AsyncSession, form: Form) -> None:
+    """Store ``form`` (loaded by ``get_form``) as the snapshot of its current version.
+
+    Only active sections and questions are kept. An existing snapshot for the
+    version is left untouched.
+    """
+    sections = []
+    for section in form.sections:
         if not section.is_active:
             continue
-        new_section = Section(
-            form_id=new_form.id,
-            title=section.title,
-            description=section.description,
-            sort_order=section.sort_order,
+        data = SectionResponse.model_validate(section)
+        data.questions = [q for q in data.questions if q.is_active]
+        sections.append(data)
+    stmt = pg_insert(FormSnapshot).values(
+        form_id=form.id,
+        version=form.version,
+        definition=_form_detail(form, sections).model_dump(mode="json"),
+        created_at=datetime.now(UTC),
+    )
+    await db.execute(stmt.on_conflict_do_nothing(index_elements=["form_id", "version"]))
+
+
+async def ensure_snapshot(db: AsyncSession, form: Form) -> None:
+    """Snapshot a form that was published before snapshots existed."""
+    result = await db.execute(
+        select(FormSnapshot.id).where(
+            FormSnapshot.form_id == form.id, FormSnapshot.version == form.version
         )
-        db.add(new_section)
-        await db.flush()
-
-        for question in section.questions:
-            if not question.is_active:
-                continue
-            new_q = Question(
-                section_id=new_section.id,
-                question_type=question.question_type,
-                text=question.text,
-                description=question.description,
-                is_required=question.is_required,
-                requires_photo=question.requires_photo,
-                requires_comment=question.requires_comment,
-                sort_order=question.sort_order,
-                config=question.config,
-                reference_value=question.reference_value,
-            )
-            db.add(new_q)
+    )
+    if result.first() is None:
+        await write_snapshot(db, await get_form(db, form.id))
+
+
+async def get_snapshot(db: AsyncSession, form_id: uuid.UUID, version: int) -> FormSnapshot:
+    result = await db.execute(
+        select(FormSnapshot).where(FormSnapshot.form_id == form_id, FormSnapshot.version == version)
+    )
+    snapshot = result.scalar_one_or_none()
+    if not snapshot:
+        raise NotFoundError("Form version not found")
+    return snapshot
+
+
+def snapshot_json(snapshot: FormSnapshot) -> bytes:
+    return json.dumps(snapshot.definition, separators=(",", ":")).encode()
+
+
+# Clones the form and, recursively, every active child of a composite, in one statement.
+# Old→new ids are mapped in CTEs (each is evaluated once, so gen_random_uuid() is stable);
+# sections, questions and child links are copied with INSERT ... SELECT against the maps.
+# UNION stops at forms already visited, so shared children are cloned once and cycles end.
+_CLONE_SQL = text("""
+    WITH RECURSIVE tree(id) AS (
+        SELECT CAST(:form_id AS uuid)
+        UNION
+        SELECT c.child_form_id
+        FROM composite_form_children c
+        JOIN tree t ON c.parent_form_id = t.id
+        JOIN forms child ON child.id = c.child_form_id AND child.is_active
+    ),
+    form_map AS (
+        SELECT id AS old_id, gen_random_uuid() AS new_id FROM tree
+    ),
+    new_forms AS (
+        INSERT INTO forms (
+            id, organization_id, title, description, code, version, is_composite,
+            is_published, is_active, expected_frequency, created_by, created_at, updated_at
+        )
+        SELECT m.new_id, f.organization_id, f.title || ' (Copy)', f.description, NULL, 1,
+               f.is_composite, false, true, f.expected_frequency, :user_id, now(), now()
+        FROM forms f
+        JOIN form_map m ON m.old_id = f.id
+    ),
+    section_map AS (
+        SELECT s.id AS old_id, gen_random_uuid() AS new_id, m.new_id AS form_id
+        FROM sections s
+        JOIN form_map m ON m.old_id = s.form_id
+        WHERE s.is_active
+    ),
+    new_sections AS (
+        INSERT INTO sections (
+            id, form_id, title, description, sort_order, is_active, created_at, updated_at
+        )
+        SELECT sm.new_id, sm.form_id, s.title, s.description, s.sort_order, true, now(), now()
+        FROM sections s
+        JOIN section_map sm ON sm.old_id = s.id
+    ),
+    new_questions AS (
+        INSERT INTO questions (
+            id, section_id, question_type, text, description, is_required, requires_photo,
+            requires_comment, sort_order, config, reference_value, is_active,
+            created_at, updated_at
+        )
+        SELECT gen_random_uuid(), sm.new_id, q.question_type, q.text, q.description,
+               q.is_required, q.requires_photo, q.requires_comment, q.sort_order, q.config,
+               q.reference_value, true, now(), now()
+        FROM questions q
+        JOIN section_map sm ON sm.old_id = q.section_id
+        WHERE q.is_active
+    ),
+    new_links AS (
+        INSERT INTO composite_form_children (id, parent_form_id, child_form_id, sort_order)
+        SELECT gen_random_uuid(), pm.new_id, cm.new_id, c.sort_order
+        FROM composite_form_children c
+        JOIN form_map pm ON pm.old_id = c.parent_form_id
+        JOIN form_map cm ON cm.old_id = c.child_form_id
+    )
+    SELECT new_id FROM form_map WHERE old_id = :form_id
+""")
+
 
-    return new_form
+async def duplicate_form(
+    db: AsyncSession, form_id: uuid.UUID, user_id: uuid.UUID
+) -> Form:
+    """Copy a form with its active sections and questions, including a composite's children.
+
+    Everything is copied by one INSERT ... SELECT statement; nothing is loaded into Python.
+    """
+    await _require_form(db, form_id)
+    result = await db.execute(_CLONE_SQL, {"form_id": form_id, "user_id": user_id})
+    new_form_id = result.scalar_one()
+    result = await db.execute(select(Form).where(Form.id == new_form_id))
+    return result.scalar_one()
 
 
 async def delete_form(db: AsyncSession, form_id: uuid.UUID) -> None:
     form = await get_form(db, form_id)
     form.is_active = False
+    payload_cache.invalidate(db, form_id)
+    if form.is_published:
+        await _forms_changed(db, form.organization_id)
 
 
 # ─── Sections ─────────────────────────────────────────────────────
@@ -168,6 +503,7 @@ async def create_section(
     )
     db.add(section)
     await db.flush()
+    await _form_changed(db, form_id)
     await db.refresh(section, ["questions"])
     return section
 
@@ -181,6 +517,7 @@ async def update_section(
         raise NotFoundError("Section not found")
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(section, field, value)
+    await _form_changed(db, section.form_id)
     return section
 
 
@@ -190,18 +527,15 @@ async def delete_section(db: AsyncSession, section_id: uuid.UUID) -> None:
     if not section:
         raise NotFoundError("Section not found")
     section.is_active = False
+    await _form_changed(db, section.form_id)
 
 
 async def reorder_sections(
-    db: AsyncSession, form_id: uuid.UUID, items: list[ReorderItem]
-) -> None:
-    for item in items:
-        result = await db.execute(
-            select(Section).where(Section.id == item.id, Section.form_id == form_id)
-        )
-        section = result.scalar_one_or_none()
-        if section:
-            section.sort_order = item.sort_order
+    db: AsyncSession, form_id: uuid.UUID, items: list[ReorderItem], dense: bool = False
+) -> list[ReorderItem]:
+    written = await _reorder(db, Section, Section.form_id, form_id, items, dense)
+    await _form_changed(db, form_id)
+    return written
 
 
 # ─── Questions ────────────────────────────────────────────────────
@@ -210,7 +544,8 @@ async def create_question(
     db: AsyncSession, section_id: uuid.UUID, data: QuestionCreate
 ) -> Question:
     result = await db.execute(select(Section).where(Section.id == section_id))
-    if not result.scalar_one_or_none():
+    section = result.scalar_one_or_none()
+    if not section:
         raise NotFoundError("Section not found")
 
     question = Question(
@@ -227,6 +562,7 @@ async def create_question(
     )
     db.add(question)
     await db.flush()
+    await _form_changed(db, section.form_id)
     return question
 
 
@@ -237,8 +573,17 @@ async def update_question(
     question = result.scalar_one_or_none()
     if not question:
         raise NotFoundError("Question not found")
-    for field, value in data.model_dump(exclude_unset=True).items():
+    changes = data.model_dump(exclude_unset=True)
+    rule_changed = any(
+        field in changes and changes[field] != getattr(question, field)
+        for field in ("question_type", "reference_value")
+    )
+    for field, value in changes.items():
         setattr(question, field, value)
+    if rule_changed:
+        # Stored answers were evaluated against the old rule
+        await reevaluation.enqueue(db, question.id)
+    await _section_changed(db, question.section_id)
     return question
 
 
@@ -248,22 +593,272 @@ async def delete_question(db: AsyncSession, question_id: uuid.UUID) -> None:
     if not question:
         raise NotFoundError("Question not found")
     question.is_active = False
+    await _section_changed(db, question.section_id)
 
 
 async def reorder_questions(
-    db: AsyncSession, section_id: uuid.UUID, items: list[ReorderItem]
-) -> None:
-    for item in items:
-        result = await db.execute(
-            select(Question).where(Question.id == item.id, Question.section_id == section_id)
+    db: AsyncSession, section_id: uuid.UUID, items: list[ReorderItem], dense: bool = False
+) -> list[ReorderItem]:
+    written = await _reorder(db, Question, Question.section_id, section_id, items, dense)
+    await _section_changed(db, section_id)
+    return written
+
+
+# ─── Builder Operations ──────────────────────────────────────────
+
+@dataclasses.dataclass
+class _Batch:
+    """Net effect of a batch of builder operations, folded in order before anything is written."""
+
+    form_id: uuid.UUID
+    id_map: dict[str, uuid.UUID] = dataclasses.field(default_factory=dict)
+    sections: set[uuid.UUID] = dataclasses.field(default_factory=set)
+    questions: dict[uuid.UUID, Row] = dataclasses.field(default_factory=dict)
+    new_sections: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    new_questions: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    section_changes: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    question_changes: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    dense_sections: bool = False
+    dense_questions: set[uuid.UUID] = dataclasses.field(default_factory=set)
+
+    def _resolve(self, ref: str, existing: Container, created: Container, kind: str) -> uuid.UUID:
+        entity_id = self.id_map.get(ref)
+        if entity_id is None:
+            try:
+                entity_id = uuid.UUID(ref)
+            except ValueError:
+                raise BadRequestError(f"Unknown {kind} reference: {ref}") from None
+        if entity_id not in existing and entity_id not in created:
+            raise BadRequestError(f"{kind.capitalize()} not found in this form: {ref}")
+        return entity_id
+
+    def section(self, ref: str) -> uuid.UUID:
+        return self._resolve(ref, self.sections, self.new_sections, "section")
+
+    def question(self, ref: str) -> uuid.UUID:
+        return self._resolve(ref, self.questions, self.new_questions, "question")
+
+    def question_section(self, question_id: uuid.UUID) -> uuid.UUID:
+        if question_id in self.new_questions:
+            return self.new_questions[question_id]["section_id"]
+        return self.questions[question_id].section_id
+
+    def change_section(self, section_id: uuid.UUID, values: dict) -> None:
+        target = self.new_sections.get(section_id)
+        if target is None:
+            target = self.section_changes.setdefault(section_id, {})
+        target.update(values)
+
+    def change_question(self, question_id: uuid.UUID, values: dict) -> None:
+        target = self.new_questions.get(question_id)
+        if target is None:
+            target = self.question_changes.setdefault(question_id, {})
+        target.update(values)
+
+    def apply(self, op: BuilderOperation) -> None:
+        match op:
+            case CreateSectionOp():
+                if op.temp_id in self.id_map:
+                    raise BadRequestError(f"Duplicate temp_id: {op.temp_id}")
+                section_id = self.id_map[op.temp_id] = uuid.uuid4()
+                self.new_sections[section_id] = {
+                    "id": section_id, "form_id": self.form_id, "is_active": True,
+                    **op.data.model_dump(),
+                }
+            case UpdateSectionOp():
+                self.change_section(self.section(op.id), op.data.model_dump(exclude_unset=True))
+            case DeleteSectionOp():
+                self.change_section(self.section(op.id), {"is_active": False})
+            case ReorderSectionsOp():
+                for item in op.items:
+                    self.change_section(self.section(item.id), {"sort_order": item.sort_order})
+                self.dense_sections |= op.dense
+            case CreateQuestionOp():
+                if op.temp_id in self.id_map:
+                    raise BadRequestError(f"Duplicate temp_id: {op.temp_id}")
+                section_id = self.section(op.section_id)
+                question_id = self.id_map[op.temp_id] = uuid.uuid4()
+                self.new_questions[question_id] = {
+                    "id": question_id, "section_id": section_id, "is_active": True,
+                    **op.data.model_dump(),
+                }
+            case UpdateQuestionOp():
+                self.change_question(self.question(op.id), op.data.model_dump(exclude_unset=True))
+            case DeleteQuestionOp():
+                self.change_question(self.question(op.id), {"is_active": False})
+            case ReorderQuestionsOp():
+                section_id = self.section(op.section_id)
+                for item in op.items:
+                    question_id = self.question(item.id)
+                    if self.question_section(question_id) != section_id:
+                        raise BadRequestError(f"Question not in section {op.section_id}: {item.id}")
+                    self.change_question(question_id, {"sort_order": item.sort_order})
+                if op.dense:
+                    self.dense_questions.add(section_id)
+
+
+async def apply_operations(
+    db: AsyncSession, form_id: uuid.UUID, operations: list[BuilderOperation]
+) -> BuilderOperationsResult:
+    """Apply an ordered batch of builder edits in one transaction.
+
+    Operations are folded into their net effect in memory (so later edits to a
+    row created earlier in the batch just change what gets inserted), then written
+    with one bulk INSERT per table and one executemany UPDATE per table. Any
+    invalid reference fails the whole batch.
+    """
+    await _require_form(db, form_id)
+    batch = _Batch(form_id)
+    result = await db.execute(select(Section.id).where(Section.form_id == form_id))
+    batch.sections = set(result.scalars().all())
+    # Plain rows, not ORM objects: the bulk UPDATEs below don't refresh the identity map
+    result = await db.execute(
+        select(Question.id, Question.section_id, Question.question_type, Question.reference_value)
+        .join(Section, Question.section_id == Section.id)
+        .where(Section.form_id == form_id)
+    )
+    batch.questions = {row.id: row for row in result}
+
+    for op in operations:
+        batch.apply(op)
+
+    if batch.new_sections:
+        await db.execute(insert(Section), list(batch.new_sections.values()))
+    if batch.new_questions:
+        await db.execute(insert(Question), list(batch.new_questions.values()))
+    if batch.section_changes:
+        await db.execute(
+            update(Section),
+            [{"id": section_id, **values} for section_id, values in batch.section_changes.items()],
+        )
+    if batch.question_changes:
+        await db.execute(
+            update(Question),
+            [{"id": q_id, **values} for q_id, values in batch.question_changes.items()],
         )
-        question = result.scalar_one_or_none()
-        if question:
-            question.sort_order = item.sort_order
+
+    if batch.dense_sections:
+        await _reorder(db, Section, Section.form_id, form_id, [], dense=True)
+    for section_id in batch.dense_questions:
+        await _reorder(db, Question, Question.section_id, section_id, [], dense=True)
+
+    reevaluating = []
+    for question_id, changes in batch.question_changes.items():
+        question = batch.questions[question_id]
+        if any(
+            field in changes and changes[field] != getattr(question, field)
+            for field in ("question_type", "reference_value")
+        ):
+            # Stored answers were evaluated against the old rule
+            await reevaluation.enqueue(db, question_id)
+            reevaluating.append(question_id)
+
+    await _form_changed(db, form_id)
+    return BuilderOperationsResult(
+        id_map=batch.id_map,
+        sections=await list_sections(db, form_id),
+        reevaluating=reevaluating,
+    )
 
 
 # ─── Composite Forms ─────────────────────────────────────────────
 
+# Longest chain of parent -> child links a composite may contain. Links that would
+# exceed it are rejected, and readers never expand past it.
+COMPOSITE_MAX_DEPTH = 8
+
+
+def _composite_walk(form_id: uuid.UUID, max_depth: int, upward: bool = False) -> CTE:
+    """Recursive CTE over active composite links starting at ``form_id``.
+
+    Yields one row per path: ``(form_id, depth, sort_order, path)``,
+    where ``path`` holds the form ids from the start down to ``form_id``. A form
+    already on the path is never revisited, so even a cyclic link set terminates;
+    ``upward`` walks from a child to its parents instead.
+    """
+    link = aliased(CompositeFormChild)
+    linked = aliased(Form)
+    start = literal(form_id, Form.id.type)
+    tree = select(
+        start.label("form_id"),
+        literal(0).label("depth"),
+        literal(0).label("sort_order"),
+        array([start]).label("path"),
+    ).cte("composite_tree", recursive=True)
+    near, far = (
+        (link.child_form_id, link.parent_form_id)
+        if upward
+        else (link.parent_form_id, link.child_form_id)
+    )
+    return tree.union_all(
+        select(far, tree.c.depth + 1, link.sort_order, tree.c.path + array([far]))
+        .join(tree, near == tree.c.form_id)
+        .join(linked, and_(linked.id == far, linked.is_active == True))  # noqa: E712
+        .where(tree.c.depth < max_depth, far != all_(tree.c.path))
+    )
+
+
+async def _composite_reach(
+    db: AsyncSession, form_id: uuid.UUID, upward: bool = False
+) -> tuple[set[uuid.UUID], int]:
+    """Forms reachable from ``form_id`` (itself included) and the longest path length."""
+    tree = _composite_walk(form_id, COMPOSITE_MAX_DEPTH + 1, upward)
+    result = await db.execute(select(tree.c.form_id, tree.c.depth))
+    rows = result.all()
+    return {row.form_id for row in rows}, max(row.depth for row in rows)
+
+
+async def _lock_composites(db: AsyncSession, org_id: uuid.UUID) -> None:
+    """Serialize link changes within one org so two inserts can't close a cycle together."""
+    key = func.hashtextextended(f"composites:{org_id}", 0)
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def get_composite_tree(
+    db: AsyncSession, form_id: uuid.UUID, max_depth: int = COMPOSITE_MAX_DEPTH
+) -> CompositeFormNode:
+    """The form with every descendant form, section and question, in one query.
+
+    A child linked under several parents appears under each of them. Levels past
+    ``max_depth`` (capped at ``COMPOSITE_MAX_DEPTH``) are not expanded.
+    """
+    await _require_form(db, form_id)
+    tree = _composite_walk(form_id, min(max_depth, COMPOSITE_MAX_DEPTH))
+    result = await db.execute(
+        select(tree.c.path, Form, Section, Question)
+        .join(Form, Form.id == tree.c.form_id)
+        .outerjoin(Section, and_(Section.form_id == Form.id, Section.is_active == True))  # noqa: E712
+        .outerjoin(
+            Question,
+            and_(Question.section_id == Section.id, Question.is_active == True),  # noqa: E712
+        )
+        .order_by(
+            tree.c.depth, tree.c.sort_order, tree.c.path, Section.sort_order, Question.sort_order
+        )
+    )
+
+    nodes: dict[tuple, CompositeFormNode] = {}
+    sections: dict[tuple, SectionResponse] = {}
+    for path, form, section, question in result:
+        path = tuple(path)
+        node = nodes.get(path)
+        if node is None:
+            node = nodes[path] = CompositeFormNode.model_validate(form)
+            if len(path) > 1:
+                nodes[path[:-1]].children.append(node)
+        if section is None:
+            continue
+        key = (path, section.id)
+        if key not in sections:
+            sections[key] = SectionResponse(
+                **{c.key: getattr(section, c.key) for c in section.__table__.columns}
+            )
+            node.sections.append(sections[key])
+        if question is not None:
+            sections[key].questions.append(QuestionResponse.model_validate(question))
+    return nodes[(form_id,)]
+
+
 async def add_child_form(
     db: AsyncSession, parent_form_id: uuid.UUID, data: CompositeChildAdd
 ) -> CompositeFormChild:
@@ -273,12 +868,28 @@ async def add_child_form(
     if data.child_form_id == parent_form_id:
         raise BadRequestError("Cannot add form as its own child")
 
+    await _lock_composites(db, parent.organization_id)
+    result = await db.execute(
+        select(Form.organization_id).where(
+            Form.id == data.child_form_id, Form.is_active == True  # noqa: E712
+        )
+    )
+    if result.scalar_one_or_none() != parent.organization_id:
+        raise BadRequestError("Child form not found in this organization")
+    descendants, height = await _composite_reach(db, data.child_form_id)
+    if parent_form_id in descendants:
+        raise BadRequestError("Cannot add a form that already contains this form")
+    _, parent_depth = await _composite_reach(db, parent_form_id, upward=True)
+    if parent_depth + 1 + height > COMPOSITE_MAX_DEPTH:
+        raise BadRequestError(f"Composite forms can nest at most {COMPOSITE_MAX_DEPTH} levels")
+
     child = CompositeFormChild(
         parent_form_id=parent_form_id,
         child_form_id=data.child_form_id,
         sort_order=data.sort_order,
     )
     db.add(child)
+    await _form_changed(db, parent_form_id)
     return child
 
 
@@ -295,24 +906,168 @@ async def remove_child_form(
     if not link:
         raise NotFoundError("Child form link not found")
     await db.delete(link)
+    await _form_changed(db, parent_form_id)
 
 
 # ─── Node Assignments ────────────────────────────────────────────
 
+async def _form_org(db: AsyncSession, form_id: uuid.UUID) -> uuid.UUID:
+    result = await db.execute(
+        select(Form.organization_id)
+        .where(Form.id == form_id, Form.is_active == True)  # noqa: E712
+    )
+    org_id = result.scalar_one_or_none()
+    if not org_id:
+        raise NotFoundError("Form not found")
+    return org_id
+
+
+def _assignment_targets(org_id: uuid.UUID, data: FormNodeAssign) -> Select:
+    """Ids of the nodes ``data`` refers to, resolved in SQL (subtrees by interval)."""
+    listed = NodeSet.from_ids(data.node_ids)
+    if not data.include_descendants:
+        return select(Node.id).where(node_filter(Node.id, listed), Node.organization_id == org_id)
+    root = aliased(Node, name="root")
+    query = (
+        select(Node.id)
+        .distinct()
+        .join(
+            root,
+            and_(
+                root.organization_id == Node.organization_id,
+                Node.tree_left.between(root.tree_left, root.tree_right),
+            ),
+        )
+        .where(
+            node_filter(root.id, listed),
+            root.organization_id == org_id,
+            Node.is_active == True,  # noqa: E712
+        )
+    )
+    if data.node_type:
+        query = query.where(Node.node_type == data.node_type)
+    return query
+
+
 async def assign_form_to_nodes(
     db: AsyncSession, form_id: uuid.UUID, data: FormNodeAssign
 ) -> list[uuid.UUID]:
-    now = datetime.now(timezone.utc)
-    for node_id in data.node_ids:
-        # Check if already assigned
-        result = await db.execute(
-            select(FormNodeAssignment).where(
-                FormNodeAssignment.form_id == form_id,
-                FormNodeAssignment.node_id == node_id,
-            )
+    """Assign the form to the listed nodes (or their subtrees) in one INSERT ... SELECT.
+
+    Unassigned (inactive) rows are reactivated; active ones are left alone.
+    Returns the nodes that were newly assigned or reactivated.
+    """
+    org_id = await _form_org(db, form_id)
+    if not data.node_ids:
+        return []
+    result = await db.execute(
+        select(Node.id).where(
+            node_filter(Node.id, NodeSet.from_ids(data.node_ids)), Node.organization_id == org_id
+        )
+    )
+    invalid = set(data.node_ids) - set(result.scalars().all())
+    if invalid:
+        raise BadRequestError(f"Nodes not found in this organization: {invalid}")
+
+    targets = _assignment_targets(org_id, data).subquery("targets")
+    upsert = (
+        pg_insert(FormNodeAssignment)
+        .from_select(
+            ["id", "form_id", "node_id", "is_active", "created_at"],
+            select(
+                func.gen_random_uuid(),
+                literal(form_id, FormNodeAssignment.form_id.type),
+                targets.c.id,
+                true(),
+                func.now(),
+            ),
+        )
+    )
+    stmt = upsert.on_conflict_do_update(
+        index_elements=["form_id", "node_id"],
+        set_={"is_active": True},
+        where=FormNodeAssignment.is_active == False,  # noqa: E712
+    ).returning(FormNodeAssignment.node_id)
+    result = await db.execute(stmt)
+    assigned = list(result.scalars().all())
+    if assigned:
+        await _form_changed(db, form_id)
+    return assigned
+
+
+async def unassign_form_from_nodes(
+    db: AsyncSession, form_id: uuid.UUID, data: FormNodeAssign
+) -> list[uuid.UUID]:
+    """Remove the form from the listed nodes (or their subtrees) in one UPDATE.
+
+    Assignments are soft-deleted, like forms and nodes, so devices pull the
+    removal as a tombstone. Nodes that weren't assigned are ignored. Returns the
+    nodes that were unassigned.
+    """
+    org_id = await _form_org(db, form_id)
+    if not data.node_ids:
+        return []
+    result = await db.execute(
+        update(FormNodeAssignment)
+        .where(
+            FormNodeAssignment.form_id == form_id,
+            FormNodeAssignment.node_id.in_(_assignment_targets(org_id, data)),
+            FormNodeAssignment.is_active == True,  # noqa: E712
+        )
+        .values(is_active=False)
+        .returning(FormNodeAssignment.node_id)
+        .execution_options(synchronize_session=False)
+    )
+    removed = list(result.scalars().all())
+    if removed:
+        await _form_changed(db, form_id)
+    return removed
+
+
+_form_list = TypeAdapter(list[FormResponse])
+
+
+async def get_node_forms(db: AsyncSession, node_id: uuid.UUID) -> tuple[bytes, str]:
+    """Published forms assigned to the node or any of its ancestors, as (JSON body, ETag).
+
+    Ancestors are read off the node's materialized path and matched on
+    ``ix_form_node_assignments_node_id``, so the forms come back in one query.
+    Results are cached per (org, hierarchy version, forms version); a hit costs
+    one primary-key lookup.
+    """
+    result = await db.execute(
+        select(
+            Node.organization_id,
+            Node.materialized_path,
+            Organization.hierarchy_version,
+            Organization.forms_version,
         )
-        if not result.scalar_one_or_none():
-            db.add(FormNodeAssignment(
-                form_id=form_id, node_id=node_id, created_at=now
-            ))
-    return data.node_ids
+        .join(Organization, Organization.id == Node.organization_id)
+        .where(Node.id == node_id, Node.is_active == True)  # noqa: E712
+    )
+    stamp = result.one_or_none()
+    if not stamp:
+        raise NotFoundError("Node not found")
+    org_id, path, hierarchy_version, forms_version = stamp
+    cached = node_forms_cache.get(org_id, hierarchy_version, forms_version, node_id)
+    if cached:
+        return cached
+
+    ancestors = NodeSet.from_ids(hierarchy.path_ids(path))
+    assigned = select(FormNodeAssignment.form_id).where(
+        node_filter(FormNodeAssignment.node_id, ancestors),
+        FormNodeAssignment.is_active == True,  # noqa: E712
+    )
+    result = await db.execute(
+        select(Form)
+        .where(
+            Form.organization_id == org_id,
+            Form.is_active == True,  # noqa: E712
+            Form.is_published == True,  # noqa: E712
+            Form.id.in_(assigned),
+        )
+        .order_by(Form.title, Form.id)
+    )
+    forms = [FormResponse.model_validate(f) for f in result.scalars().all()]
+    body = _form_list.dump_json(forms)
+    return node_forms_cache.put(org_id, hierarchy_version, forms_version, node_id, body)
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -9,8 +10,11 @@ from src.config import settings
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    from src.responses.reevaluation import resume_interrupted
+    resume_task = asyncio.create_task(resume_interrupted())
     yield
     # Shutdown
+    resume_task.cancel()
     from src.core.database import engine
     await engine.dispose()
 
@@ -42,6 +46,8 @@ def create_app() -> FastAPI:
     from src.forms.router import router as forms_router
     from src.responses.router import router as responses_router
     from src.action_plans.router import router as action_plans_router
+    from src.sync.router import router as sync_router
+    from src.core.router import router as core_router
 
     api_prefix = "/api/v1"
     app.include_router(auth_router, prefix=api_prefix)
@@ -49,6 +55,8 @@ def create_app() -> FastAPI:
     app.include_router(forms_router, prefix=api_prefix)
     app.include_router(responses_router, prefix=api_prefix)
     app.include_router(action_plans_router, prefix=api_prefix)
+    app.include_router(sync_router, prefix=api_prefix)
+    app.include_router(core_router, prefix=api_prefix)
 
     @app.get("/health")
     async def health():
@@ -0,0 +1,151 @@
+"""Interval (nested-set) encoding of the node hierarchy.
+
+Every node carries ``[tree_left, tree_right]`` such that a node's interval
+contains exactly the intervals of its descendants. Ancestor/descendant tests
+and subtree scans then become range predicates on ``(organization_id,
+tree_left)`` instead of ``LIKE`` against a path taken from another row, which
+no index can serve.
+
+Numbers are spaced ``TREE_GAP`` apart so a new node can usually be slotted into
+its parent's free tail without touching other rows: it takes half of the space
+left after its last sibling. When a parent runs out of room the whole org is
+renumbered from ``materialized_path``, which stays the source of truth.
+
+Each node also carries ``descendant_count`` (active nodes below it), adjusted
+along the ancestor path on every create, move and deactivation so tree views
+know whether a node can expand without loading its children.
+
+Callers must hold the org's hierarchy lock (``service._lock_hierarchy``).
+"""
+
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth_cache import NodeSet
+from src.core.permissions import node_filter
+from src.organizations.models import Node
+
+TREE_GAP = 1 << 32
+TREE_MAX = 1 << 62
+
+# Pre-order position from the path (COLLATE "C" keeps each subtree contiguous), subtree
+# size from counting every node under each ancestor id in its path.
+_RENUMBER_SQL = text("""
+    WITH ordered AS (
+        SELECT id, depth,
+               row_number() OVER (ORDER BY materialized_path COLLATE "C") - 1 AS rn
+        FROM nodes
+        WHERE organization_id = :org_id
+    ),
+    sizes AS (
+        SELECT a.ancestor::uuid AS id, count(*) AS size
+        FROM nodes n,
+             unnest(string_to_array(trim(both '/' from n.materialized_path), '/')) AS a(ancestor)
+        WHERE n.organization_id = :org_id
+        GROUP BY a.ancestor
+    )
+    UPDATE nodes
+    SET tree_left = (2 * o.rn - o.depth) * :gap,
+        tree_right = (2 * o.rn - o.depth + 2 * s.size - 1) * :gap
+    FROM ordered o
+    JOIN sizes s ON s.id = o.id
+    WHERE nodes.id = o.id
+""")
+
+
+_RECOUNT_SQL = text("""
+    WITH sizes AS (
+        SELECT a.ancestor::uuid AS id, count(*) AS size
+        FROM nodes n,
+             unnest(string_to_array(trim(both '/' from n.materialized_path), '/')) AS a(ancestor)
+        WHERE n.organization_id = :org_id AND n.is_active AND a.ancestor::uuid <> n.id
+        GROUP BY a.ancestor
+    )
+    UPDATE nodes
+    SET descendant_count = coalesce(s.size, 0)
+    FROM nodes n
+    LEFT JOIN sizes s ON s.id = n.id
+    WHERE nodes.id = n.id AND n.organization_id = :org_id
+""")
+
+
+def path_ids(path: str) -> list[uuid.UUID]:
+    """Node ids in a materialized path, root first (the node itself last)."""
+    return [uuid.UUID(part) for part in path.strip("/").split("/")]
+
+
+async def renumber(db: AsyncSession, org_id: uuid.UUID) -> None:
+    await db.execute(_RENUMBER_SQL, {"org_id": org_id, "gap": TREE_GAP})
+
+
+async def recount(db: AsyncSession, org_id: uuid.UUID) -> None:
+    """Recompute every ``descendant_count`` in the org from the paths."""
+    await db.execute(_RECOUNT_SQL, {"org_id": org_id})
+
+
+async def adjust_counts(db: AsyncSession, ancestor_ids: Iterable[uuid.UUID], delta: int) -> None:
+    """Add ``delta`` to the descendant count of each of ``ancestor_ids``."""
+    ancestors = NodeSet.from_ids(ancestor_ids)
+    if not ancestors or not delta:
+        return
+    await db.execute(
+        update(Node)
+        .where(node_filter(Node.id, ancestors))
+        .values(descendant_count=Node.descendant_count + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _free_tail(
+    db: AsyncSession, org_id: uuid.UUID, parent: Node | None, exclude: uuid.UUID | None = None
+) -> tuple[int, int]:
+    """First and last free number after ``parent``'s last child (or after the last root)."""
+    query = select(func.max(Node.tree_right)).where(Node.organization_id == org_id)
+    if parent:
+        query = query.where(Node.parent_id == parent.id)
+        floor, ceiling = parent.tree_left, parent.tree_right - 1
+    else:
+        query = query.where(Node.parent_id.is_(None))
+        floor, ceiling = -1, TREE_MAX
+    if exclude:
+        query = query.where(Node.id != exclude)
+    last = (await db.execute(query)).scalar_one_or_none()
+    return max(floor, last if last is not None else floor) + 1, ceiling
+
+
+async def allocate(db: AsyncSession, org_id: uuid.UUID, parent: Node | None) -> tuple[int, int]:
+    """Interval for a new leaf under ``parent`` (``None`` for a root)."""
+    start, end = await _free_tail(db, org_id, parent)
+    if end < start:
+        await renumber(db, org_id)
+        if parent:
+            await db.refresh(parent)
+        start, end = await _free_tail(db, org_id, parent)
+    return start, start + (end - start) // 2
+
+
+async def place_moved_subtree(
+    db: AsyncSession, org_id: uuid.UUID, node: Node, parent: Node | None
+) -> None:
+    """Re-encode ``node``'s subtree after its path has been moved under ``parent``.
+
+    Shifts the subtree into the parent's free tail when it fits, otherwise renumbers the org.
+    """
+    width = node.tree_right - node.tree_left
+    start, end = await _free_tail(db, org_id, parent, exclude=node.id)
+    if end - start < width:
+        await renumber(db, org_id)
+        return
+    offset = start - node.tree_left
+    await db.execute(
+        update(Node)
+        .where(
+            Node.organization_id == org_id,
+            Node.tree_left.between(node.tree_left, node.tree_right),
+        )
+        .values(tree_left=Node.tree_left + offset, tree_right=Node.tree_right + offset)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,11 +1,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.base_model import Base, TimestampMixin, UUIDMixin
+from src.core.base_model import Base, ChangeTrackedMixin, TimestampMixin, UUIDMixin
 from src.core.enums import UserRole
 
 
@@ -16,6 +27,14 @@ class Organization(UUIDMixin, TimestampMixin, Base):
     slug: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     logo_url: Mapped[str | None] = mapped_column(String(512))
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Bumped on every node write / when the set of published forms or their assignments
+    # changes; key the per-worker applicable-forms cache and the offline bundle
+    hierarchy_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
+    forms_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
 
     members: Mapped[list["UserOrganizationRole"]] = relationship(back_populates="organization")
     nodes: Mapped[list["Node"]] = relationship(back_populates="organization")
@@ -31,6 +50,10 @@ class User(UUIDMixin, TimestampMixin, Base):
     password_hash: Mapped[str | None] = mapped_column(String(128))
     avatar_url: Mapped[str | None] = mapped_column(String(512))
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Operates the deployment itself (e.g. worker diagnostics); unrelated to org roles
+    is_system_admin: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )
     last_login_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     memberships: Mapped[list["UserOrganizationRole"]] = relationship(back_populates="user")
@@ -39,7 +62,10 @@ class User(UUIDMixin, TimestampMixin, Base):
 
 class UserOrganizationRole(UUIDMixin, Base):
     __tablename__ = "user_organization_roles"
-    __table_args__ = (UniqueConstraint("user_id", "organization_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "organization_id"),
+        Index("ix_user_organization_roles_organization_id", "organization_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -48,6 +74,10 @@ class UserOrganizationRole(UUIDMixin, Base):
         UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
     )
     role: Mapped[UserRole] = mapped_column(nullable=False)
+    # Bumped on every role change; org-scoped access tokens carry it (see core.dependencies)
+    membership_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     user: Mapped["User"] = relationship(back_populates="memberships")
@@ -69,9 +99,30 @@ class NodeType(UUIDMixin, Base):
     organization: Mapped["Organization"] = relationship(back_populates="node_types")
 
 
-class Node(UUIDMixin, TimestampMixin, Base):
+class Node(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "nodes"
-    __table_args__ = (UniqueConstraint("parent_id", "name"),)
+    __table_args__ = (
+        UniqueConstraint("parent_id", "name"),
+        Index(
+            "ix_nodes_org_active_tree",
+            "organization_id", "depth", "sort_order", "name",
+            postgresql_where=text("is_active"),
+        ),
+        # The plain btree on materialized_path cannot serve LIKE 'prefix%' outside the C locale
+        Index(
+            "ix_nodes_materialized_path_pattern",
+            "materialized_path",
+            postgresql_ops={"materialized_path": "text_pattern_ops"},
+        ),
+        Index("ix_nodes_org_tree_left", "organization_id", "tree_left", "tree_right"),
+        # Depth-limited subtree reads: one tree_left range per level
+        Index("ix_nodes_org_depth_tree_left", "organization_id", "depth", "tree_left"),
+        Index(
+            "ix_nodes_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("ix_nodes_org_change", "organization_id", "change_xid", "id"),
+    )
 
     organization_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
@@ -86,6 +137,13 @@ class Node(UUIDMixin, TimestampMixin, Base):
     depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     sort_order: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    # Nested-set interval maintained by organizations.hierarchy
+    tree_left: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    tree_right: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Active nodes below this one, kept up to date by organizations.service
+    descendant_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     organization: Mapped["Organization"] = relationship(back_populates="nodes")
     parent: Mapped["Node | None"] = relationship(
@@ -97,7 +155,10 @@ class Node(UUIDMixin, TimestampMixin, Base):
 
 class UserNodeAssignment(UUIDMixin, Base):
     __tablename__ = "user_node_assignments"
-    __table_args__ = (UniqueConstraint("user_id", "node_id"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "node_id"),
+        Index("ix_user_node_assignments_node_id", "node_id"),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
@@ -1,12 +1,19 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
-from src.core.dependencies import get_current_org_member, get_current_user, require_role
+from src.core.dependencies import (
+    get_current_org_member,
+    get_current_user,
+    get_node_org_member,
+    require_role,
+)
 from src.core.enums import UserRole
+from src.core.permissions import get_accessible_node_ids
 from src.organizations.models import User, UserOrganizationRole
 from src.organizations.schemas import (
     MemberInvite,
@@ -16,6 +23,7 @@ from src.organizations.schemas import (
     NodeCreate,
     NodeMove,
     NodeResponse,
+    NodeSearchResult,
     NodeTreeResponse,
     NodeTypeCreate,
     NodeTypeResponse,
@@ -28,6 +36,9 @@ from src.organizations import service
 
 router = APIRouter(tags=["organizations"])
 
+# Deepest level the lazy tree endpoints will expand in one request
+MAX_TREE_DEPTH = 20
+
 
 # ─── Organizations ────────────────────────────────────────────────
 
@@ -93,10 +104,57 @@ async def create_node_type(
 @router.get("/organizations/{org_id}/hierarchy", response_model=list[NodeResponse])
 async def get_hierarchy(
     org_id: uuid.UUID,
-    _: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    depth: int | None = Query(default=None, ge=1),
+):
+    """Every accessible active node as a flat list, streamed; ``depth`` keeps the top levels."""
+    nodes = await get_accessible_node_ids(db, user.id, org_id, membership.role)
+    return StreamingResponse(
+        service.stream_hierarchy(org_id, depth, nodes), media_type="application/json"
+    )
+
+
+@router.get("/nodes/{node_id}/children", response_model=list[NodeResponse])
+async def list_node_children(
+    node_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_node_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    depth: int = Query(default=1, ge=1, le=MAX_TREE_DEPTH),
+):
+    nodes = await get_accessible_node_ids(
+        db, user.id, membership.organization_id, membership.role
+    )
+    return await service.list_children(db, node_id, depth, nodes)
+
+
+@router.get("/nodes/{node_id}/subtree", response_model=NodeTreeResponse)
+async def get_node_subtree(
+    node_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_node_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    depth: int | None = Query(default=None, ge=0, le=MAX_TREE_DEPTH),
+):
+    nodes = await get_accessible_node_ids(
+        db, user.id, membership.organization_id, membership.role
+    )
+    return await service.get_subtree(db, node_id, depth, nodes)
+
+
+@router.get("/organizations/{org_id}/nodes/search", response_model=list[NodeSearchResult])
+async def search_nodes(
+    org_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=50),
 ):
-    return await service.get_hierarchy_tree(db, org_id)
+    nodes = await get_accessible_node_ids(db, user.id, org_id, membership.role)
+    return await service.search_nodes(db, org_id, q, limit, nodes)
 
 
 @router.post("/organizations/{org_id}/nodes", response_model=NodeResponse)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 from src.core.enums import UserRole
 
@@ -76,11 +76,28 @@ class NodeResponse(BaseModel):
     depth: int
     sort_order: int
     is_active: bool
+    descendant_count: int = 0
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
 
+    @computed_field
+    @property
+    def has_children(self) -> bool:
+        return self.descendant_count > 0
+
+
+class NodeBreadcrumb(BaseModel):
+    id: uuid.UUID
+    name: str
+
+
+class NodeSearchResult(NodeResponse):
+    """A matching node with its ancestors, root first, for display without the tree."""
+    breadcrumb: list[NodeBreadcrumb] = []
+    rank: float
+
 
 class NodeTreeResponse(BaseModel):
     """A node with its children nested recursively."""
@@ -91,10 +108,16 @@ class NodeTreeResponse(BaseModel):
     description: str | None = None
     depth: int
     sort_order: int
+    descendant_count: int = 0
     children: list["NodeTreeResponse"] = []
 
     model_config = {"from_attributes": True}
 
+    @computed_field
+    @property
+    def has_children(self) -> bool:
+        return self.descendant_count > 0
+
 
 # --- Members ---
 class MemberResponse(BaseModel):
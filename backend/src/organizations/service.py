@@ -1,12 +1,19 @@
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, Select, and_, case, delete, exists, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
+from src.core import auth_cache
 from src.core.enums import UserRole
+from src.core.auth_cache import NodeSet
+from src.core.database import async_session
 from src.core.exceptions import BadRequestError, ConflictError, NotFoundError
+from src.core.permissions import node_filter
+from src.core.search import MIN_FUZZY_LENGTH, trigram_match, trigram_rank
+from src.organizations import hierarchy
 from src.organizations.models import (
     Node,
     NodeType,
@@ -18,8 +25,12 @@ from src.organizations.models import (
 from src.organizations.schemas import (
     MemberInvite,
     NodeAssignmentUpdate,
+    NodeBreadcrumb,
     NodeCreate,
     NodeMove,
+    NodeResponse,
+    NodeSearchResult,
+    NodeTreeResponse,
     NodeUpdate,
     NodeTypeCreate,
     OrganizationCreate,
@@ -106,6 +117,44 @@ async def list_node_types(db: AsyncSession, org_id: uuid.UUID) -> list[NodeType]
 
 # ─── Nodes (Hierarchy) ───────────────────────────────────────────
 
+_STREAM_BATCH = 1000
+
+
+async def _lock_hierarchy(db: AsyncSession, org_id: uuid.UUID) -> None:
+    """Serialize path-rewriting writes within one org until the transaction ends."""
+    key = func.hashtextextended(f"nodes:{org_id}", 0)
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def _hierarchy_changed(db: AsyncSession, org_id: uuid.UUID) -> None:
+    """Bump the org's hierarchy version so cached hierarchy-derived results go stale.
+
+    Every node write calls this: the offline bundle (``sync.bundle``) caches node
+    rows themselves, not just ancestor-derived results. The version is a counter
+    bumped in the writing transaction, so unlike ``change_xid`` it can't be
+    overtaken by a write that commits later.
+    """
+    await db.execute(
+        update(Organization)
+        .where(Organization.id == org_id)
+        .values(hierarchy_version=Organization.hierarchy_version + 1)
+    )
+
+
+async def _is_under_assignment(db: AsyncSession, org_id: uuid.UUID, node: Node) -> bool:
+    """Whether ``node`` lies in (or is) some member's assigned subtree."""
+    assigned = (
+        select(UserNodeAssignment.node_id)
+        .join(Node)
+        .where(
+            Node.organization_id == org_id,
+            Node.tree_left <= node.tree_left,
+            Node.tree_right >= node.tree_left,
+        )
+    )
+    return bool((await db.execute(select(assigned.exists()))).scalar())
+
+
 def _build_path(parent_path: str | None, node_id: uuid.UUID) -> str:
     if parent_path:
         return f"{parent_path}{node_id}/"
@@ -115,14 +164,23 @@ def _build_path(parent_path: str | None, node_id: uuid.UUID) -> str:
 async def create_node(db: AsyncSession, org_id: uuid.UUID, data: NodeCreate) -> Node:
     parent_path = ""
     depth = 0
+    parent = None
 
+    await _lock_hierarchy(db, org_id)
     if data.parent_id:
-        result = await db.execute(select(Node).where(Node.id == data.parent_id))
+        result = await db.execute(
+            select(Node)
+            .where(Node.id == data.parent_id)
+            .execution_options(populate_existing=True)
+        )
         parent = result.scalar_one_or_none()
         if not parent or parent.organization_id != org_id:
             raise BadRequestError("Parent node not found in this organization")
+        if not parent.is_active:
+            raise BadRequestError("Cannot create a node under a deactivated node")
         parent_path = parent.materialized_path
         depth = parent.depth + 1
+    tree_left, tree_right = await hierarchy.allocate(db, org_id, parent)
 
     node = Node(
         organization_id=org_id,
@@ -133,11 +191,18 @@ async def create_node(db: AsyncSession, org_id: uuid.UUID, data: NodeCreate) ->
         sort_order=data.sort_order,
         depth=depth,
         materialized_path="",  # Temporary — set after flush
+        tree_left=tree_left,
+        tree_right=tree_right,
     )
     db.add(node)
     await db.flush()
 
     node.materialized_path = _build_path(parent_path, node.id)
+    if parent:
+        await hierarchy.adjust_counts(db, hierarchy.path_ids(parent_path), 1)
+    await _hierarchy_changed(db, org_id)
+    if parent and await _is_under_assignment(db, org_id, parent):
+        auth_cache.invalidate_node_access(db, org_id)
     return node
 
 
@@ -149,77 +214,278 @@ async def update_node(db: AsyncSession, node_id: uuid.UUID, data: NodeUpdate) ->
 
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(node, field, value)
+    await _hierarchy_changed(db, node.organization_id)
     return node
 
 
 async def move_node(db: AsyncSession, node_id: uuid.UUID, data: NodeMove) -> Node:
-    """Move a node to a new parent, updating materialized_path for it and all descendants."""
+    """Move a node to a new parent, rewriting the path prefix of its whole subtree in one UPDATE."""
     result = await db.execute(select(Node).where(Node.id == node_id))
     node = result.scalar_one_or_none()
     if not node:
         raise NotFoundError("Node not found")
 
+    await _lock_hierarchy(db, node.organization_id)
+    # Paths read before the lock may have been rewritten by a move that held it
+    await db.refresh(node)
     old_path = node.materialized_path
 
     # Calculate new path
+    new_parent = None
     if data.new_parent_id:
-        result = await db.execute(select(Node).where(Node.id == data.new_parent_id))
+        result = await db.execute(
+            select(Node)
+            .where(Node.id == data.new_parent_id)
+            .execution_options(populate_existing=True)
+        )
         new_parent = result.scalar_one_or_none()
         if not new_parent or new_parent.organization_id != node.organization_id:
             raise BadRequestError("New parent node not found in this organization")
+        if not new_parent.is_active:
+            raise BadRequestError("Cannot move a node under a deactivated node")
         # Prevent moving a node under itself
         if new_parent.materialized_path.startswith(old_path):
             raise BadRequestError("Cannot move a node under itself")
         new_path = _build_path(new_parent.materialized_path, node.id)
-        node.depth = new_parent.depth + 1
+        new_depth = new_parent.depth + 1
     else:
         new_path = f"/{node.id}/"
-        node.depth = 0
+        new_depth = 0
 
-    node.parent_id = data.new_parent_id
-    node.materialized_path = new_path
-
-    # Update all descendants
-    result = await db.execute(
-        select(Node).where(
-            Node.materialized_path.like(f"{old_path}%"),
-            Node.id != node_id,
+    await db.execute(
+        update(Node)
+        .where(
+            Node.organization_id == node.organization_id,
+            Node.tree_left.between(node.tree_left, node.tree_right),
         )
+        .values(
+            materialized_path=new_path + func.substr(Node.materialized_path, len(old_path) + 1),
+            depth=Node.depth + (new_depth - node.depth),
+            parent_id=case((Node.id == node_id, data.new_parent_id), else_=Node.parent_id),
+        )
+        .execution_options(synchronize_session=False)
     )
-    descendants = result.scalars().all()
-    for desc in descendants:
-        desc.materialized_path = desc.materialized_path.replace(old_path, new_path, 1)
-        # Recalculate depth based on path segments
-        desc.depth = desc.materialized_path.strip("/").count("/")
-
+    await hierarchy.place_moved_subtree(db, node.organization_id, node, new_parent)
+    if node.is_active:
+        # Ancestors the subtree leaves lose it, ancestors it joins gain it
+        old_ancestors = set(hierarchy.path_ids(old_path)[:-1])
+        new_ancestors = set(hierarchy.path_ids(new_path)[:-1])
+        moved = node.descendant_count + 1
+        await hierarchy.adjust_counts(db, old_ancestors - new_ancestors, -moved)
+        await hierarchy.adjust_counts(db, new_ancestors - old_ancestors, moved)
+    await _hierarchy_changed(db, node.organization_id)
+    auth_cache.invalidate_node_access(db, node.organization_id)
+    await db.refresh(node)
     return node
 
 
-async def get_hierarchy_tree(db: AsyncSession, org_id: uuid.UUID) -> list[Node]:
-    """Get all nodes for an organization, ordered for tree construction."""
-    result = await db.execute(
+async def stream_hierarchy(
+    org_id: uuid.UUID, max_depth: int | None = None, nodes: NodeSet | None = None
+) -> AsyncIterator[bytes]:
+    """All active nodes (or the top ``max_depth`` levels) as a JSON array, in chunks.
+
+    ``nodes`` limits the list to a member's accessible nodes.
+
+    Rows come off a server-side cursor a batch at a time, so memory stays flat
+    however large the org is. Uses its own session: the response body is still
+    being sent after the request's session has closed.
+    """
+    query = (
         select(Node)
-        .where(Node.organization_id == org_id, Node.is_active == True)  # noqa: E712
+        .where(
+            Node.organization_id == org_id,
+            Node.is_active == True,  # noqa: E712
+            node_filter(Node.id, nodes),
+        )
         .order_by(Node.depth, Node.sort_order, Node.name)
+        .execution_options(yield_per=_STREAM_BATCH)
     )
+    if max_depth is not None:
+        query = query.where(Node.depth < max_depth)
+    async with async_session() as db:
+        result = await db.stream_scalars(query)
+        separator = b"["
+        async for batch in result.partitions():
+            rows = [NodeResponse.model_validate(n).model_dump_json().encode() for n in batch]
+            yield separator + b",".join(rows)
+            separator = b","
+            db.expunge_all()
+        yield b"[]" if separator == b"[" else b"]"
+
+
+async def _get_active_node(
+    db: AsyncSession, node_id: uuid.UUID, nodes: NodeSet | None = None
+) -> Node:
+    """The active node, if it is among ``nodes`` (a member's accessible nodes)."""
+    if nodes is not None and node_id not in nodes:
+        raise NotFoundError("Node not found")
+    result = await db.execute(
+        select(Node).where(Node.id == node_id, Node.is_active == True)  # noqa: E712
+    )
+    node = result.scalar_one_or_none()
+    if not node:
+        raise NotFoundError("Node not found")
+    return node
+
+
+def _subtree_query(
+    node: Node, first_level: int, depth: int | None, nodes: NodeSet | None = None
+) -> Select:
+    """Active nodes in ``node``'s subtree between ``first_level`` and ``depth`` levels below it.
+
+    With a depth limit the levels are listed, so each is one ``tree_left`` range
+    on ``ix_nodes_org_depth_tree_left``.
+    """
+    query = select(Node).where(
+        Node.organization_id == node.organization_id,
+        Node.tree_left.between(node.tree_left, node.tree_right),
+        Node.is_active == True,  # noqa: E712
+        node_filter(Node.id, nodes),
+    )
+    if depth is None:
+        query = query.where(Node.depth >= node.depth + first_level)
+    else:
+        query = query.where(Node.depth.in_(range(node.depth + first_level, node.depth + depth + 1)))
+    return query.order_by(Node.depth, Node.sort_order, Node.name)
+
+
+async def list_children(
+    db: AsyncSession, node_id: uuid.UUID, depth: int = 1, nodes: NodeSet | None = None
+) -> list[Node]:
+    """Active descendants up to ``depth`` levels below the node, as a flat list.
+
+    ``nodes`` limits the node and its descendants to a member's accessible nodes.
+    """
+    node = await _get_active_node(db, node_id, nodes)
+    result = await db.execute(_subtree_query(node, 1, depth, nodes))
     return list(result.scalars().all())
 
 
+async def get_subtree(
+    db: AsyncSession, node_id: uuid.UUID, depth: int | None = None, nodes: NodeSet | None = None
+) -> NodeTreeResponse:
+    """The node with its active descendants nested, ``depth`` levels deep (all if None).
+
+    ``nodes`` limits the tree to a member's accessible nodes.
+    """
+    node = await _get_active_node(db, node_id, nodes)
+    result = await db.execute(_subtree_query(node, 0, depth, nodes))
+    trees: dict[uuid.UUID, NodeTreeResponse] = {}
+    for n in result.scalars():
+        parent = trees.get(n.parent_id)
+        if n.id != node_id and parent is None:
+            # Under a deactivated node. Parents come first, so its descendants are skipped too
+            continue
+        trees[n.id] = NodeTreeResponse(**{c.key: getattr(n, c.key) for c in Node.__table__.columns})
+        if parent is not None:
+            parent.children.append(trees[n.id])
+    return trees[node_id]
+
+
+def _path_match(term: str) -> ColumnElement[bool] | None:
+    """Nodes matching every word of ``term`` by their own name or an ancestor's.
+
+    So "Plant A compressor" finds the compressors under Plant A. The node's own
+    name must match one of the words long enough to use the trigram index, which
+    keeps the candidates few; each word is then looked up among the node and its
+    ancestors on the nested-set interval. None for single-word terms.
+    """
+    words = term.split()
+    anchors = [word for word in words if len(word) >= MIN_FUZZY_LENGTH]
+    if len(words) < 2 or not anchors:
+        return None
+    ancestor = aliased(Node)
+    return and_(
+        or_(*(trigram_match(word, Node.name) for word in anchors)),
+        *(
+            exists().where(
+                ancestor.organization_id == Node.organization_id,
+                ancestor.tree_left <= Node.tree_left,
+                ancestor.tree_right >= Node.tree_left,
+                trigram_match(word, ancestor.name),
+            )
+            for word in words
+        ),
+    )
+
+
+async def search_nodes(
+    db: AsyncSession,
+    org_id: uuid.UUID,
+    term: str,
+    limit: int = 20,
+    nodes: NodeSet | None = None,
+) -> list[NodeSearchResult]:
+    """Active nodes whose name, or breadcrumb, matches ``term``, best match first.
+
+    A node matches if its name matches the whole term, or if every word of the
+    term matches its name or an ancestor's (see ``_path_match``); the latter rank
+    first, as they match more of the query. ``nodes`` limits the search to a
+    member's accessible nodes (``permissions.get_accessible_node_ids``). Ancestor
+    names for every match are fetched together in a second query.
+    """
+    rank = trigram_rank(term, Node.name).label("rank")
+    matched = trigram_match(term, Node.name)
+    order = [rank.desc(), Node.depth, Node.name, Node.id]
+    path_match = _path_match(term)
+    if path_match is not None:
+        matched = or_(matched, path_match)
+        order.insert(0, path_match.desc())
+    result = await db.execute(
+        select(Node, rank)
+        .where(
+            Node.organization_id == org_id,
+            Node.is_active == True,  # noqa: E712
+            matched,
+            node_filter(Node.id, nodes),
+        )
+        .order_by(*order)
+        .limit(limit)
+    )
+    matches = result.all()
+
+    paths = {node.id: hierarchy.path_ids(node.materialized_path)[:-1] for node, _ in matches}
+    ancestor_ids = NodeSet.from_ids(a for path in paths.values() for a in path)
+    names = {}
+    if ancestor_ids:
+        result = await db.execute(
+            select(Node.id, Node.name).where(node_filter(Node.id, ancestor_ids))
+        )
+        names = dict(result.tuples().all())
+    return [
+        NodeSearchResult(
+            **NodeResponse.model_validate(node).model_dump(),
+            breadcrumb=[NodeBreadcrumb(id=a, name=names[a]) for a in paths[node.id] if a in names],
+            rank=rank,
+        )
+        for node, rank in matches
+    ]
+
+
 async def delete_node(db: AsyncSession, node_id: uuid.UUID) -> None:
     result = await db.execute(select(Node).where(Node.id == node_id))
     node = result.scalar_one_or_none()
     if not node:
         raise NotFoundError("Node not found")
-    node.is_active = False
-    # Also deactivate all descendants
-    result = await db.execute(
-        select(Node).where(
-            Node.materialized_path.like(f"{node.materialized_path}%"),
-            Node.id != node_id,
+
+    await _lock_hierarchy(db, node.organization_id)
+    await db.refresh(node)
+    # Deactivate the node and every descendant
+    await db.execute(
+        update(Node)
+        .where(
+            Node.organization_id == node.organization_id,
+            Node.tree_left.between(node.tree_left, node.tree_right),
         )
+        .values(is_active=False, descendant_count=0)
+        .execution_options(synchronize_session=False)
     )
-    for desc in result.scalars().all():
-        desc.is_active = False
+    if node.is_active:
+        await hierarchy.adjust_counts(
+            db, hierarchy.path_ids(node.materialized_path)[:-1], -(node.descendant_count + 1)
+        )
+    await _hierarchy_changed(db, node.organization_id)
+    auth_cache.invalidate_node_access(db, node.organization_id)
 
 
 # ─── Members ─────────────────────────────────────────────────────
@@ -252,6 +518,7 @@ async def invite_member(
         created_at=datetime.now(timezone.utc),
     )
     db.add(role)
+    auth_cache.invalidate_membership(db, user.id, org_id)
     return role
 
 
@@ -268,6 +535,8 @@ async def update_member_role(
     if not membership:
         raise NotFoundError("Member not found")
     membership.role = new_role
+    membership.membership_version += 1
+    auth_cache.invalidate_membership(db, user_id, org_id)
     return membership
 
 
@@ -304,6 +573,7 @@ async def update_node_assignments(
     for node_id in data.node_ids:
         db.add(UserNodeAssignment(user_id=user_id, node_id=node_id, created_at=now))
 
+    auth_cache.invalidate_node_access(db, org_id, user_id)
     return data.node_ids
 
 
@@ -348,6 +618,7 @@ async def remove_member(db: AsyncSession, org_id: uuid.UUID, user_id: uuid.UUID)
     if not membership:
         raise NotFoundError("Member not found")
     await db.delete(membership)
+    auth_cache.invalidate_membership(db, user_id, org_id)
 
     # Also remove node assignments
     await db.execute(
@@ -358,3 +629,4 @@ async def remove_member(db: AsyncSession, org_id: uuid.UUID, user_id: uuid.UUID)
             ),
         )
     )
+    auth_cache.invalidate_node_access(db, org_id, user_id)
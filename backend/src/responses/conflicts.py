@@ -0,0 +1,156 @@
+"""Field-level resolution of concurrent answer edits.
+
+Every answer carries a ``revision``, bumped on each write, and for each field
+(``value``, ``comment``) the revision and client time of its last change. An
+edit names the revision it was made from (``base_revision``). A field the edit
+changes that nobody has changed since then is applied as is. A field changed
+on both sides is a conflict. It is settled by that field's policy
+(``settings.answer_value_conflict_policy`` / ``answer_comment_conflict_policy``),
+and the losing side is kept in the conflict details.
+
+Edits without a base revision, from older clients, are taken to be based on
+whatever the server held at their client time. So a field conflicts only if
+the stored change was made later on some device, i.e. the edits arrived out of
+order.
+
+Everything here is pure: callers load the stored answers for a batch in one
+query, merge in memory and write the result with one bulk upsert.
+"""
+
+import dataclasses
+from datetime import datetime
+from typing import Any
+
+from src.config import settings
+from src.core.enums import ConflictPolicy
+from src.responses.models import Answer
+
+FIELDS = ("value", "comment")
+# Every column a merge writes
+COLUMNS = (
+    *FIELDS,
+    *(f"{field}_{suffix}" for field in FIELDS for suffix in ("revision", "client_at")),
+    "revision",
+    "client_created_at",
+)
+
+
+@dataclasses.dataclass(slots=True)
+class Edit:
+    # Only the fields the client changed
+    fields: dict[str, Any]
+    client_at: datetime
+    base_revision: int | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class Merge:
+    """The row to write for one answer: the stored one with every winning edit applied.
+
+    Several edits to one answer in a batch fold into one Merge and one write.
+    """
+
+    stored: Answer | None
+    row: dict[str, Any]
+    changed: bool = False
+
+    @classmethod
+    def start(cls, stored: Answer | None) -> "Merge":
+        if stored is None:
+            row = {"revision": 1, "client_created_at": None}
+            for field in FIELDS:
+                row.update({field: None, f"{field}_revision": 0, f"{field}_client_at": None})
+            return cls(stored, row, changed=True)
+        row = {"revision": stored.revision + 1, "client_created_at": stored.client_created_at}
+        for field in FIELDS:
+            for column in (field, f"{field}_revision", f"{field}_client_at"):
+                row[column] = getattr(stored, column)
+        return cls(stored, row)
+
+
+def policies() -> dict[str, ConflictPolicy]:
+    return {
+        "value": settings.answer_value_conflict_policy,
+        "comment": settings.answer_comment_conflict_policy,
+    }
+
+
+def _concurrent(stored_revision: int | None, stored_at: datetime | None, edit: Edit) -> bool:
+    if edit.base_revision is not None:
+        return (stored_revision or 0) > edit.base_revision
+    return stored_at is not None and stored_at > edit.client_at
+
+
+def _edit_wins(policy: ConflictPolicy, stored_at: datetime | None, edit: Edit) -> bool:
+    if policy == ConflictPolicy.CLIENT_WINS:
+        return True
+    if policy == ConflictPolicy.SERVER_WINS:
+        return False
+    return stored_at is None or edit.client_at >= stored_at
+
+
+def _details(policy: ConflictPolicy, winner: str, lost: dict[str, Any]) -> dict[str, Any]:
+    if isinstance(lost.get("client_at"), datetime):
+        lost["client_at"] = lost["client_at"].isoformat()
+    return {"policy": policy.value, "winner": winner, "lost": lost}
+
+
+def apply(
+    merge: Merge, edit: Edit, policies: dict[str, ConflictPolicy]
+) -> dict[str, dict[str, Any]]:
+    """Fold ``edit`` into ``merge``. Returns conflict details per conflicting field.
+
+    Conflicts are judged against the stored answer, not against earlier edits in
+    the same batch: a later edit from the same client supersedes an earlier one.
+    """
+    stored = merge.stored
+    revision = merge.row["revision"]
+    conflicts = {}
+    applied = False
+    for field, incoming in edit.fields.items():
+        if stored is not None and incoming == merge.row[field]:
+            continue
+        stored_at = stored and getattr(stored, f"{field}_client_at")
+        if stored is not None and incoming != getattr(stored, field) and _concurrent(
+            getattr(stored, f"{field}_revision"), stored_at, edit
+        ):
+            if not _edit_wins(policies[field], stored_at, edit):
+                conflicts[field] = _details(policies[field], "server", {
+                    "value": incoming,
+                    "base_revision": edit.base_revision,
+                    "client_at": edit.client_at,
+                })
+                continue
+            conflicts[field] = _details(policies[field], "client", {
+                "value": getattr(stored, field),
+                "revision": getattr(stored, f"{field}_revision"),
+                "client_at": stored_at,
+            })
+        applied = True
+        merge.row[field] = incoming
+        merge.row[f"{field}_revision"] = revision
+        merge.row[f"{field}_client_at"] = edit.client_at
+    latest = merge.row["client_created_at"]
+    if applied or latest is None:
+        merge.changed = True
+        merge.row["client_created_at"] = max(latest, edit.client_at) if latest else edit.client_at
+    return conflicts
+
+
+def delete_conflict(
+    stored: Answer, edit: Edit, policies: dict[str, ConflictPolicy]
+) -> dict[str, Any] | None:
+    """Details if deleting ``stored`` loses to a concurrent change; None if the delete wins.
+
+    A delete clears every field, so it is settled like an edit of the value.
+    """
+    stored_at = max(
+        (t for t in (stored.value_client_at, stored.comment_client_at) if t), default=None
+    )
+    if not _concurrent(stored.revision, stored_at, edit):
+        return None
+    if _edit_wins(policies["value"], stored_at, edit):
+        return None
+    return _details(policies["value"], "server", {
+        "deleted": True, "base_revision": edit.base_revision, "client_at": edit.client_at,
+    })
@@ -2,98 +2,329 @@
 
 Evaluates answers against question reference values to determine
 if the answer is conforming or non-conforming.
+
+A question's ``reference_value`` is compiled once into a rule — a callable that
+takes the answer value and returns a status — with thresholds pre-parsed and
+regexes precompiled. Compiled rules are cached per (question id, updated_at), so
+editing a question naturally retires its old rule; ``check_conformity``, which has
+no question id, caches them per (question type, reference value) instead.
+
+Text patterns that could stall a worker on backtracking are refused when a
+question is saved (``check_pattern``, used by the question schemas), never at
+evaluation time: a stored pattern is always matched, as it always was.
 """
 
+import copy
+import functools
+import math
+import re
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+
+from src.core.cache import TTLCache
 from src.core.enums import ConformityStatus, QuestionType
 
+Rule = Callable[[dict | None], ConformityStatus]
+
+_CONFORMING = ConformityStatus.CONFORMING
+_NON_CONFORMING = ConformityStatus.NON_CONFORMING
+_NOT_APPLICABLE = ConformityStatus.NOT_APPLICABLE
+
+# Limit for patterns saved from now on (see ``check_pattern``)
+MAX_PATTERN_LENGTH = 256
+
+# question id (as int — UUID.__hash__ is pure Python and dominates a lookup)
+# -> (question updated_at, compiled rule)
+_rule_cache: TTLCache[int, tuple[datetime, Rule]] = TTLCache(maxsize=20_000)
+
+# (question type, repr of the reference value) -> compiled rule
+_reference_rules: TTLCache[tuple[QuestionType, str], Rule] = TTLCache(maxsize=20_000)
+# id of a reference value -> (question type, the value, a copy to catch mutation, rule)
+_identity_rules: TTLCache[int, tuple[QuestionType, dict | None, dict | None, Rule]] = TTLCache(
+    maxsize=1024
+)
+
 
 def check_conformity(
     question_type: QuestionType,
     value: dict | None,
     reference_value: dict | None,
 ) -> ConformityStatus:
-    """Check if an answer value conforms to the question's reference value."""
-    if reference_value is None or value is None:
-        return ConformityStatus.NOT_APPLICABLE
+    """Check if an answer value conforms to the question's reference value.
+
+    Rules are memoized per reference value: by identity while the same dict is
+    passed again unchanged, otherwise by its repr (reference values are JSON).
+    """
+    entry = _identity_rules.get(id(reference_value))
+    if (
+        entry is not None
+        and entry[1] is reference_value
+        and entry[0] == question_type
+        and entry[2] == reference_value
+    ):
+        return entry[3](value)
+    key = (question_type, repr(reference_value))
+    rule = _reference_rules.get(key)
+    if rule is None:
+        rule = compile_rule(question_type, reference_value)
+        _reference_rules.set(key, rule)
+    # The entry keeps the dict alive, so its id can't be reused while cached
+    _identity_rules.set(
+        id(reference_value),
+        (question_type, reference_value, copy.deepcopy(reference_value), rule),
+    )
+    return rule(value)
 
+
+def rule_for(
+    question_id: uuid.UUID,
+    updated_at: datetime,
+    question_type: QuestionType,
+    reference_value: dict | None,
+) -> Rule:
+    """Return the compiled rule for a question, compiling it on first use."""
+    key = question_id.int
+    cached = _rule_cache.get(key)
+    if cached is not None and cached[0] == updated_at:
+        return cached[1]
+    rule = compile_rule(question_type, reference_value)
+    _rule_cache.set(key, (updated_at, rule))
+    return rule
+
+
+def compile_rule(question_type: QuestionType, reference_value: dict | None) -> Rule:
+    """Compile a reference value into a rule. Invalid references yield a not-applicable rule."""
+    compiler = _COMPILERS.get(question_type)
+    if reference_value is None or compiler is None:
+        return not_applicable_rule
     try:
-        checker = _CHECKERS.get(question_type)
-        if checker is None:
-            return ConformityStatus.NOT_APPLICABLE
-        return checker(value, reference_value)
-    except (KeyError, TypeError, ValueError):
-        return ConformityStatus.NOT_APPLICABLE
+        check = compiler(reference_value)
+    except (KeyError, TypeError, ValueError, OverflowError, re.error):
+        return not_applicable_rule
+    if check is None:
+        return not_applicable_rule
+
+    def rule(value: dict | None) -> ConformityStatus:
+        if value is None:
+            return _NOT_APPLICABLE
+        try:
+            return check(value)
+        except (KeyError, TypeError, ValueError, AttributeError, OverflowError):
+            return _NOT_APPLICABLE
+
+    return rule
+
+
+def not_applicable_rule(value: dict | None) -> ConformityStatus:
+    return _NOT_APPLICABLE
 
 
-def _check_numeric(value: dict, ref: dict) -> ConformityStatus:
-    number = value.get("number")
-    if number is None:
-        return ConformityStatus.NOT_APPLICABLE
+def _status(ok: bool) -> ConformityStatus:
+    return _CONFORMING if ok else _NON_CONFORMING
 
-    number = float(number)
+
+def _compile_numeric(ref: dict) -> Callable[[dict], ConformityStatus] | None:
     operator = ref.get("operator", "between")
 
     if operator == "between":
-        min_val = float(ref.get("min", float("-inf")))
-        max_val = float(ref.get("max", float("inf")))
-        return ConformityStatus.CONFORMING if min_val <= number <= max_val else ConformityStatus.NON_CONFORMING
+        min_val = float(ref.get("min", -math.inf))
+        max_val = float(ref.get("max", math.inf))
+
+        def between(value: dict) -> ConformityStatus:
+            number = value.get("number")
+            if number is None:
+                return _NOT_APPLICABLE
+            return _status(min_val <= float(number) <= max_val)
 
-    if operator == "eq":
-        return ConformityStatus.CONFORMING if number == float(ref["value"]) else ConformityStatus.NON_CONFORMING
+        return between
 
-    if operator == "gte":
-        return ConformityStatus.CONFORMING if number >= float(ref["value"]) else ConformityStatus.NON_CONFORMING
+    compare = _NUMERIC_OPERATORS.get(operator)
+    if compare is None:
+        return None
+    threshold = float(ref["value"])
 
-    if operator == "lte":
-        return ConformityStatus.CONFORMING if number <= float(ref["value"]) else ConformityStatus.NON_CONFORMING
+    def check(value: dict) -> ConformityStatus:
+        number = value.get("number")
+        if number is None:
+            return _NOT_APPLICABLE
+        return _status(compare(float(number), threshold))
 
-    if operator == "gt":
-        return ConformityStatus.CONFORMING if number > float(ref["value"]) else ConformityStatus.NON_CONFORMING
+    return check
 
-    if operator == "lt":
-        return ConformityStatus.CONFORMING if number < float(ref["value"]) else ConformityStatus.NON_CONFORMING
 
-    return ConformityStatus.NOT_APPLICABLE
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    "eq": float.__eq__,
+    "gte": float.__ge__,
+    "lte": float.__le__,
+    "gt": float.__gt__,
+    "lt": float.__lt__,
+}
 
 
-def _check_boolean(value: dict, ref: dict) -> ConformityStatus:
-    answer = value.get("boolean")
+def _compile_boolean(ref: dict) -> Callable[[dict], ConformityStatus] | None:
     expected = ref.get("expected")
-    if answer is None or expected is None:
-        return ConformityStatus.NOT_APPLICABLE
-    return ConformityStatus.CONFORMING if answer == expected else ConformityStatus.NON_CONFORMING
+    if expected is None:
+        return None
+
+    def check(value: dict) -> ConformityStatus:
+        answer = value.get("boolean")
+        if answer is None:
+            return _NOT_APPLICABLE
+        return _status(answer == expected)
+
+    return check
 
 
-def _check_single_choice(value: dict, ref: dict) -> ConformityStatus:
-    selected = value.get("selected")
+def _compile_single_choice(ref: dict) -> Callable[[dict], ConformityStatus] | None:
     expected_values = ref.get("expected_values", [])
-    if selected is None or not expected_values:
-        return ConformityStatus.NOT_APPLICABLE
-    return ConformityStatus.CONFORMING if selected in expected_values else ConformityStatus.NON_CONFORMING
+    if not expected_values:
+        return None
+    expected = _hashable_set(expected_values)
 
+    def check(value: dict) -> ConformityStatus:
+        selected = value.get("selected")
+        if selected is None:
+            return _NOT_APPLICABLE
+        try:
+            return _status(selected in expected)
+        except TypeError:
+            # Unhashable answer (e.g. a list) — fall back to the original list semantics
+            return _status(selected in expected_values)
 
-def _check_multi_choice(value: dict, ref: dict) -> ConformityStatus:
-    selected = set(value.get("selected", []))
-    expected_values = set(ref.get("expected_values", []))
-    if not selected or not expected_values:
-        return ConformityStatus.NOT_APPLICABLE
-    # All selected values must be within expected values
-    return ConformityStatus.CONFORMING if selected <= expected_values else ConformityStatus.NON_CONFORMING
+    return check
 
 
-def _check_text(value: dict, ref: dict) -> ConformityStatus:
-    import re
-    text = value.get("text", "")
+def _compile_multi_choice(ref: dict) -> Callable[[dict], ConformityStatus] | None:
+    expected = frozenset(ref.get("expected_values", []))
+    if not expected:
+        return None
+
+    def check(value: dict) -> ConformityStatus:
+        selected = set(value.get("selected", []))
+        if not selected:
+            return _NOT_APPLICABLE
+        # All selected values must be within expected values
+        return _status(selected <= expected)
+
+    return check
+
+
+def _compile_text(ref: dict) -> Callable[[dict], ConformityStatus] | None:
     pattern = ref.get("pattern")
     if not pattern:
-        return ConformityStatus.NOT_APPLICABLE
-    return ConformityStatus.CONFORMING if re.match(pattern, text) else ConformityStatus.NON_CONFORMING
+        return None
+    match = _compile_pattern(pattern).match
+
+    def check(value: dict) -> ConformityStatus:
+        return _status(match(value.get("text", "")) is not None)
+
+    return check
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def check_pattern(pattern: str) -> None:
+    """Raise ValueError unless ``pattern`` is a valid regex that is safe to store."""
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise ValueError(f"Pattern is longer than {MAX_PATTERN_LENGTH} characters")
+    try:
+        _compile_pattern(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern: {e}") from None
+    if _has_ambiguous_repeat(pattern):
+        raise ValueError("Pattern repeats an ambiguous expression, e.g. (a+)+ or (a|aa)+")
+
+
+def _hashable_set(values: list) -> frozenset | tuple:
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
+
+
+def _has_ambiguous_repeat(pattern: str) -> bool:
+    """Detect unbounded repeats whose body can match the same text more than one way.
+
+    Two shapes are caught: a repeat nested in another, e.g. ``(a+)+``, and an
+    alternation inside a repeat whose alternatives can start with the same
+    character or match nothing, e.g. ``(a|aa)+``. These cause catastrophic
+    backtracking in Python's backtracking regex engine. The check is
+    conservative (``(a|ab)+`` is refused too) but not complete: polynomial
+    shapes such as adjacent repeats, ``\\d+\\d+x``, still pass.
+    """
+    from re import _parser  # type: ignore[attr-defined]
+
+    repeats = {_parser.MAX_REPEAT, _parser.MIN_REPEAT, _parser.POSSESSIVE_REPEAT}
+
+    def first_chars(items) -> list[tuple[int, int]] | None:
+        """Code point ranges a sequence can start with; None if unknown or it can be empty."""
+        for op, arg in items:
+            if op == _parser.LITERAL:
+                return [(arg, arg)]
+            if op == _parser.IN:
+                ranges = []
+                for item_op, item_arg in arg:
+                    if item_op == _parser.LITERAL:
+                        ranges.append((item_arg, item_arg))
+                    elif item_op == _parser.RANGE:
+                        ranges.append(item_arg)
+                    else:
+                        return None
+                return ranges
+            if op == _parser.SUBPATTERN:
+                return first_chars(arg[-1])
+            if op in (_parser.AT, _parser.ASSERT, _parser.ASSERT_NOT):
+                continue  # zero-width
+            return None
+        return None
+
+    def overlapping(branches) -> bool:
+        seen: list[tuple[int, int]] = []
+        for branch in branches:
+            ranges = first_chars(branch)
+            if ranges is None:
+                return True
+            if any(lo <= s_hi and s_lo <= hi for lo, hi in ranges for s_lo, s_hi in seen):
+                return True
+            seen.extend(ranges)
+        return False
+
+    def walk(items, inside_repeat: bool) -> bool:
+        for op, arg in items:
+            if op in repeats:
+                _min, max_, sub = arg
+                unbounded = max_ == _parser.MAXREPEAT
+                if unbounded and inside_repeat:
+                    return True
+                if walk(sub, inside_repeat or unbounded):
+                    return True
+            elif op == _parser.SUBPATTERN:
+                if walk(arg[-1], inside_repeat):
+                    return True
+            elif op == _parser.BRANCH:
+                if inside_repeat and overlapping(arg[1]):
+                    return True
+                if any(walk(branch, inside_repeat) for branch in arg[1]):
+                    return True
+            elif op in (_parser.ASSERT, _parser.ASSERT_NOT):
+                if walk(arg[1], inside_repeat):
+                    return True
+            elif op == _parser.ATOMIC_GROUP:
+                if walk(arg, inside_repeat):
+                    return True
+        return False
+
+    return walk(_parser.parse(pattern), False)
 
 
-_CHECKERS = {
-    QuestionType.NUMERIC: _check_numeric,
-    QuestionType.BOOLEAN: _check_boolean,
-    QuestionType.SINGLE_CHOICE: _check_single_choice,
-    QuestionType.MULTI_CHOICE: _check_multi_choice,
-    QuestionType.TEXT: _check_text,
+_COMPILERS: dict[QuestionType, Callable[[dict], Callable[[dict], ConformityStatus] | None]] = {
+    QuestionType.NUMERIC: _compile_numeric,
+    QuestionType.BOOLEAN: _compile_boolean,
+    QuestionType.SINGLE_CHOICE: _compile_single_choice,
+    QuestionType.MULTI_CHOICE: _compile_multi_choice,
+    QuestionType.TEXT: _compile_text,
 }
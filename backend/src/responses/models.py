@@ -2,20 +2,37 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, Boolean, DateTime, Float, ForeignKey, ForeignKeyConstraint, Index, Integer, Numeric, String, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.core.base_model import Base, TimestampMixin, UUIDMixin
-from src.core.enums import ConformityStatus, ResponseStatus
+from src.core.base_model import Base, ChangeTrackedMixin, TimestampMixin, UUIDMixin
+from src.core.enums import ConformityStatus, ReevaluationStatus, ResponseStatus
 
 
-class Response(UUIDMixin, TimestampMixin, Base):
+class Response(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "responses"
+    # One (filter, created_at, id) index per list filter so keyset pages are range scans
+    __table_args__ = (
+        Index("ix_responses_created_at_id", "created_at", "id"),
+        Index("ix_responses_form_created", "form_id", "created_at", "id"),
+        Index("ix_responses_node_created", "node_id", "created_at", "id"),
+        Index("ix_responses_respondent_created", "respondent_id", "created_at", "id"),
+        Index("ix_responses_status_created", "status", "created_at", "id"),
+        # Delta pulls; a write to any of its answers re-stamps the response (see migration)
+        Index("ix_responses_respondent_change", "respondent_id", "change_xid", "id"),
+        ForeignKeyConstraint(
+            ["form_id", "form_version"],
+            ["form_snapshots.form_id", "form_snapshots.version"],
+            ondelete="RESTRICT",
+        ),
+    )
 
     form_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("forms.id", ondelete="RESTRICT"), nullable=False
     )
+    # Published snapshot the response was filled against; NULL for responses that predate snapshots
+    form_version: Mapped[int | None] = mapped_column(Integer)
     node_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("nodes.id", ondelete="RESTRICT"), nullable=False
     )
@@ -40,9 +57,12 @@ class Response(UUIDMixin, TimestampMixin, Base):
     )
 
 
-class Answer(UUIDMixin, TimestampMixin, Base):
+class Answer(UUIDMixin, TimestampMixin, ChangeTrackedMixin, Base):
     __tablename__ = "answers"
-    __table_args__ = (UniqueConstraint("response_id", "question_id"),)
+    __table_args__ = (
+        UniqueConstraint("response_id", "question_id"),
+        Index("ix_answers_question_id", "question_id", "id"),
+    )
 
     response_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("responses.id", ondelete="CASCADE"), nullable=False
@@ -55,6 +75,13 @@ class Answer(UUIDMixin, TimestampMixin, Base):
     conformity_status: Mapped[ConformityStatus | None] = mapped_column()
     answered_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     client_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Bumped on every write; clients send the one they edited from (see responses.conflicts)
+    revision: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+    # Per field: the revision and client time of its last change
+    value_revision: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    value_client_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    comment_revision: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    comment_client_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
     response: Mapped["Response"] = relationship(back_populates="answers")
     attachments: Mapped[list["AnswerAttachment"]] = relationship(back_populates="answer")
@@ -74,3 +101,30 @@ class AnswerAttachment(UUIDMixin, Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
     answer: Mapped["Answer"] = relationship(back_populates="attachments")
+
+
+class ConformityReevaluation(UUIDMixin, TimestampMixin, Base):
+    """Background job re-checking stored answers after a question's reference value changes.
+
+    Answers are walked in id order; ``last_answer_id`` is the resume point.
+    """
+
+    __tablename__ = "conformity_reevaluations"
+    __table_args__ = (
+        Index("ix_conformity_reevaluations_question_created", "question_id", "created_at"),
+    )
+
+    question_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("questions.id", ondelete="CASCADE"), nullable=False
+    )
+    status: Mapped[ReevaluationStatus] = mapped_column(
+        nullable=False, default=ReevaluationStatus.PENDING
+    )
+    last_answer_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    processed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    changed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_per_second: Mapped[float | None] = mapped_column(Float)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    error: Mapped[str | None] = mapped_column(Text)
@@ -0,0 +1,384 @@
+"""Batch re-evaluation of stored answers when a question's reference value changes.
+
+Editing ``Question.reference_value`` leaves every stored ``Answer.conformity_status``
+computed against the old reference. ``enqueue`` records a job, and ``run_job``
+streams the question's answers in id-ordered chunks. Only answers to responses
+that follow the live definition (``form_version`` unset) are touched; the rest
+are pinned to their published snapshot, which an edit doesn't change. Numeric, boolean and choice
+rules are evaluated as NumPy array operations; anything with an unexpected shape
+falls back to the compiled scalar rule so results match ``check_conformity``
+exactly. Only rows whose status changed are written back, one
+``UPDATE ... FROM (VALUES ...)`` per chunk.
+
+Each chunk commits together with the job's cursor, so an interrupted job resumes
+at the first unprocessed chunk. Jobs carry a heartbeat; ``resume_interrupted``
+(run at startup) picks up pending jobs and running jobs whose heartbeat went stale.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from sqlalchemy import column, func, or_, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import async_session
+from src.core.enums import ConformityStatus, QuestionType, ReevaluationStatus
+from src.forms.models import Question
+from src.responses.conformity import Rule, compile_rule, not_applicable_rule
+from src.responses.models import Answer, ConformityReevaluation, Response
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 5000
+HEARTBEAT_TIMEOUT = timedelta(seconds=60)
+
+# Status codes used in the arrays; index into STATUSES
+CONFORMING, NON_CONFORMING, NOT_APPLICABLE = 0, 1, 2
+STATUSES = (
+    ConformityStatus.CONFORMING,
+    ConformityStatus.NON_CONFORMING,
+    ConformityStatus.NOT_APPLICABLE,
+)
+_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+_ACTIVE = (ReevaluationStatus.PENDING, ReevaluationStatus.RUNNING)
+
+
+# ─── Vectorized evaluation ───────────────────────────────────────
+
+def evaluate(
+    question_type: QuestionType,
+    reference_value: dict | None,
+    answer_values: Sequence[dict | None],
+) -> np.ndarray:
+    """Evaluate many answers against one reference value. Returns an int8 array of status codes."""
+    rule = compile_rule(question_type, reference_value)
+    n = len(answer_values)
+    if rule is not_applicable_rule:
+        return np.full(n, NOT_APPLICABLE, dtype=np.int8)
+
+    vectorized = _VECTORIZED.get(question_type)
+    if vectorized is None:
+        return _scalar(rule, answer_values, range(n))
+
+    codes, fallback = vectorized(reference_value, answer_values)
+    if codes is None:
+        return _scalar(rule, answer_values, range(n))
+    if fallback:
+        codes[fallback] = _scalar(rule, answer_values, fallback)
+    return codes
+
+
+def _scalar(rule: Rule, answer_values: Sequence[dict | None], indices: Sequence[int]) -> np.ndarray:
+    return np.fromiter(
+        (_CODES[rule(answer_values[i])] for i in indices), dtype=np.int8, count=len(indices)
+    )
+
+
+def _codes(present: np.ndarray, ok: np.ndarray) -> np.ndarray:
+    return np.where(
+        present, np.where(ok, CONFORMING, NON_CONFORMING), NOT_APPLICABLE
+    ).astype(np.int8)
+
+
+def _numeric(ref: dict, answer_values: Sequence[dict | None]):
+    n = len(answer_values)
+    numbers = np.zeros(n, dtype=np.float64)
+    present = np.zeros(n, dtype=bool)
+    fallback: list[int] = []
+    for i, value in enumerate(answer_values):
+        if type(value) is not dict:
+            if value is not None:
+                fallback.append(i)
+            continue
+        number = value.get("number")
+        if number is None:
+            continue
+        if type(number) is float or type(number) is int:
+            try:
+                numbers[i] = number
+            except OverflowError:
+                fallback.append(i)
+                continue
+            present[i] = True
+        else:
+            # Strings, bools and the like go through float() in the scalar rule
+            fallback.append(i)
+
+    operator = ref.get("operator", "between")
+    if operator == "between":
+        low = float(ref.get("min", -np.inf))
+        high = float(ref.get("max", np.inf))
+        ok = (numbers >= low) & (numbers <= high)
+    else:
+        ok = _NUMERIC_UFUNCS[operator](numbers, float(ref["value"]))
+    return _codes(present, ok), fallback
+
+
+_NUMERIC_UFUNCS = {
+    "eq": np.equal,
+    "gte": np.greater_equal,
+    "lte": np.less_equal,
+    "gt": np.greater,
+    "lt": np.less,
+}
+
+
+def _boolean(ref: dict, answer_values: Sequence[dict | None]):
+    expected = ref.get("expected")
+    if type(expected) is not bool:
+        return None, []
+    n = len(answer_values)
+    answers = np.zeros(n, dtype=bool)
+    present = np.zeros(n, dtype=bool)
+    fallback: list[int] = []
+    for i, value in enumerate(answer_values):
+        if type(value) is not dict:
+            if value is not None:
+                fallback.append(i)
+            continue
+        answer = value.get("boolean")
+        if answer is None:
+            continue
+        if type(answer) is bool:
+            answers[i] = answer
+            present[i] = True
+        else:
+            fallback.append(i)
+    return _codes(present, answers == expected), fallback
+
+
+def _single_choice(ref: dict, answer_values: Sequence[dict | None]):
+    expected = ref["expected_values"]
+    if not all(type(v) is str for v in expected):
+        return None, []
+    n = len(answer_values)
+    selected = [""] * n
+    present = np.zeros(n, dtype=bool)
+    fallback: list[int] = []
+    for i, value in enumerate(answer_values):
+        if type(value) is not dict:
+            if value is not None:
+                fallback.append(i)
+            continue
+        choice = value.get("selected")
+        if choice is None:
+            continue
+        if type(choice) is str:
+            selected[i] = choice
+            present[i] = True
+        else:
+            fallback.append(i)
+    ok = np.isin(np.array(selected, dtype=object), np.array(expected, dtype=object))
+    return _codes(present, ok), fallback
+
+
+def _multi_choice(ref: dict, answer_values: Sequence[dict | None]):
+    expected = ref["expected_values"]
+    if not all(type(v) is str for v in expected):
+        return None, []
+    n = len(answer_values)
+    flat: list[str] = []
+    owners: list[int] = []
+    fallback: list[int] = []
+    for i, value in enumerate(answer_values):
+        if type(value) is not dict:
+            if value is not None:
+                fallback.append(i)
+            continue
+        choices = value.get("selected", [])
+        if type(choices) is not list or not all(type(c) is str for c in choices):
+            fallback.append(i)
+            continue
+        flat.extend(choices)
+        owners.extend([i] * len(choices))
+
+    owner_idx = np.array(owners, dtype=np.intp)
+    allowed = np.isin(np.array(flat, dtype=object), np.array(expected, dtype=object))
+    # A row conforms when none of its selections falls outside the expected set
+    outside = np.bincount(owner_idx[~allowed], minlength=n) > 0
+    present = np.bincount(owner_idx, minlength=n) > 0
+    return _codes(present, ~outside), fallback
+
+
+_VECTORIZED = {
+    QuestionType.NUMERIC: _numeric,
+    QuestionType.BOOLEAN: _boolean,
+    QuestionType.SINGLE_CHOICE: _single_choice,
+    QuestionType.MULTI_CHOICE: _multi_choice,
+}
+
+
+# ─── Jobs ────────────────────────────────────────────────────────
+
+async def enqueue(db: AsyncSession, question_id: uuid.UUID) -> ConformityReevaluation:
+    """Record a re-evaluation job for a question, superseding any still in flight."""
+    now = datetime.now(UTC)
+    await db.execute(
+        update(ConformityReevaluation)
+        .where(
+            ConformityReevaluation.question_id == question_id,
+            ConformityReevaluation.status.in_(_ACTIVE),
+        )
+        .values(status=ReevaluationStatus.SUPERSEDED, finished_at=now, updated_at=now)
+    )
+    job = ConformityReevaluation(question_id=question_id, status=ReevaluationStatus.PENDING)
+    db.add(job)
+    await db.flush()
+    return job
+
+
+async def run_pending(question_id: uuid.UUID) -> None:
+    """Run the pending job for a question, if any. Meant for FastAPI background tasks."""
+    async with async_session() as db:
+        result = await db.execute(
+            select(ConformityReevaluation.id).where(
+                ConformityReevaluation.question_id == question_id,
+                ConformityReevaluation.status == ReevaluationStatus.PENDING,
+            )
+        )
+        job_ids = list(result.scalars().all())
+    for job_id in job_ids:
+        await run_job(job_id)
+
+
+async def resume_interrupted() -> None:
+    """Resume jobs left pending or abandoned mid-run (e.g. by a restart)."""
+    try:
+        await _resume_interrupted()
+    except Exception:
+        logger.exception("Could not resume conformity re-evaluations")
+
+
+async def _resume_interrupted() -> None:
+    for attempt in range(2):
+        async with async_session() as db:
+            result = await db.execute(
+                select(ConformityReevaluation.id)
+                .where(ConformityReevaluation.status.in_(_ACTIVE))
+                .order_by(ConformityReevaluation.created_at)
+            )
+            job_ids = list(result.scalars().all())
+        if not job_ids:
+            return
+        for job_id in job_ids:
+            await run_job(job_id)
+        if attempt == 0:
+            # Jobs whose heartbeat was still fresh couldn't be claimed yet
+            await asyncio.sleep(HEARTBEAT_TIMEOUT.total_seconds())
+
+
+async def _claim(job_id: uuid.UUID) -> bool:
+    now = datetime.now(UTC)
+    async with async_session() as db, db.begin():
+        result = await db.execute(
+            update(ConformityReevaluation)
+            .where(
+                ConformityReevaluation.id == job_id,
+                or_(
+                    ConformityReevaluation.status == ReevaluationStatus.PENDING,
+                    (ConformityReevaluation.status == ReevaluationStatus.RUNNING)
+                    & (ConformityReevaluation.heartbeat_at < now - HEARTBEAT_TIMEOUT),
+                ),
+            )
+            .values(
+                status=ReevaluationStatus.RUNNING,
+                heartbeat_at=now,
+                started_at=func.coalesce(ConformityReevaluation.started_at, now),
+                updated_at=now,
+            )
+            .returning(ConformityReevaluation.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+
+async def run_job(job_id: uuid.UUID) -> None:
+    """Process a job chunk by chunk until it completes or is superseded."""
+    if not await _claim(job_id):
+        return
+
+    run_started = time.monotonic()
+    run_processed = 0
+    try:
+        while True:
+            async with async_session() as db, db.begin():
+                job = await db.get(ConformityReevaluation, job_id, with_for_update=True)
+                if job is None or job.status != ReevaluationStatus.RUNNING:
+                    return
+                done, processed, changed = await _process_chunk(db, job)
+                now = datetime.now(UTC)
+                run_processed += processed
+                elapsed = time.monotonic() - run_started
+                job.processed_count += processed
+                job.changed_count += changed
+                job.rows_per_second = run_processed / elapsed if elapsed > 0 else None
+                job.heartbeat_at = now
+                if done:
+                    job.status = ReevaluationStatus.COMPLETED
+                    job.finished_at = now
+                total_processed, total_changed = job.processed_count, job.changed_count
+                rate = job.rows_per_second
+
+            logger.info(
+                "Conformity re-evaluation %s: %d rows processed, %d changed (%.0f rows/s)",
+                job_id, total_processed, total_changed, rate or 0.0,
+            )
+            if done:
+                return
+    except Exception as e:
+        logger.exception("Conformity re-evaluation %s failed", job_id)
+        async with async_session() as db, db.begin():
+            job = await db.get(ConformityReevaluation, job_id)
+            if job is not None and job.status == ReevaluationStatus.RUNNING:
+                job.status = ReevaluationStatus.FAILED
+                job.error = str(e)
+                job.finished_at = datetime.now(UTC)
+
+
+async def _process_chunk(
+    db: AsyncSession, job: ConformityReevaluation
+) -> tuple[bool, int, int]:
+    """Re-evaluate the next chunk. Returns (done, rows processed, rows changed)."""
+    question = await db.get(Question, job.question_id)
+    if question is None:
+        return True, 0, 0
+
+    query = (
+        select(Answer.id, Answer.value, Answer.conformity_status)
+        .join(Response, Response.id == Answer.response_id)
+        .where(Answer.question_id == job.question_id, Response.form_version.is_(None))
+        .order_by(Answer.id)
+        .limit(CHUNK_SIZE)
+    )
+    if job.last_answer_id is not None:
+        query = query.where(Answer.id > job.last_answer_id)
+    rows = (await db.execute(query)).all()
+    if not rows:
+        return True, 0, 0
+
+    new_codes = evaluate(question.question_type, question.reference_value, [r.value for r in rows])
+    old_codes = np.fromiter(
+        (_CODES.get(r.conformity_status, -1) for r in rows), dtype=np.int8, count=len(rows)
+    )
+    changed_idx = np.flatnonzero(new_codes != old_codes)
+
+    if changed_idx.size:
+        changes = values(
+            column("id", Answer.id.type),
+            column("conformity_status", Answer.conformity_status.type),
+            name="changes",
+        ).data([(rows[i].id, STATUSES[new_codes[i]]) for i in changed_idx.tolist()])
+        await db.execute(
+            update(Answer)
+            .where(Answer.id == changes.c.id)
+            .values(conformity_status=changes.c.conformity_status, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+    job.last_answer_id = rows[-1].id
+    return len(rows) < CHUNK_SIZE, len(rows), int(changed_idx.size)
@@ -1,18 +1,28 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
 from src.core.dependencies import get_current_org_member, get_current_user
 from src.core.enums import ResponseStatus
+from src.core.etag import IMMUTABLE, REVALIDATE, json_response, make_etag
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    page_params,
+)
 from src.core.storage import generate_upload_url
+from src.forms.schemas import FormDetailResponse
 from src.organizations.models import User, UserOrganizationRole
 from src.responses import service
 from src.responses.schemas import (
-    AnswerResponse,
     AnswerUpsert,
+    AnswerUpsertResult,
+    ReevaluationResponse,
     ResponseCreate,
     ResponseDetailResponse,
     ResponseResponse,
@@ -23,17 +33,21 @@ from src.responses.schemas import (
 router = APIRouter(tags=["responses"])
 
 
-@router.get("/organizations/{org_id}/responses", response_model=list[ResponseResponse])
+@router.get(
+    "/organizations/{org_id}/responses",
+    response_model=CursorPage[ResponseResponse] | PagedResponse[ResponseResponse],
+)
 async def list_responses(
     org_id: uuid.UUID,
     _: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
     db: Annotated[AsyncSession, Depends(get_db)],
+    page: Annotated[CursorParams | PaginationParams, Depends(page_params)],
     form_id: uuid.UUID | None = None,
     node_id: uuid.UUID | None = None,
     respondent_id: uuid.UUID | None = None,
     status: ResponseStatus | None = None,
 ):
-    return await service.list_responses(db, org_id, form_id, node_id, respondent_id, status)
+    return await service.list_responses(db, org_id, form_id, node_id, respondent_id, status, page)
 
 
 @router.post("/forms/{form_id}/responses", response_model=ResponseResponse)
@@ -55,14 +69,25 @@ async def get_response(
     return await service.get_response(db, response_id)
 
 
-@router.put("/responses/{response_id}/answers", response_model=list[AnswerResponse])
+@router.get("/responses/{response_id}/form", response_model=FormDetailResponse)
+async def get_response_form(
+    response_id: uuid.UUID,
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    body, immutable = await service.get_response_form(db, response_id)
+    return json_response(request, body, make_etag(body), IMMUTABLE if immutable else REVALIDATE)
+
+
+@router.put("/responses/{response_id}/answers", response_model=list[AnswerUpsertResult])
 async def upsert_answers(
     response_id: uuid.UUID,
     body: list[AnswerUpsert],
     user: Annotated[User, Depends(get_current_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    return await service.upsert_answers(db, response_id, body)
+    return await service.upsert_answers(db, response_id, user.id, body)
 
 
 @router.post("/responses/{response_id}/submit", response_model=ResponseResponse)
@@ -86,3 +111,12 @@ async def get_upload_url(
         content_type=body.content_type,
     )
     return UploadUrlResponse(upload_url=url, file_key=file_key)
+
+
+@router.get("/questions/{question_id}/reevaluation", response_model=ReevaluationResponse)
+async def get_latest_reevaluation(
+    question_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    return await service.get_latest_reevaluation(db, question_id)
@@ -3,7 +3,12 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from src.core.enums import ConformityStatus, ResponseStatus
+from src.core.enums import (
+    AnswerUpsertStatus,
+    ConformityStatus,
+    ReevaluationStatus,
+    ResponseStatus,
+)
 
 
 class ResponseCreate(BaseModel):
@@ -17,9 +22,12 @@ class ResponseCreate(BaseModel):
 
 class AnswerUpsert(BaseModel):
     question_id: uuid.UUID
+    # Omitted fields are left as they are
     value: dict | None = None
     comment: str | None = None
     client_created_at: datetime
+    # Revision of the answer this edit was made from; None for clients that don't track it
+    base_revision: int | None = None
 
 
 class AnswerResponse(BaseModel):
@@ -30,13 +38,24 @@ class AnswerResponse(BaseModel):
     comment: str | None = None
     conformity_status: ConformityStatus | None = None
     answered_at: datetime | None = None
+    revision: int = 1
 
     model_config = {"from_attributes": True}
 
 
+class AnswerUpsertResult(BaseModel):
+    """Outcome of one item in a batch answer upsert (one per distinct question id)."""
+    question_id: uuid.UUID
+    status: AnswerUpsertStatus
+    answer: AnswerResponse | None = None
+    # Per conflicting field: the policy applied, the winning side and the losing edit
+    conflict_details: dict | None = None
+
+
 class ResponseResponse(BaseModel):
     id: uuid.UUID
     form_id: uuid.UUID
+    form_version: int | None = None
     node_id: uuid.UUID
     respondent_id: uuid.UUID
     parent_response_id: uuid.UUID | None = None
@@ -64,3 +83,18 @@ class UploadUrlRequest(BaseModel):
 class UploadUrlResponse(BaseModel):
     upload_url: str
     file_key: str
+
+
+class ReevaluationResponse(BaseModel):
+    id: uuid.UUID
+    question_id: uuid.UUID
+    status: ReevaluationStatus
+    processed_count: int
+    changed_count: int
+    rows_per_second: float | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
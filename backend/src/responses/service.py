@@ -1,17 +1,53 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.core.enums import ResponseStatus
+from src.core.cache import TTLCache
+from src.core.enums import (
+    AnswerUpsertStatus,
+    QuestionType,
+    ResponseStatus,
+    SyncOperation,
+    SyncStatus,
+)
 from src.core.exceptions import BadRequestError, NotFoundError
-from src.forms.models import Form, Question
+from src.core.pagination import (
+    CursorPage,
+    CursorParams,
+    PagedResponse,
+    PaginationParams,
+    apply_keyset,
+    approximate_total,
+    cursor_page,
+    exact_total,
+)
+from src.forms import service as forms_service
+from src.forms.models import Form, Question, Section
 from src.organizations.models import Node, User
-from src.responses.conformity import check_conformity
-from src.responses.models import Answer, Response
-from src.responses.schemas import AnswerUpsert, ResponseCreate, ResponseResponse
+from src.responses import conflicts
+from src.responses.conformity import Rule, compile_rule, rule_for
+from src.responses.models import Answer, ConformityReevaluation, Response
+from src.responses.schemas import (
+    AnswerResponse,
+    AnswerUpsert,
+    AnswerUpsertResult,
+    ResponseCreate,
+    ResponseResponse,
+)
+from src.sync.models import SyncLog
+
+# asyncpg caps a statement at 32767 bind parameters; each answer row uses fifteen
+UPSERT_CHUNK_SIZE = 2000
+
+# sync_log device id for conflicts resolved by the autosave endpoint
+AUTOSAVE_DEVICE_ID = "autosave"
+
+# Compiled rules per (form_id, version). Snapshots never change, so entries never go stale.
+_snapshot_rules: TTLCache[tuple[uuid.UUID, int], dict[uuid.UUID, Rule]] = TTLCache(256)
 
 
 async def create_response(
@@ -27,9 +63,11 @@ async def create_response(
         raise NotFoundError("Form not found")
     if not form.is_published:
         raise BadRequestError("Form is not published")
+    await forms_service.ensure_snapshot(db, form)
 
     response = Response(
         form_id=form_id,
+        form_version=form.version,
         node_id=data.node_id,
         respondent_id=user_id,
         parent_response_id=data.parent_response_id,
@@ -64,7 +102,13 @@ async def list_responses(
     node_id: uuid.UUID | None = None,
     respondent_id: uuid.UUID | None = None,
     status: ResponseStatus | None = None,
-) -> list[ResponseResponse]:
+    page: CursorParams | PaginationParams | None = None,
+) -> CursorPage[ResponseResponse] | PagedResponse[ResponseResponse]:
+    """List responses newest first, keyset-paginated on (created_at, id).
+
+    Passing ``PaginationParams`` switches to offset pagination with an exact total.
+    """
+    page = page or CursorParams()
     query = (
         select(Response, Form.title, Node.name, User.full_name)
         .join(Form, Response.form_id == Form.id)
@@ -80,90 +124,234 @@ async def list_responses(
         query = query.where(Response.respondent_id == respondent_id)
     if status:
         query = query.where(Response.status == status)
-    query = query.order_by(Response.created_at.desc())
-    result = await db.execute(query)
-    rows = result.all()
-    return [
-        ResponseResponse(
-            id=row.Response.id,
-            form_id=row.Response.form_id,
-            node_id=row.Response.node_id,
-            respondent_id=row.Response.respondent_id,
-            parent_response_id=row.Response.parent_response_id,
-            status=row.Response.status,
-            started_at=row.Response.started_at,
-            submitted_at=row.Response.submitted_at,
-            device_id=row.Response.device_id,
-            created_at=row.Response.created_at,
-            form_title=row.title,
-            node_name=row.name,
-            respondent_name=row.full_name,
+
+    if isinstance(page, PaginationParams):
+        total = await exact_total(db, query)
+        paged = (
+            query.order_by(Response.created_at.desc(), Response.id.desc())
+            .offset(page.offset)
+            .limit(page.page_size)
         )
-        for row in rows
-    ]
+        rows = (await db.execute(paged)).all()
+        return PagedResponse.create([_response_row(row) for row in rows], total, page)
+
+    total = await approximate_total(db, query) if page.include_total else None
+    paged = apply_keyset(query, [Response.created_at, Response.id], page, descending=True)
+    rows = (await db.execute(paged)).all()
+    return cursor_page(
+        [_response_row(row) for row in rows],
+        page,
+        key=lambda r: (r.created_at, r.id),
+        total=total,
+    )
+
+
+def _response_row(row) -> ResponseResponse:
+    return ResponseResponse(
+        id=row.Response.id,
+        form_id=row.Response.form_id,
+        form_version=row.Response.form_version,
+        node_id=row.Response.node_id,
+        respondent_id=row.Response.respondent_id,
+        parent_response_id=row.Response.parent_response_id,
+        status=row.Response.status,
+        started_at=row.Response.started_at,
+        submitted_at=row.Response.submitted_at,
+        device_id=row.Response.device_id,
+        created_at=row.Response.created_at,
+        form_title=row.title,
+        node_name=row.name,
+        respondent_name=row.full_name,
+    )
+
+
+def _rule(question: Question) -> Rule:
+    return rule_for(
+        question.id, question.updated_at, question.question_type, question.reference_value
+    )
+
+
+async def form_rules(
+    db: AsyncSession,
+    form_id: uuid.UUID,
+    form_version: int | None,
+    question_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, Rule]:
+    """Rules for those of ``question_ids`` in the definition a response is filled against.
+
+    May return rules for other questions of the form too.
+    """
+    if form_version is None:
+        # Predates snapshots: check against the live definition
+        result = await db.execute(
+            select(Question)
+            .join(Section, Question.section_id == Section.id)
+            .where(Question.id.in_(question_ids), Section.form_id == form_id)
+        )
+        return {q.id: _rule(q) for q in result.scalars().all()}
+
+    key = (form_id, form_version)
+    rules = _snapshot_rules.get(key)
+    if rules is None:
+        snapshot = await forms_service.get_snapshot(db, *key)
+        rules = {
+            uuid.UUID(q["id"]): compile_rule(
+                QuestionType(q["question_type"]), q["reference_value"]
+            )
+            for section in snapshot.definition["sections"]
+            for q in section["questions"]
+        }
+        _snapshot_rules.set(key, rules)
+    return rules
+
+
+async def get_response_form(db: AsyncSession, response_id: uuid.UUID) -> tuple[bytes, bool]:
+    """The definition a response was filled against, as JSON, and whether it is immutable."""
+    result = await db.execute(
+        select(Response.form_id, Response.form_version).where(Response.id == response_id)
+    )
+    row = result.one_or_none()
+    if not row:
+        raise NotFoundError("Response not found")
+    if row.form_version is None:
+        payload = await forms_service.get_form_payload(db, row.form_id)
+        return payload.body, False
+    snapshot = await forms_service.get_snapshot(db, row.form_id, row.form_version)
+    return forms_service.snapshot_json(snapshot), True
 
 
 async def upsert_answers(
     db: AsyncSession,
     response_id: uuid.UUID,
+    user_id: uuid.UUID,
     answers_data: list[AnswerUpsert],
-) -> list[Answer]:
-    response = await get_response(db, response_id)
+) -> list[AnswerUpsertResult]:
+    """Upsert a batch of answers in a single round trip.
+
+    Rules come from the form snapshot the response was started against (one row,
+    compiled once per worker), conformity is evaluated in memory, and every row is
+    written with one INSERT ... ON CONFLICT DO UPDATE. Question ids that aren't in
+    that definition are reported back instead of being written.
+
+    Edits are merged field by field with the stored answers, loaded in one query
+    (see ``conflicts``). The response row is locked first, so concurrent batches
+    for one response merge one after the other instead of overwriting each other.
+    Every edit that conflicted is recorded in ``sync_log`` with its details, as
+    sync pushes are, so the losing side can be recovered.
+    """
+    result = await db.execute(
+        select(Response).where(Response.id == response_id).with_for_update()
+    )
+    response = result.scalar_one_or_none()
+    if not response:
+        raise NotFoundError("Response not found")
     if response.status == ResponseStatus.SUBMITTED:
         raise BadRequestError("Cannot modify a submitted response")
 
-    now = datetime.now(timezone.utc)
-    results = []
+    question_ids = list(dict.fromkeys(answer_data.question_id for answer_data in answers_data))
+    rules: dict[uuid.UUID, Rule] = {}
+    stored: dict[uuid.UUID, Answer] = {}
+    if question_ids:
+        rules = await form_rules(db, response.form_id, response.form_version, question_ids)
+        result = await db.execute(
+            select(Answer).where(
+                Answer.response_id == response_id,
+                Answer.question_id.in_([q for q in question_ids if q in rules]),
+            )
+        )
+        stored = {answer.question_id: answer for answer in result.scalars().all()}
 
+    # Repeated question ids fold into one merge, in order — ON CONFLICT can't touch a row twice
+    policies = conflicts.policies()
+    merges: dict[uuid.UUID, conflicts.Merge] = {}
+    details: dict[uuid.UUID, dict] = {}
+    conflicted: list[tuple[AnswerUpsert, dict]] = []
     for answer_data in answers_data:
-        # Get question for conformity check
-        q_result = await db.execute(
-            select(Question).where(Question.id == answer_data.question_id)
-        )
-        question = q_result.scalar_one_or_none()
-        if not question:
+        question_id = answer_data.question_id
+        if question_id not in rules:
             continue
-
-        # Check conformity
-        conformity = check_conformity(
-            question.question_type, answer_data.value, question.reference_value
+        merge = merges.get(question_id)
+        if merge is None:
+            merge = merges[question_id] = conflicts.Merge.start(stored.get(question_id))
+        edit = conflicts.Edit(
+            fields=answer_data.model_dump(include=set(conflicts.FIELDS), exclude_unset=True),
+            client_at=answer_data.client_created_at,
+            base_revision=answer_data.base_revision,
         )
+        resolved = conflicts.apply(merge, edit, policies)
+        details.setdefault(question_id, {}).update(resolved)
+        if resolved:
+            conflicted.append((answer_data, resolved))
 
-        # Upsert answer
-        existing = await db.execute(
-            select(Answer).where(
-                Answer.response_id == response_id,
-                Answer.question_id == answer_data.question_id,
-            )
-        )
-        answer = existing.scalar_one_or_none()
-
-        if answer:
-            answer.value = answer_data.value
-            answer.comment = answer_data.comment
-            answer.conformity_status = conformity
-            answer.answered_at = now
-            answer.client_created_at = answer_data.client_created_at
-        else:
-            answer = Answer(
-                response_id=response_id,
-                question_id=answer_data.question_id,
-                value=answer_data.value,
-                comment=answer_data.comment,
-                conformity_status=conformity,
-                answered_at=now,
-                client_created_at=answer_data.client_created_at,
-            )
-            db.add(answer)
-            await db.flush()
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            **merge.row,
+            "response_id": response_id,
+            "question_id": question_id,
+            "conformity_status": rules[question_id](merge.row["value"]),
+            "answered_at": now,
+        }
+        for question_id, merge in merges.items()
+        if merge.changed
+    ]
 
-        results.append(answer)
+    written: dict[uuid.UUID, Answer] = dict(stored)
+    for start in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        stmt = pg_insert(Answer).values(rows[start:start + UPSERT_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Answer.response_id, Answer.question_id],
+            set_={
+                **{column: stmt.excluded[column] for column in conflicts.COLUMNS},
+                "conformity_status": stmt.excluded.conformity_status,
+                "answered_at": stmt.excluded.answered_at,
+                "updated_at": now,
+            },
+        ).returning(Answer)
+        upserted = await db.scalars(stmt, execution_options={"populate_existing": True})
+        written.update((answer.question_id, answer) for answer in upserted.all())
+
+    if conflicted:
+        await db.execute(insert(SyncLog), [
+            {
+                "user_id": user_id,
+                "device_id": AUTOSAVE_DEVICE_ID,
+                "entity_type": "answer",
+                "entity_id": written[answer_data.question_id].id,
+                "operation": SyncOperation.UPDATE,
+                # As in sync pushes: CONFLICT if some of the edit lost
+                "sync_status": SyncStatus.CONFLICT
+                if any(field["winner"] == "server" for field in resolved.values())
+                else SyncStatus.SYNCED,
+                "client_timestamp": answer_data.client_created_at,
+                "server_timestamp": now,
+                "payload": answer_data.model_dump(mode="json", exclude_unset=True),
+                "conflict_details": resolved,
+                "created_at": now,
+            }
+            for answer_data, resolved in conflicted
+        ])
 
     # Update response status
-    if response.status == ResponseStatus.DRAFT:
+    if rows and response.status == ResponseStatus.DRAFT:
         response.status = ResponseStatus.IN_PROGRESS
 
     await db.flush()
+    results = []
+    for question_id in question_ids:
+        if question_id not in rules:
+            results.append(AnswerUpsertResult(
+                question_id=question_id, status=AnswerUpsertStatus.UNKNOWN_QUESTION
+            ))
+            continue
+        answer = written.get(question_id)
+        resolved = details[question_id]
+        results.append(AnswerUpsertResult(
+            question_id=question_id,
+            status=AnswerUpsertStatus.RESOLVED if resolved else AnswerUpsertStatus.UPSERTED,
+            answer=AnswerResponse.model_validate(answer) if answer else None,
+            conflict_details=resolved or None,
+        ))
     return results
 
 
@@ -175,3 +363,18 @@ async def submit_response(db: AsyncSession, response_id: uuid.UUID) -> Response:
     response.status = ResponseStatus.SUBMITTED
     response.submitted_at = datetime.now(timezone.utc)
     return response
+
+
+async def get_latest_reevaluation(
+    db: AsyncSession, question_id: uuid.UUID
+) -> ConformityReevaluation:
+    result = await db.execute(
+        select(ConformityReevaluation)
+        .where(ConformityReevaluation.question_id == question_id)
+        .order_by(ConformityReevaluation.created_at.desc())
+        .limit(1)
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise NotFoundError("No re-evaluation found for this question")
+    return job
@@ -0,0 +1,258 @@
+"""``GET /organizations/{org_id}/offline-bundle``: everything a filler needs for a shift.
+
+The bundle is one gzip-compressed JSON object::
+
+    {"organization_id", "forms_version",
+     "nodes": [NodeResponse, ...],           # the user's accessible nodes
+     "forms": [FormDetailResponse, ...],     # published forms assigned at or above them
+     "user": UserProfile, "role",
+     "drafts": [ResponseDetailResponse, ...],  # the user's open responses, with answers
+     "draft_forms": [FormDetailResponse, ...]}  # definitions of drafts not in "forms"
+
+Everything up to ``forms`` depends only on the user's scope, not on who the user
+is. It is cached per worker as compressed bytes, keyed on (org, accessible-node
+set, hierarchy version, forms version). Users with the same scope share it.
+The per-user tail is built and compressed on every request; it is small.
+
+Forms are sent as their published snapshots, the definitions that drafts are
+bound to and that answers are checked against, never as the live definition
+with unpublished edits. A draft started on an older version, or before
+snapshots existed, gets its own definition in ``draft_forms``.
+
+The pieces are compressed separately (see ``core.deflate``). Snapshots never
+change, so each one's piece is cached by (form, version), and when one form is
+republished only that form is serialized and compressed again.
+"""
+
+import dataclasses
+import uuid
+
+from pydantic import TypeAdapter
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.auth.schemas import UserProfile
+from src.auth.service import get_user_with_orgs
+from src.config import settings
+from src.core.auth_cache import NodeSet
+from src.core.cache import TTLCache
+from src.core.deflate import Deflated, GzipWriter, deflate
+from src.core.enums import ResponseStatus, UserRole
+from src.core.etag import make_etag
+from src.core.exceptions import NotFoundError
+from src.core.permissions import node_filter, scope_key
+from src.forms import service as forms_service
+from src.forms.models import Form, FormNodeAssignment, FormSnapshot
+from src.organizations import hierarchy
+from src.organizations.models import Node, Organization, User
+from src.organizations.schemas import NodeResponse
+from src.responses.models import Response
+from src.responses.schemas import ResponseDetailResponse
+
+_node_list = TypeAdapter(list[NodeResponse])
+_draft_list = TypeAdapter(list[ResponseDetailResponse])
+
+OPEN_STATUSES = (ResponseStatus.DRAFT, ResponseStatus.IN_PROGRESS)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Nodes:
+    body: bytes
+    deflated: bytes
+    # Accessible nodes and their ancestors: forms assigned to any of them apply
+    reach: NodeSet
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Form:
+    body: bytes
+    deflated: bytes
+    etag: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Shared:
+    prefix: Deflated
+    etag: str
+    # The (form, version) definitions in "forms"
+    forms: frozenset[tuple[uuid.UUID, int]]
+
+
+type _Scope = tuple[uuid.UUID, str, int]
+
+_nodes: TTLCache[_Scope, _Nodes] = TTLCache(settings.access_cache_max_entries)
+_shared: TTLCache[tuple[_Scope, int], _Shared] = TTLCache(settings.access_cache_max_entries)
+# Serialized snapshots by (form, version)
+_forms: TTLCache[tuple[uuid.UUID, int], _Form] = TTLCache(settings.form_cache_max_entries)
+
+
+def stats() -> dict:
+    return {
+        "bundle_nodes": _nodes.stats(),
+        "bundle_shared": _shared.stats(),
+        "bundle_forms": _forms.stats(),
+    }
+
+
+async def _build_nodes(
+    db: AsyncSession, org_id: uuid.UUID, accessible: NodeSet | None
+) -> _Nodes:
+    result = await db.execute(
+        select(Node)
+        .where(
+            Node.organization_id == org_id,
+            Node.is_active == True,  # noqa: E712
+            node_filter(Node.id, accessible),
+        )
+        .order_by(Node.depth, Node.sort_order, Node.name)
+    )
+    nodes = result.scalars().all()
+    reach = {n for node in nodes for n in hierarchy.path_ids(node.materialized_path)}
+    body = _node_list.dump_json([NodeResponse.model_validate(n) for n in nodes])
+    return _Nodes(body, deflate(body), NodeSet.from_ids(reach))
+
+
+def _form_piece(body: bytes) -> _Form:
+    return _Form(body, deflate(body), make_etag(body))
+
+
+async def _snapshots(
+    db: AsyncSession, keys: list[tuple[uuid.UUID, int]]
+) -> list[_Form]:
+    """The snapshots of ``keys``, in order; the ones not cached are loaded in one query."""
+    missing = [key for key in keys if _forms.get(key) is None]
+    if missing:
+        result = await db.execute(
+            select(FormSnapshot).where(
+                tuple_(FormSnapshot.form_id, FormSnapshot.version).in_(missing)
+            )
+        )
+        for snapshot in result.scalars().all():
+            piece = _form_piece(forms_service.snapshot_json(snapshot))
+            _forms.set((snapshot.form_id, snapshot.version), piece)
+    pieces = []
+    for key in keys:
+        piece = _forms.get(key)
+        if piece is None:
+            # Published before snapshots existed
+            form = await db.get(Form, key[0])
+            await forms_service.ensure_snapshot(db, form)
+            snapshot = await forms_service.get_snapshot(db, *key)
+            piece = _form_piece(forms_service.snapshot_json(snapshot))
+            _forms.set(key, piece)
+        pieces.append(piece)
+    return pieces
+
+
+_PUNCTUATION = {c: deflate(c) for c in (b"[", b",", b"]")}
+
+
+def _write_list(writer: GzipWriter, pieces: list[_Form]) -> None:
+    writer.write(b"[", _PUNCTUATION[b"["])
+    for i, piece in enumerate(pieces):
+        if i:
+            writer.write(b",", _PUNCTUATION[b","])
+        writer.write(piece.body, piece.deflated)
+    writer.write(b"]", _PUNCTUATION[b"]"])
+
+
+async def _build_shared(
+    db: AsyncSession, org_id: uuid.UUID, forms_version: int, nodes: _Nodes
+) -> _Shared:
+    result = await db.execute(
+        select(Form.id, Form.version)
+        .where(
+            Form.organization_id == org_id,
+            Form.is_active == True,  # noqa: E712
+            Form.is_published == True,  # noqa: E712
+            Form.id.in_(
+                select(FormNodeAssignment.form_id).where(
+                    node_filter(FormNodeAssignment.node_id, nodes.reach),
+                    FormNodeAssignment.is_active == True,  # noqa: E712
+                )
+            ),
+        )
+        .order_by(Form.title, Form.id)
+    )
+    keys = [tuple(row) for row in result]
+    pieces = await _snapshots(db, keys)
+
+    head = (
+        f'{{"organization_id":"{org_id}","forms_version":{forms_version},"nodes":'
+    ).encode()
+    writer = GzipWriter()
+    writer.write(head)
+    writer.write(nodes.body, nodes.deflated)
+    writer.write(b',"forms":')
+    _write_list(writer, pieces)
+    etags = [make_etag(head), make_etag(nodes.body), *(piece.etag for piece in pieces)]
+    return _Shared(writer.deflated(), make_etag(",".join(etags).encode()), frozenset(keys))
+
+
+async def get_bundle(
+    db: AsyncSession,
+    user: User,
+    org_id: uuid.UUID,
+    role: UserRole,
+    accessible: NodeSet | None,
+) -> tuple[bytes, str]:
+    """The user's offline bundle as (gzip body, ETag of the uncompressed JSON)."""
+    result = await db.execute(
+        select(Organization.hierarchy_version, Organization.forms_version).where(
+            Organization.id == org_id
+        )
+    )
+    stamp = result.one_or_none()
+    if not stamp:
+        raise NotFoundError("Organization not found")
+    hierarchy_version, forms_version = stamp
+
+    scope: _Scope = (org_id, scope_key(accessible), hierarchy_version)
+    shared = _shared.get((scope, forms_version))
+    if shared is None:
+        nodes = _nodes.get(scope)
+        if nodes is None:
+            nodes = await _build_nodes(db, org_id, accessible)
+            _nodes.set(scope, nodes)
+        shared = await _build_shared(db, org_id, forms_version, nodes)
+        _shared.set((scope, forms_version), shared)
+
+    result = await db.execute(
+        select(Response)
+        .join(Form, Form.id == Response.form_id)
+        .where(
+            Response.respondent_id == user.id,
+            Form.organization_id == org_id,
+            Response.status.in_(OPEN_STATUSES),
+        )
+        .options(selectinload(Response.answers))
+        .order_by(Response.created_at, Response.id)
+    )
+    responses = result.scalars().all()
+    drafts = [ResponseDetailResponse.model_validate(r) for r in responses]
+    bound = {(r.form_id, r.form_version) for r in responses if r.form_version is not None}
+    draft_forms = await _snapshots(db, sorted(bound - shared.forms))
+    # Drafts from before snapshots follow the live definition
+    for form_id in sorted({r.form_id for r in responses if r.form_version is None}):
+        try:
+            payload = await forms_service.get_form_payload(db, form_id)
+        except NotFoundError:
+            continue
+        draft_forms.append(_form_piece(payload.body))
+
+    profile = UserProfile.model_validate(await get_user_with_orgs(db, user))
+    tail = b"".join((
+        b',"user":',
+        profile.model_dump_json().encode(),
+        f',"role":"{role.value}","drafts":'.encode(),
+        _draft_list.dump_json(drafts),
+        b',"draft_forms":',
+    ))
+
+    writer = GzipWriter(shared.prefix)
+    writer.write(tail)
+    _write_list(writer, draft_forms)
+    writer.write(b"}")
+    etags = [shared.etag, make_etag(tail), *(piece.etag for piece in draft_forms)]
+    return writer.gzip(), make_etag(",".join(etags).encode())
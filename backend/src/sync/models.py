@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,11 +11,19 @@ from src.core.enums import SyncOperation, SyncStatus
 
 class SyncLog(UUIDMixin, Base):
     __tablename__ = "sync_log"
+    __table_args__ = (
+        # A user's op ids are unique per device (devices may be shared); replays of a
+        # logged op are answered from the log
+        Index(
+            "ix_sync_log_user_device_op", "user_id", "device_id", "client_op_id", unique=True
+        ),
+    )
 
     user_id: Mapped[uuid.UUID | None] = mapped_column(
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL")
     )
     device_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    client_op_id: Mapped[str | None] = mapped_column(String(100))
     entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     operation: Mapped[SyncOperation] = mapped_column(nullable=False)
@@ -25,3 +33,27 @@ class SyncLog(UUIDMixin, Base):
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
     conflict_details: Mapped[dict | None] = mapped_column(JSONB)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class SyncTombstone(UUIDMixin, Base):
+    """A hard-deleted row, for delta pulls. Written by ``AFTER DELETE`` triggers.
+
+    Soft-deleted rows need none: they are pulled as changed rows with ``is_active`` false.
+    """
+
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        Index("ix_sync_tombstones_org_change", "organization_id", "change_xid", "id"),
+    )
+
+    entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+    # Set for rows only their respondent pulls (responses, answers)
+    user_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE")
+    )
+    change_xid: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
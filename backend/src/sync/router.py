@@ -0,0 +1,64 @@
+import gzip
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.dependencies import get_current_org_member, get_current_user
+from src.core.etag import REVALIDATE, is_not_modified
+from src.core.permissions import get_accessible_node_ids
+from src.organizations.models import User, UserOrganizationRole
+from src.sync import bundle, service
+from src.sync.schemas import SyncPullResult, SyncPush, SyncPushResult
+
+router = APIRouter(tags=["sync"])
+
+
+@router.post("/organizations/{org_id}/sync/push", response_model=SyncPushResult)
+async def push(
+    org_id: uuid.UUID,
+    data: SyncPush,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    return await service.push(db, user.id, org_id, membership.role, data)
+
+
+@router.get("/organizations/{org_id}/sync/pull", response_model=SyncPullResult)
+async def pull(
+    org_id: uuid.UUID,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=500, ge=1, le=2000),
+    cursor: str | None = None,
+    scope: str | None = Query(default=None, max_length=64),
+):
+    nodes = await get_accessible_node_ids(db, user.id, org_id, membership.role)
+    return await service.pull(db, user.id, org_id, nodes, since, limit, cursor, scope)
+
+
+@router.get("/organizations/{org_id}/offline-bundle")
+async def get_offline_bundle(
+    org_id: uuid.UUID,
+    request: Request,
+    user: Annotated[User, Depends(get_current_user)],
+    membership: Annotated[UserOrganizationRole, Depends(get_current_org_member)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    nodes = await get_accessible_node_ids(db, user.id, org_id, membership.role)
+    body, etag = await bundle.get_bundle(db, user, org_id, membership.role, nodes)
+    headers = {"Cache-Control": REVALIDATE, "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        # A strong ETag names one representation; the gzip one gets its own
+        headers.update({"ETag": etag[:-1] + '-gzip"', "Content-Encoding": "gzip"})
+    else:
+        headers["ETag"] = etag
+        body = gzip.decompress(body)
+    if is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
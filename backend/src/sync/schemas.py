@@ -0,0 +1,119 @@
+import uuid
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from src.core.enums import SyncOperation, SyncStatus
+from src.forms.schemas import FormResponse, QuestionResponse
+from src.organizations.schemas import NodeResponse
+from src.responses.schemas import AnswerResponse, ResponseResponse
+
+# ─── Push ─────────────────────────────────────────────────────────
+
+class ResponseOpData(BaseModel):
+    # create only
+    form_id: uuid.UUID | None = None
+    node_id: uuid.UUID | None = None
+    parent_response_id: uuid.UUID | None = None
+    # create / update
+    latitude: float | None = None
+    longitude: float | None = None
+    # update: submit the response
+    submit: bool = False
+
+
+class AnswerOpData(BaseModel):
+    response_id: uuid.UUID
+    question_id: uuid.UUID
+    # Omitted fields are left as they are
+    value: dict | None = None
+    comment: str | None = None
+    # Revision of the answer the edit was made from (see responses.conflicts)
+    base_revision: int | None = None
+
+
+class _SyncOpBase(BaseModel):
+    # Unique per device; a replayed op id is answered from sync_log instead of re-applied
+    op_id: str = Field(min_length=1, max_length=100)
+    operation: SyncOperation
+    client_timestamp: datetime
+
+
+class ResponseSyncOp(_SyncOpBase):
+    entity_type: Literal["response"]
+    # Generated on the device, so later ops in the batch can refer to a new response
+    entity_id: uuid.UUID
+    data: ResponseOpData = ResponseOpData()
+
+
+class AnswerSyncOp(_SyncOpBase):
+    entity_type: Literal["answer"]
+    # Used as the answer's id if the server has none for (response_id, question_id) yet
+    entity_id: uuid.UUID
+    data: AnswerOpData
+
+
+SyncOp = Annotated[ResponseSyncOp | AnswerSyncOp, Field(discriminator="entity_type")]
+
+
+class SyncPush(BaseModel):
+    device_id: str = Field(min_length=1, max_length=255)
+    operations: list[SyncOp] = Field(max_length=5000)
+
+
+class SyncOpResult(BaseModel):
+    op_id: str
+    status: SyncStatus
+    entity_id: uuid.UUID
+    # The op was already applied by an earlier push; status is the recorded one
+    duplicate: bool = False
+    conflict_details: dict | None = None
+
+
+class SyncPushResult(BaseModel):
+    results: list[SyncOpResult]
+    server_timestamp: datetime
+
+
+# ─── Pull ─────────────────────────────────────────────────────────
+
+class SectionChange(BaseModel):
+    id: uuid.UUID
+    form_id: uuid.UUID
+    title: str
+    description: str | None = None
+    sort_order: int
+
+    model_config = {"from_attributes": True}
+
+
+class AssignmentChange(BaseModel):
+    id: uuid.UUID
+    form_id: uuid.UUID
+    node_id: uuid.UUID
+
+    model_config = {"from_attributes": True}
+
+
+class Tombstone(BaseModel):
+    entity_type: str
+    entity_id: uuid.UUID
+
+
+class SyncPullResult(BaseModel):
+    # Pass as ``since`` and ``scope`` on the next pull, once there is no next_cursor
+    watermark: int
+    scope: str
+    # Set on the first page of a pull that starts over; drop local data before applying
+    reset: bool = False
+    next_cursor: str | None = None
+    nodes: list[NodeResponse] = []
+    forms: list[FormResponse] = []
+    sections: list[SectionChange] = []
+    questions: list[QuestionResponse] = []
+    assignments: list[AssignmentChange] = []
+    responses: list[ResponseResponse] = []
+    answers: list[AnswerResponse] = []
+    # Deleted and deactivated rows the device should drop
+    deleted: list[Tombstone] = []
@@ -0,0 +1,687 @@
+import dataclasses
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from pydantic import BaseModel
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Select,
+    Text,
+    cast,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.auth_cache import NodeSet
+from src.core.enums import ConflictPolicy, ResponseStatus, SyncOperation, SyncStatus, UserRole
+from src.core.exceptions import BadRequestError
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.permissions import node_filter, scope_key, user_can_access_nodes
+from src.forms import service as forms_service
+from src.forms.models import Form, FormNodeAssignment, Question, Section
+from src.forms.schemas import FormResponse, QuestionResponse
+from src.organizations.models import Node
+from src.organizations.schemas import NodeResponse
+from src.responses import conflicts
+from src.responses.conformity import Rule
+from src.responses.models import Answer, Response
+from src.responses.schemas import AnswerResponse, ResponseResponse
+from src.responses.service import form_rules
+from src.sync.models import SyncLog, SyncTombstone
+from src.sync.schemas import (
+    AnswerSyncOp,
+    AssignmentChange,
+    ResponseSyncOp,
+    SectionChange,
+    SyncOp,
+    SyncOpResult,
+    SyncPullResult,
+    SyncPush,
+    SyncPushResult,
+    Tombstone,
+)
+
+# asyncpg caps a statement at 32767 bind parameters; each answer row uses fifteen
+ANSWER_CHUNK_SIZE = 2000
+
+
+# ─── Push ─────────────────────────────────────────────────────────
+
+@dataclasses.dataclass
+class _ResponseState:
+    id: uuid.UUID
+    form_id: uuid.UUID
+    form_version: int | None
+    respondent_id: uuid.UUID
+    status: ResponseStatus
+
+
+@dataclasses.dataclass
+class _Push:
+    """Net effect of a device's ops, folded in order before anything is written.
+
+    Every op is checked against the state left by the ops before it, so a batch
+    can create a response, answer it and submit it, and each op gets its own status.
+    """
+
+    user_id: uuid.UUID
+    device_id: str
+    now: datetime
+    forms: dict[uuid.UUID, Form]
+    nodes: set[uuid.UUID]
+    rules: dict[tuple[uuid.UUID, int | None], dict[uuid.UUID, Rule]]
+    responses: dict[uuid.UUID, _ResponseState]
+    # Stored answers by (response_id, question_id), as loaded; edits are judged against these
+    answers: dict[tuple[uuid.UUID, uuid.UUID], Answer]
+    policies: dict[str, ConflictPolicy]
+    # Ids of responses in other organizations: creates can't reuse them
+    taken: set[uuid.UUID]
+    # (response_id, question_id) owning each answer id the ops name, stored or created here
+    answer_ids: dict[uuid.UUID, tuple[uuid.UUID, uuid.UUID]]
+    new_responses: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    response_changes: dict[uuid.UUID, dict] = dataclasses.field(default_factory=dict)
+    deleted_responses: set[uuid.UUID] = dataclasses.field(default_factory=set)
+    answer_merges: dict[tuple, conflicts.Merge] = dataclasses.field(default_factory=dict)
+    answer_deletes: set[tuple] = dataclasses.field(default_factory=set)
+
+    def change_response(self, response_id: uuid.UUID, values: dict) -> None:
+        target = self.new_responses.get(response_id)
+        if target is None:
+            target = self.response_changes.setdefault(response_id, {"updated_at": self.now})
+        target.update(values)
+
+    def _editable(self, response_id: uuid.UUID) -> tuple[_ResponseState | None, SyncStatus, dict]:
+        """The response if this user may still change it, else the op's status and details."""
+        state = self.responses.get(response_id)
+        if state is None or response_id in self.deleted_responses:
+            return None, SyncStatus.FAILED, {"reason": "response_not_found"}
+        if state.respondent_id != self.user_id:
+            return None, SyncStatus.FAILED, {"reason": "not_respondent"}
+        if state.status not in (ResponseStatus.DRAFT, ResponseStatus.IN_PROGRESS):
+            return None, SyncStatus.CONFLICT, {"reason": "response_submitted"}
+        return state, SyncStatus.SYNCED, {}
+
+    def apply(self, op: SyncOp) -> tuple[SyncStatus, uuid.UUID, dict | None]:
+        match op:
+            case ResponseSyncOp(operation=SyncOperation.CREATE):
+                return self._create_response(op)
+            case ResponseSyncOp(operation=SyncOperation.UPDATE):
+                state, status, details = self._editable(op.entity_id)
+                if state is None:
+                    return status, op.entity_id, details
+                values = op.data.model_dump(include={"latitude", "longitude"}, exclude_unset=True)
+                if op.data.submit:
+                    state.status = ResponseStatus.SUBMITTED
+                    values.update(status=ResponseStatus.SUBMITTED, submitted_at=self.now)
+                if values:
+                    self.change_response(op.entity_id, values)
+                return SyncStatus.SYNCED, op.entity_id, None
+            case ResponseSyncOp(operation=SyncOperation.DELETE):
+                if op.entity_id not in self.responses or op.entity_id in self.deleted_responses:
+                    return SyncStatus.SYNCED, op.entity_id, None  # already gone
+                state, status, details = self._editable(op.entity_id)
+                if state is None:
+                    return status, op.entity_id, details
+                self.deleted_responses.add(op.entity_id)
+                self.new_responses.pop(op.entity_id, None)
+                self.response_changes.pop(op.entity_id, None)
+                # Its answers go with it (ON DELETE CASCADE)
+                for key in [k for k in self.answer_merges if k[0] == op.entity_id]:
+                    del self.answer_merges[key]
+                self.answer_deletes = {k for k in self.answer_deletes if k[0] != op.entity_id}
+                return SyncStatus.SYNCED, op.entity_id, None
+            case AnswerSyncOp():
+                return self._write_answer(op)
+
+    def _create_response(self, op: ResponseSyncOp) -> tuple[SyncStatus, uuid.UUID, dict | None]:
+        data = op.data
+        existing = self.responses.get(op.entity_id)
+        if op.entity_id in self.deleted_responses:
+            return SyncStatus.CONFLICT, op.entity_id, {"reason": "response_deleted"}
+        if op.entity_id in self.taken:
+            return SyncStatus.CONFLICT, op.entity_id, {"reason": "response_id_taken"}
+        if existing is not None:
+            if existing.respondent_id == self.user_id and existing.form_id == data.form_id:
+                return SyncStatus.SYNCED, op.entity_id, None  # the same create, re-sent
+            return SyncStatus.CONFLICT, op.entity_id, {"reason": "response_id_taken"}
+        form = self.forms.get(data.form_id)
+        if form is None:
+            return SyncStatus.FAILED, op.entity_id, {"reason": "form_not_found"}
+        if not form.is_published:
+            return SyncStatus.FAILED, op.entity_id, {"reason": "form_not_published"}
+        if data.node_id not in self.nodes:
+            return SyncStatus.FAILED, op.entity_id, {"reason": "node_not_accessible"}
+
+        self.responses[op.entity_id] = _ResponseState(
+            op.entity_id, form.id, form.version, self.user_id, ResponseStatus.DRAFT
+        )
+        self.new_responses[op.entity_id] = {
+            "id": op.entity_id,
+            "form_id": form.id,
+            "form_version": form.version,
+            "node_id": data.node_id,
+            "respondent_id": self.user_id,
+            "device_id": self.device_id,
+            "parent_response_id": data.parent_response_id,
+            "status": ResponseStatus.DRAFT,
+            "started_at": self.now,
+            "latitude": data.latitude,
+            "longitude": data.longitude,
+            "client_created_at": op.client_timestamp,
+        }
+        return SyncStatus.SYNCED, op.entity_id, None
+
+    def _write_answer(self, op: AnswerSyncOp) -> tuple[SyncStatus, uuid.UUID, dict | None]:
+        data = op.data
+        key = (data.response_id, data.question_id)
+        state, status, details = self._editable(data.response_id)
+        if state is None:
+            return status, op.entity_id, details
+        rules = self.rules.get((state.form_id, state.form_version), {})
+        if data.question_id not in rules:
+            return SyncStatus.FAILED, op.entity_id, {"reason": "unknown_question"}
+
+        edit = conflicts.Edit(
+            fields=data.model_dump(include=set(conflicts.FIELDS), exclude_unset=True),
+            client_at=op.client_timestamp,
+            base_revision=data.base_revision,
+        )
+        stored = None if key in self.answer_deletes else self.answers.get(key)
+        if op.operation == SyncOperation.DELETE:
+            pending = self.answer_merges.get(key)
+            if stored is None and pending is None:
+                return SyncStatus.SYNCED, op.entity_id, None  # already gone
+            if stored is not None:
+                details = conflicts.delete_conflict(stored, edit, self.policies)
+                if details:
+                    return SyncStatus.CONFLICT, stored.id, details
+                self.answer_deletes.add(key)
+            self.answer_merges.pop(key, None)
+            return SyncStatus.SYNCED, stored.id if stored else pending.row["id"], None
+
+        merge = self.answer_merges.get(key)
+        if merge is None:
+            if stored is None:
+                owner = self.answer_ids.setdefault(op.entity_id, key)
+                if owner != key:
+                    return SyncStatus.CONFLICT, op.entity_id, {"reason": "answer_id_taken"}
+            merge = self.answer_merges[key] = conflicts.Merge.start(stored)
+            merge.row.update(
+                id=stored.id if stored else op.entity_id,
+                response_id=data.response_id,
+                question_id=data.question_id,
+            )
+        details = conflicts.apply(merge, edit, self.policies)
+        merge.row["conformity_status"] = rules[data.question_id](merge.row["value"])
+        if merge.changed and state.status == ResponseStatus.DRAFT:
+            state.status = ResponseStatus.IN_PROGRESS
+            self.change_response(state.id, {"status": ResponseStatus.IN_PROGRESS})
+        # Applied either way; CONFLICT tells the device some of its edit lost
+        lost = any(field["winner"] == "server" for field in details.values())
+        return SyncStatus.CONFLICT if lost else SyncStatus.SYNCED, merge.row["id"], details or None
+
+
+async def _lock_device(db: AsyncSession, user_id: uuid.UUID, device_id: str) -> None:
+    """Serialize pushes from one device so a retried batch can't race its first attempt."""
+    key = func.hashtextextended(f"sync:{user_id}:{device_id}", 0)
+    await db.execute(select(func.pg_advisory_xact_lock(key)))
+
+
+async def _load_push(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    device_id: str,
+    org_id: uuid.UUID,
+    role: UserRole,
+    ops: list[SyncOp],
+    now: datetime,
+) -> _Push:
+    """Everything the ops refer to, in one query per table."""
+    response_ids = {op.entity_id for op in ops if isinstance(op, ResponseSyncOp)}
+    response_ids |= {op.data.response_id for op in ops if isinstance(op, AnswerSyncOp)}
+    creates = [
+        op for op in ops
+        if isinstance(op, ResponseSyncOp)
+        and op.operation == SyncOperation.CREATE
+        and op.data.form_id
+    ]
+
+    responses: dict[uuid.UUID, _ResponseState] = {}
+    if response_ids:
+        result = await db.execute(
+            select(
+                Response.id, Response.form_id, Response.form_version,
+                Response.respondent_id, Response.status,
+            )
+            .join(Form, Form.id == Response.form_id)
+            .where(Response.id.in_(response_ids), Form.organization_id == org_id)
+            # Answer merges for a response run one at a time, as in responses.service
+            .with_for_update(of=Response)
+        )
+        responses = {row.id: _ResponseState(*row) for row in result}
+
+    taken: set[uuid.UUID] = set()
+    if creates:
+        result = await db.execute(
+            select(Response.id).where(
+                Response.id.in_({op.entity_id for op in creates}),
+                Response.id.not_in(responses),
+            )
+        )
+        taken = set(result.scalars().all())
+
+    forms: dict[uuid.UUID, Form] = {}
+    nodes: set[uuid.UUID] = set()
+    if creates:
+        result = await db.execute(
+            select(Form).where(
+                Form.id.in_({op.data.form_id for op in creates}),
+                Form.organization_id == org_id,
+                Form.is_active == True,  # noqa: E712
+            )
+        )
+        forms = {form.id: form for form in result.scalars().all()}
+        for form in forms.values():
+            if form.is_published:
+                await forms_service.ensure_snapshot(db, form)
+        result = await db.execute(
+            select(Node.id).where(
+                Node.id.in_({op.data.node_id for op in creates if op.data.node_id}),
+                Node.organization_id == org_id,
+                Node.is_active == True,  # noqa: E712
+            )
+        )
+        found = result.scalars().all()
+        allowed = await user_can_access_nodes(db, user_id, found, org_id, role)
+        nodes = {n for n in found if allowed[n]}
+
+    answered = [op for op in ops if isinstance(op, AnswerSyncOp)]
+    answers = {}
+    if answered:
+        result = await db.execute(
+            select(Answer).where(
+                tuple_(Answer.response_id, Answer.question_id).in_(
+                    {(op.data.response_id, op.data.question_id) for op in answered}
+                )
+            )
+        )
+        answers = {(a.response_id, a.question_id): a for a in result.scalars().all()}
+
+    answer_ids = {}
+    if answered:
+        result = await db.execute(
+            select(Answer.id, Answer.response_id, Answer.question_id).where(
+                Answer.id.in_({op.entity_id for op in answered})
+            )
+        )
+        answer_ids = {row.id: (row.response_id, row.question_id) for row in result}
+
+    # Rules per definition; snapshot rules are cached per worker, so usually no query
+    definitions = {(s.form_id, s.form_version) for s in responses.values()}
+    definitions |= {(form.id, form.version) for form in forms.values()}
+    question_ids = list({op.data.question_id for op in answered})
+    rules = {}
+    if question_ids:
+        for form_id, version in definitions:
+            rules[(form_id, version)] = await form_rules(db, form_id, version, question_ids)
+
+    return _Push(
+        user_id, device_id, now, forms, nodes, rules, responses, answers,
+        conflicts.policies(), taken, answer_ids,
+    )
+
+
+async def _write_push(db: AsyncSession, push: _Push) -> set[uuid.UUID]:
+    """Write the folded changes. Returns the ids of new responses that weren't inserted.
+
+    A create can lose a race for its id to a concurrent push; nothing is written
+    for that response then, and the caller reports its ops as conflicts.
+    """
+    skipped: set[uuid.UUID] = set()
+    if push.new_responses:
+        result = await db.execute(
+            pg_insert(Response)
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(Response.id),
+            list(push.new_responses.values()),
+        )
+        skipped = set(push.new_responses) - set(result.scalars().all())
+        for response_id in skipped:
+            push.response_changes.pop(response_id, None)
+        push.answer_merges = {
+            k: v for k, v in push.answer_merges.items() if k[0] not in skipped
+        }
+        push.answer_deletes = {k for k in push.answer_deletes if k[0] not in skipped}
+    if push.response_changes:
+        await db.execute(
+            update(Response),
+            [{"id": key, **values} for key, values in push.response_changes.items()],
+        )
+    if push.answer_deletes:
+        await db.execute(
+            delete(Answer).where(
+                tuple_(Answer.response_id, Answer.question_id).in_(push.answer_deletes)
+            )
+        )
+    rows = [
+        {**merge.row, "answered_at": push.now}
+        for merge in push.answer_merges.values()
+        if merge.changed
+    ]
+    for start in range(0, len(rows), ANSWER_CHUNK_SIZE):
+        stmt = pg_insert(Answer).values(rows[start:start + ANSWER_CHUNK_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Answer.response_id, Answer.question_id],
+            set_={
+                **{column: stmt.excluded[column] for column in conflicts.COLUMNS},
+                "conformity_status": stmt.excluded.conformity_status,
+                "answered_at": stmt.excluded.answered_at,
+                "updated_at": push.now,
+            },
+        )
+        await db.execute(stmt)
+    if push.deleted_responses:
+        await db.execute(delete(Response).where(Response.id.in_(push.deleted_responses)))
+    return skipped
+
+
+def _response_of(op: SyncOp) -> uuid.UUID:
+    return op.data.response_id if isinstance(op, AnswerSyncOp) else op.entity_id
+
+
+async def push(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    org_id: uuid.UUID,
+    role: UserRole,
+    data: SyncPush,
+) -> SyncPushResult:
+    """Apply a device's ordered batch of response/answer ops idempotently.
+
+    Ops already in ``sync_log`` for this user and device are answered from the log. The
+    rest are folded in order in memory, written with one bulk statement per
+    table and kind of change, and logged with a single multi-row INSERT. An op
+    that can't apply gets its own FAILED or CONFLICT status without failing
+    the batch.
+    """
+    now = datetime.now(UTC)
+    await _lock_device(db, user_id, data.device_id)
+
+    op_ids = list({op.op_id for op in data.operations})
+    logged: dict[str, SyncOpResult] = {}
+    if op_ids:
+        result = await db.execute(
+            select(
+                SyncLog.client_op_id, SyncLog.sync_status, SyncLog.entity_id,
+                SyncLog.conflict_details,
+            ).where(
+                SyncLog.user_id == user_id,
+                SyncLog.device_id == data.device_id,
+                SyncLog.client_op_id.in_(op_ids),
+            )
+        )
+        logged = {
+            row.client_op_id: SyncOpResult(
+                op_id=row.client_op_id,
+                status=row.sync_status,
+                entity_id=row.entity_id,
+                duplicate=True,
+                conflict_details=row.conflict_details,
+            )
+            for row in result
+        }
+
+    pending = []
+    seen = set(logged)
+    for op in data.operations:
+        if op.op_id not in seen:
+            seen.add(op.op_id)
+            pending.append(op)
+
+    state = await _load_push(db, user_id, data.device_id, org_id, role, pending, now)
+    outcomes = {op.op_id: state.apply(op) for op in pending}
+    skipped = await _write_push(db, state)
+    applied: dict[str, SyncOpResult] = {}
+    log_rows = []
+    for op in pending:
+        status, entity_id, details = outcomes[op.op_id]
+        if _response_of(op) in skipped:
+            status, details = SyncStatus.CONFLICT, {"reason": "response_id_taken"}
+        applied[op.op_id] = SyncOpResult(
+            op_id=op.op_id, status=status, entity_id=entity_id, conflict_details=details
+        )
+        log_rows.append({
+            "user_id": user_id,
+            "device_id": data.device_id,
+            "client_op_id": op.op_id,
+            "entity_type": op.entity_type,
+            "entity_id": entity_id,
+            "operation": op.operation,
+            "sync_status": status,
+            "client_timestamp": op.client_timestamp,
+            "server_timestamp": now,
+            "payload": op.data.model_dump(mode="json"),
+            "conflict_details": details,
+            "created_at": now,
+        })
+    if log_rows:
+        await db.execute(insert(SyncLog), log_rows)
+
+    results = []
+    returned = set()
+    for op in data.operations:
+        result = logged.get(op.op_id) or applied[op.op_id]
+        if op.op_id in returned:
+            # A repeated op id within the batch only ran the first time
+            result = result.model_copy(update={"duplicate": True})
+        returned.add(op.op_id)
+        results.append(result)
+    return SyncPushResult(results=results, server_timestamp=now)
+
+
+# ─── Pull ─────────────────────────────────────────────────────────
+
+@dataclasses.dataclass(frozen=True)
+class _Scope:
+    org_id: uuid.UUID
+    user_id: uuid.UUID
+    accessible: NodeSet | None
+    since: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _Feed:
+    """One kind of row in a pull, read in (change_xid, id) order from ``query``."""
+
+    field: str
+    entity_type: str
+    model: type
+    schema: type[BaseModel] | None  # None for the tombstone feed
+    query: Callable[[_Scope], Select]
+
+
+def _changed_forms(scope: _Scope) -> tuple[ColumnElement[bool], ...]:
+    # Drafts are never sent, but a deactivated form may be one the device holds, so it
+    # goes out as a tombstone whether or not it is still marked published
+    return (
+        Form.organization_id == scope.org_id,
+        or_(Form.is_published == True, Form.is_active == False),  # noqa: E712
+        Form.change_xid >= scope.since,
+    )
+
+
+def _definition(scope: _Scope) -> tuple[ColumnElement[bool], ...]:
+    # Writes to a form's sections, questions and assignments always re-stamp the form
+    # (forms.service._form_changed), so unchanged forms rule out their children
+    return (
+        Form.organization_id == scope.org_id,
+        Form.is_published == True,  # noqa: E712
+        Form.is_active == True,  # noqa: E712
+        Form.change_xid >= scope.since,
+    )
+
+
+def _own_responses(scope: _Scope) -> tuple[ColumnElement[bool], ...]:
+    return (
+        Response.respondent_id == scope.user_id,
+        Form.organization_id == scope.org_id,
+        Response.change_xid >= scope.since,
+    )
+
+
+_FEEDS = (
+    _Feed("nodes", "node", Node, NodeResponse, lambda s: select(Node).where(
+        Node.organization_id == s.org_id,
+        Node.change_xid >= s.since,
+        node_filter(Node.id, s.accessible),
+    )),
+    _Feed("forms", "form", Form, FormResponse, lambda s: select(Form).where(
+        *_changed_forms(s)
+    )),
+    _Feed("sections", "section", Section, SectionChange, lambda s: (
+        select(Section)
+        .join(Form, Form.id == Section.form_id)
+        .where(*_definition(s), Section.change_xid >= s.since)
+    )),
+    _Feed("questions", "question", Question, QuestionResponse, lambda s: (
+        select(Question)
+        .join(Section, Section.id == Question.section_id)
+        .join(Form, Form.id == Section.form_id)
+        .where(*_definition(s), Question.change_xid >= s.since)
+    )),
+    _Feed("assignments", "assignment", FormNodeAssignment, AssignmentChange, lambda s: (
+        select(FormNodeAssignment)
+        .join(Form, Form.id == FormNodeAssignment.form_id)
+        .where(
+            *_definition(s),
+            FormNodeAssignment.change_xid >= s.since,
+            node_filter(FormNodeAssignment.node_id, s.accessible),
+        )
+    )),
+    _Feed("responses", "response", Response, ResponseResponse, lambda s: (
+        select(Response)
+        .join(Form, Form.id == Response.form_id)
+        .where(*_own_responses(s))
+    )),
+    # Writing an answer re-stamps its response (a trigger), so unchanged responses rule it out
+    _Feed("answers", "answer", Answer, AnswerResponse, lambda s: (
+        select(Answer)
+        .join(Response, Response.id == Answer.response_id)
+        .join(Form, Form.id == Response.form_id)
+        .where(*_own_responses(s), Answer.change_xid >= s.since)
+    )),
+    _Feed("deleted", "", SyncTombstone, None, lambda s: select(SyncTombstone).where(
+        SyncTombstone.organization_id == s.org_id,
+        SyncTombstone.change_xid >= s.since,
+        or_(SyncTombstone.user_id.is_(None), SyncTombstone.user_id == s.user_id),
+    )),
+)
+
+# Cursor: (watermark, since, scope, feed index, change_xid, id); the columns only lend
+# their types
+_CURSOR_KEYS = (
+    SyncTombstone.change_xid,
+    SyncTombstone.change_xid,
+    SyncTombstone.entity_type,
+    SyncTombstone.change_xid,
+    SyncTombstone.change_xid,
+    SyncTombstone.id,
+)
+_FEED_START = (-1, uuid.UUID(int=0))
+
+
+def _xid(expr: ColumnElement) -> ColumnElement[int]:
+    """An ``xid8`` as the bigint ``change_xid`` columns hold."""
+    return cast(cast(expr, Text), BigInteger)
+
+
+async def pull(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    org_id: uuid.UUID,
+    accessible: NodeSet | None,
+    since: int,
+    limit: int,
+    cursor: str | None = None,
+    scope: str | None = None,
+) -> SyncPullResult:
+    """Rows changed since the watermark ``since``, up to ``limit`` per page.
+
+    A row's ``change_xid`` is the id of the transaction that last wrote it. The
+    watermark is the oldest transaction still running when the pull started:
+    everything older has committed and is visible to this pull. Rows from newer
+    transactions may or may not be included now, and are included again by the
+    next pull. Devices apply rows idempotently, so a repeat is harmless, and no
+    commit is ever missed, whatever order transactions commit in.
+
+    Each page continues the same pull at the same watermark. The device stores
+    the watermark only after the last page, when ``next_cursor`` is None.
+    Deactivated rows and hard-deleted ones come back as tombstones in ``deleted``.
+
+    Rows don't change when a node enters or leaves the user's accessible set, so
+    the device also stores ``scope``, a fingerprint of that set, and passes it
+    back. If it no longer matches (or is missing), the pull starts from
+    ``since`` 0 with ``reset`` set: the device drops what it holds and applies
+    this pull in its place. Pages after the first take ``since`` and ``scope``
+    from the cursor; if access changes mid-pull, the scope returned is still the
+    one the pull started under, so the next pull resets.
+    """
+    reset = False
+    if cursor:
+        watermark, since, scope, start, *after = decode_cursor(cursor, _CURSOR_KEYS)
+        if not 0 <= start < len(_FEEDS):
+            raise BadRequestError("Invalid cursor")
+    else:
+        result = await db.execute(
+            select(_xid(func.pg_snapshot_xmin(func.pg_current_snapshot())))
+        )
+        watermark, start, after = result.scalar_one(), 0, _FEED_START
+        current = scope_key(accessible)
+        if since and scope != current:
+            since, reset = 0, True
+        scope = current
+
+    feed_scope = _Scope(org_id, user_id, accessible, since)
+    page = SyncPullResult(watermark=watermark, scope=scope, reset=reset)
+    remaining = limit
+    for index in range(start, len(_FEEDS)):
+        feed = _FEEDS[index]
+        keys = (feed.model.change_xid, feed.model.id)
+        query = (
+            feed.query(feed_scope)
+            .where(tuple_(*keys) > tuple_(*after, types=[key.type for key in keys]))
+            .order_by(*keys)
+            .limit(remaining + 1)
+        )
+        rows = (await db.execute(query)).scalars().all()
+        more = len(rows) > remaining
+        rows = rows[:remaining]
+        for row in rows:
+            if feed.schema is None:
+                page.deleted.append(Tombstone(entity_type=row.entity_type, entity_id=row.entity_id))
+            elif getattr(row, "is_active", True):
+                getattr(page, feed.field).append(feed.schema.model_validate(row))
+            else:
+                page.deleted.append(Tombstone(entity_type=feed.entity_type, entity_id=row.id))
+        remaining -= len(rows)
+        after = _FEED_START
+
+        if more:
+            last = rows[-1]
+            page.next_cursor = encode_cursor(
+                [watermark, since, scope, index, last.change_xid, last.id]
+            )
+            break
+        if remaining == 0 and index + 1 < len(_FEEDS):
+            page.next_cursor = encode_cursor([watermark, since, scope, index + 1, *_FEED_START])
+            break
+    return page
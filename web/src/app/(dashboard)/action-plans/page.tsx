@@ -159,7 +159,7 @@ export default function ActionPlansPage() {
                 </TableBody>
               </Table>
 
-              {data && data.pages > 1 && (
+              {data && data.total_pages > 1 && (
                 <div className="flex items-center justify-center gap-2 mt-4">
                   <Button
                     variant="outline"
@@ -170,12 +170,12 @@ export default function ActionPlansPage() {
                     Previous
                   </Button>
                   <span className="text-sm text-muted-foreground">
-                    Page {page} of {data.pages}
+                    Page {page} of {data.total_pages}
                   </span>
                   <Button
                     variant="outline"
                     size="sm"
-                    disabled={page >= data.pages}
+                    disabled={page >= data.total_pages}
                     onClick={() => setPage((p) => p + 1)}
                   >
                     Next
@@ -18,6 +18,7 @@ import {
   useDeleteQuestion,
   useUpdateForm,
   usePublishForm,
+  useApplyOperations,
 } from "@/hooks/use-forms";
 import type { Question, QuestionType, Section } from "@/lib/types";
 import {
@@ -62,6 +63,7 @@ export default function FormBuilderPage({ params }: { params: Promise<{ id: stri
   const createQuestion = useCreateQuestion();
   const updateQuestionMutation = useUpdateQuestion();
   const deleteQuestionMutation = useDeleteQuestion();
+  const applyOperations = useApplyOperations();
 
   const sensors = useSensors(
     useSensor(PointerSensor, { activationConstraint: { distance: 5 } }),
@@ -157,7 +159,28 @@ export default function FormBuilderPage({ params }: { params: Promise<{ id: stri
   };
 
   const handleDragEnd = (event: DragEndEvent) => {
-    // TODO: implement reorder via API
+    const { active, over } = event;
+    if (!over || active.id === over.id) return;
+    const ids = store.sections.map((s) => s.id);
+    const from = ids.indexOf(String(active.id));
+    const to = ids.indexOf(String(over.id));
+    if (from < 0 || to < 0) return;
+
+    store.reorderSections(from, to);
+    const ordered = useFormBuilderStore.getState().sections;
+    applyOperations.mutate(
+      {
+        formId,
+        operations: [
+          {
+            op: "reorder_sections",
+            items: ordered.map((s, index) => ({ id: s.id, sort_order: index })),
+            dense: true,
+          },
+        ],
+      },
+      { onError: (err) => toast.error(err.message) },
+    );
   };
 
   if (!form) {
@@ -17,7 +17,7 @@ import {
 import { TreeView } from "@/components/hierarchy/tree-view";
 import { NodeDialog } from "@/components/hierarchy/node-dialog";
 import {
-  useHierarchy,
+  useRootNodes,
   useNodeTypes,
   useCreateNode,
   useUpdateNode,
@@ -27,7 +27,7 @@ import type { HierarchyNode } from "@/lib/types";
 import { toast } from "sonner";
 
 export default function HierarchyPage() {
-  const { data: nodes = [], isLoading } = useHierarchy();
+  const { data: nodes = [], isLoading } = useRootNodes();
   const { data: nodeTypes = [] } = useNodeTypes();
 
   const createNode = useCreateNode();
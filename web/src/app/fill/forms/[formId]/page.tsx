@@ -7,7 +7,7 @@ import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { MobileHeader } from "@/components/fill/mobile-header";
 import { useFormWithSections, useFormSections, useCreateResponse } from "@/hooks/use-fill";
-import { useHierarchy } from "@/hooks/use-hierarchy";
+import { useRootNodes } from "@/hooks/use-hierarchy";
 import { toast } from "sonner";
 
 export default function StartFormPage({
@@ -19,7 +19,7 @@ export default function StartFormPage({
   const router = useRouter();
   const { data: form, isLoading } = useFormWithSections(formId);
   const { data: sections } = useFormSections(formId);
-  const { data: nodes } = useHierarchy();
+  const { data: nodes } = useRootNodes();
   const createResponse = useCreateResponse();
 
   const totalQuestions = (sections ?? []).reduce(
@@ -7,7 +7,7 @@ import { Button } from "@/components/ui/button";
 import { MobileHeader } from "@/components/fill/mobile-header";
 import { SectionProgress } from "@/components/fill/section-progress";
 import { QuestionCard } from "@/components/fill/question-card";
-import { useFormWithSections, useFormSections, useUpsertAnswers, useResponseDetail } from "@/hooks/use-fill";
+import { useResponseForm, useUpsertAnswers, useResponseDetail } from "@/hooks/use-fill";
 import { useFormFillerStore } from "@/stores/form-filler-store";
 import { toast } from "sonner";
 
@@ -19,8 +19,8 @@ export default function FillFormPage({
   const { formId, responseId } = use(params);
   const router = useRouter();
 
-  const { data: form } = useFormWithSections(formId);
-  const { data: sections } = useFormSections(formId);
+  const { data: form } = useResponseForm(responseId);
+  const sections = form?.sections;
   const { data: responseDetail } = useResponseDetail(responseId);
 
   const store = useFormFillerStore();
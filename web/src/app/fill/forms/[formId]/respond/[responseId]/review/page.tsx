@@ -6,7 +6,7 @@ import { Send, ArrowLeft } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { MobileHeader } from "@/components/fill/mobile-header";
 import { ReviewSummary } from "@/components/fill/review-summary";
-import { useFormWithSections, useUpsertAnswers, useSubmitResponse } from "@/hooks/use-fill";
+import { useResponseForm, useUpsertAnswers, useSubmitResponse } from "@/hooks/use-fill";
 import { useFormFillerStore } from "@/stores/form-filler-store";
 import { toast } from "sonner";
 
@@ -15,10 +15,10 @@ export default function ReviewPage({
 }: {
   params: Promise<{ formId: string; responseId: string }>;
 }) {
-  const { formId, responseId } = use(params);
+  const { responseId } = use(params);
   const router = useRouter();
 
-  const { data: form } = useFormWithSections(formId);
+  const { data: form } = useResponseForm(responseId);
   const store = useFormFillerStore();
   const upsertAnswers = useUpsertAnswers();
   const submitResponse = useSubmitResponse();
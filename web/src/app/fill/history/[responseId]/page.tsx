@@ -3,7 +3,7 @@
 import { use } from "react";
 import { Badge } from "@/components/ui/badge";
 import { MobileHeader } from "@/components/fill/mobile-header";
-import { useResponseDetail, useFormSections } from "@/hooks/use-fill";
+import { useResponseDetail, useResponseForm } from "@/hooks/use-fill";
 import type { Question, Answer } from "@/lib/types";
 
 function formatAnswerValue(answer: Answer, question?: Question): string {
@@ -55,7 +55,8 @@ export default function ResponseDetailPage({
 }) {
   const { responseId } = use(params);
   const { data: response, isLoading } = useResponseDetail(responseId);
-  const { data: sections } = useFormSections(response?.form_id ?? null);
+  const { data: form } = useResponseForm(response ? responseId : null);
+  const sections = form?.sections;
 
   if (isLoading || !response) {
     return (
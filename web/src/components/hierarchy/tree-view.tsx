@@ -16,6 +16,7 @@ import {
   CollapsibleTrigger,
 } from "@/components/ui/collapsible";
 import { Badge } from "@/components/ui/badge";
+import { useNodeChildren } from "@/hooks/use-hierarchy";
 import type { HierarchyNode } from "@/lib/types";
 
 interface TreeViewProps {
@@ -68,8 +69,10 @@ function TreeNode({
   onEdit: (node: HierarchyNode) => void;
   onDelete: (node: HierarchyNode) => void;
 }) {
-  const [open, setOpen] = useState(true);
-  const hasChildren = node.children && node.children.length > 0;
+  const [open, setOpen] = useState(false);
+  const hasChildren = node.has_children;
+  // Children are fetched the first time the node is expanded
+  const { data: children = [], isLoading } = useNodeChildren(node.id, open && hasChildren);
 
   return (
     <Collapsible open={open} onOpenChange={setOpen}>
@@ -90,6 +93,10 @@ function TreeNode({
 
         <span className="flex-1 text-sm font-medium">{node.name}</span>
 
+        {hasChildren && (
+          <span className="text-xs text-muted-foreground shrink-0">{node.descendant_count}</span>
+        )}
+
         <Badge variant="secondary" className="text-xs shrink-0">
           {node.node_type}
         </Badge>
@@ -127,7 +134,8 @@ function TreeNode({
 
       {hasChildren && (
         <CollapsibleContent className="ml-6 border-l pl-2">
-          {node.children!.map((child) => (
+          {isLoading && <p className="px-2 py-1.5 text-xs text-muted-foreground">Loading...</p>}
+          {children.map((child) => (
             <TreeNode
               key={child.id}
               node={child}
@@ -12,7 +12,7 @@ export function useActionPlans(page = 1, perPage = 20) {
     queryKey: ["action-plans", orgId, page, perPage],
     queryFn: () =>
       api.get<PagedResponse<ActionPlan>>(
-        `/organizations/${orgId}/action-plans?page=${page}&per_page=${perPage}`,
+        `/organizations/${orgId}/action-plans?page=${page}&page_size=${perPage}`,
       ),
     enabled: !!orgId,
   });
@@ -3,7 +3,21 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import { useAuthStore } from "@/stores/auth-store";
-import type { Form, FormResponse, Answer, Section } from "@/lib/types";
+import type { Form, FormResponse, Answer, AnswerUpsertResult, Section, CursorPage } from "@/lib/types";
+
+// Follows next_cursor until the last page; `path` must already have a query string
+async function getAllPages<T>(path: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const page: CursorPage<T> = await api.get<CursorPage<T>>(
+      cursor ? `${path}&cursor=${encodeURIComponent(cursor)}` : path,
+    );
+    items.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor);
+  return items;
+}
 
 // ─── Forms ───────────────────────────────────────────────
 
@@ -12,9 +26,17 @@ export function usePublishedForms() {
 
   return useQuery({
     queryKey: ["published-forms", orgId],
-    queryFn: () => api.get<Form[]>(`/organizations/${orgId}/forms`),
+    queryFn: () =>
+      getAllPages<Form>(`/organizations/${orgId}/forms?is_published=true&limit=200`),
     enabled: !!orgId,
-    select: (forms) => forms.filter((f) => f.is_published),
+  });
+}
+
+export function useNodeForms(nodeId: string | null) {
+  return useQuery({
+    queryKey: ["node-forms", nodeId],
+    queryFn: () => api.get<Form[]>(`/nodes/${nodeId}/forms`),
+    enabled: !!nodeId,
   });
 }
 
@@ -62,8 +84,9 @@ export function useUpsertAnswers() {
         value: Record<string, unknown> | null;
         comment?: string | null;
         client_created_at: string;
+        base_revision?: number;
       }[];
-    }) => api.put<Answer[]>(`/responses/${responseId}/answers`, answers),
+    }) => api.put<AnswerUpsertResult[]>(`/responses/${responseId}/answers`, answers),
   });
 }
 
@@ -89,6 +112,16 @@ export function useResponseDetail(responseId: string | null) {
   });
 }
 
+// The published definition a response was filled against
+export function useResponseForm(responseId: string | null) {
+  return useQuery({
+    queryKey: ["response-form", responseId],
+    queryFn: () => api.get<Form>(`/responses/${responseId}/form`),
+    enabled: !!responseId,
+    staleTime: Infinity,
+  });
+}
+
 // ─── History ─────────────────────────────────────────────
 
 export function useMyResponses() {
@@ -98,8 +131,8 @@ export function useMyResponses() {
   return useQuery({
     queryKey: ["my-responses", orgId, userId],
     queryFn: () =>
-      api.get<FormResponse[]>(
-        `/organizations/${orgId}/responses?respondent_id=${userId}`,
+      getAllPages<FormResponse>(
+        `/organizations/${orgId}/responses?respondent_id=${userId}&limit=200`,
       ),
     enabled: !!orgId && !!userId,
   });
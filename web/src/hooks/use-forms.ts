@@ -3,19 +3,24 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import { useAuthStore } from "@/stores/auth-store";
-import type { Form, Section, Question, PagedResponse } from "@/lib/types";
+import type {
+  BuilderOperation,
+  BuilderOperationsResult,
+  Form,
+  Section,
+  Question,
+  PagedResponse,
+} from "@/lib/types";
 
 export function useForms(page = 1, perPage = 20) {
   const orgId = useAuthStore((s) => s.currentOrgId);
 
   return useQuery({
     queryKey: ["forms", orgId, page, perPage],
-    queryFn: async () => {
-      const forms = await api.get<Form[]>(
-        `/organizations/${orgId}/forms?page=${page}&per_page=${perPage}`,
-      );
-      return { items: forms, total: forms.length, page, per_page: perPage, pages: 1 } as PagedResponse<Form>;
-    },
+    queryFn: () =>
+      api.get<PagedResponse<Form>>(
+        `/organizations/${orgId}/forms?page=${page}&page_size=${perPage}`,
+      ),
     enabled: !!orgId,
   });
 }
@@ -182,3 +187,15 @@ export function useDeleteQuestion() {
     onSuccess: (_, vars) => qc.invalidateQueries({ queryKey: ["sections", vars.formId] }),
   });
 }
+
+// ─── Batched Operations ──────────────────────────────────
+
+export function useApplyOperations() {
+  const qc = useQueryClient();
+
+  return useMutation({
+    mutationFn: ({ formId, operations }: { formId: string; operations: BuilderOperation[] }) =>
+      api.post<BuilderOperationsResult>(`/forms/${formId}/operations`, { operations }),
+    onSuccess: (result, vars) => qc.setQueryData(["sections", vars.formId], result.sections),
+  });
+}
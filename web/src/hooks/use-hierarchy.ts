@@ -1,9 +1,9 @@
 "use client";
 
-import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
+import { useQuery, useMutation, useQueryClient, keepPreviousData } from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import { useAuthStore } from "@/stores/auth-store";
-import type { HierarchyNode, NodeType } from "@/lib/types";
+import type { HierarchyNode, NodeSearchResult, NodeType } from "@/lib/types";
 
 function buildTree(flatNodes: HierarchyNode[]): HierarchyNode[] {
   const map = new Map<string, HierarchyNode>();
@@ -35,6 +35,41 @@ export function useHierarchy() {
   });
 }
 
+export function useRootNodes() {
+  const orgId = useAuthStore((s) => s.currentOrgId);
+
+  return useQuery({
+    queryKey: ["hierarchy", orgId, "roots"],
+    queryFn: () => api.get<HierarchyNode[]>(`/organizations/${orgId}/hierarchy?depth=1`),
+    enabled: !!orgId,
+  });
+}
+
+export function useNodeChildren(nodeId: string, enabled = true) {
+  const orgId = useAuthStore((s) => s.currentOrgId);
+
+  return useQuery({
+    queryKey: ["hierarchy", orgId, "children", nodeId],
+    queryFn: () => api.get<HierarchyNode[]>(`/nodes/${nodeId}/children`),
+    enabled: enabled && !!orgId,
+  });
+}
+
+export function useNodeSearch(query: string) {
+  const orgId = useAuthStore((s) => s.currentOrgId);
+  const q = query.trim();
+
+  return useQuery({
+    queryKey: ["node-search", orgId, q],
+    queryFn: () =>
+      api.get<NodeSearchResult[]>(
+        `/organizations/${orgId}/nodes/search?q=${encodeURIComponent(q)}&limit=30`,
+      ),
+    enabled: !!orgId && q.length > 0,
+    placeholderData: keepPreviousData,
+  });
+}
+
 export function useNodeTypes() {
   const orgId = useAuthStore((s) => s.currentOrgId);
 
@@ -10,18 +10,16 @@ export function useResponses(page = 1, perPage = 20, formId?: string) {
 
   const params = new URLSearchParams({
     page: String(page),
-    per_page: String(perPage),
+    page_size: String(perPage),
   });
   if (formId) params.set("form_id", formId);
 
   return useQuery({
     queryKey: ["responses", orgId, page, perPage, formId],
-    queryFn: async () => {
-      const responses = await api.get<FormResponse[]>(
+    queryFn: () =>
+      api.get<PagedResponse<FormResponse>>(
         `/organizations/${orgId}/responses?${params}`,
-      );
-      return { items: responses, total: responses.length, page, per_page: perPage, pages: 1 } as PagedResponse<FormResponse>;
-    },
+      ),
     enabled: !!orgId,
   });
 }
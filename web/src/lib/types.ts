@@ -88,11 +88,18 @@ export interface HierarchyNode {
   depth: number;
   sort_order: number;
   is_active: boolean;
+  descendant_count: number;
+  has_children: boolean;
   created_at: string;
   updated_at: string;
   children?: HierarchyNode[];
 }
 
+export interface NodeSearchResult extends HierarchyNode {
+  breadcrumb: { id: string; name: string }[];
+  rank: number;
+}
+
 export interface Member {
   id: string;
   user_id: string;
@@ -153,9 +160,33 @@ export interface Question {
   updated_at: string;
 }
 
+// Builder operations reference sections and questions by id, or by the temp_id of one
+// created earlier in the same batch
+export interface BuilderReorderItem {
+  id: string;
+  sort_order: number;
+}
+
+export type BuilderOperation =
+  | { op: "create_section"; temp_id: string; data: { title: string; description?: string | null; sort_order?: number } }
+  | { op: "update_section"; id: string; data: Partial<Pick<Section, "title" | "description" | "sort_order">> }
+  | { op: "delete_section"; id: string }
+  | { op: "reorder_sections"; items: BuilderReorderItem[]; dense?: boolean }
+  | { op: "create_question"; temp_id: string; section_id: string; data: Partial<Question> & { question_type: QuestionType; text: string } }
+  | { op: "update_question"; id: string; data: Partial<Question> }
+  | { op: "delete_question"; id: string }
+  | { op: "reorder_questions"; section_id: string; items: BuilderReorderItem[]; dense?: boolean };
+
+export interface BuilderOperationsResult {
+  id_map: Record<string, string>;
+  sections: Section[];
+  reevaluating: string[];
+}
+
 export interface FormResponse {
   id: string;
   form_id: string;
+  form_version: number | null;
   node_id: string;
   respondent_id: string;
   parent_response_id: string | null;
@@ -182,10 +213,18 @@ export interface Answer {
   comment: string | null;
   conformity_status: ConformityStatus | null;
   answered_at: string | null;
+  revision: number;
   question_text?: string;
   question_type?: QuestionType;
 }
 
+export interface AnswerUpsertResult {
+  question_id: string;
+  status: "upserted" | "resolved" | "unknown_question";
+  answer: Answer | null;
+  conflict_details: Record<string, unknown> | null;
+}
+
 export interface ActionPlan {
   id: string;
   answer_id: string;
@@ -221,8 +260,16 @@ export interface PagedResponse<T> {
   items: T[];
   total: number;
   page: number;
-  per_page: number;
-  pages: number;
+  page_size: number;
+  total_pages: number;
+}
+
+export interface CursorPage<T> {
+  items: T[];
+  limit: number;
+  next_cursor: string | null;
+  total: number | null;
+  total_is_lower_bound: boolean;
 }
 
 export interface TokenResponse {